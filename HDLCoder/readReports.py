@@ -1,25 +1,44 @@
+"""
+Read Vitis implementation/latency reports for one HDLCoder variant.
+
+The reports HDL Coder generates in codegen/<design>/hdlsrc (post-synthesis
+and resource reports, xsim log, Vitis HLS synthesis log; see
+HLS/hdlcoderReports.py) are parsed as well and fill in whatever the Vitis
+project reports do not cover, so the HDL workflow needs no Vitis project.
+Routed Vivado timing reports (impl/verilog/report) add WNS/TNS and the
+critical path (HLS/vivadoTiming.py).
+
+Usage:
+    python readReports.py [--base-dir DIR] [--summary-only | --plots] [--timings]
+                          [--history DB | --no-history]
+
+Each run is appended to the QoR history (HLS/qorHistory.py) unless --no-history.
+"""
+
+import argparse
 import os
 import glob
 import re
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 from pathlib import Path
 import datetime  # Add this import for timestamping reports
+import sys
 
-def parse_latency_report(report_file):
-    """Parse latency report file and extract total execution time."""
-    try:
-        with open(report_file, 'r') as f:
-            content = f.read()
-            # Find the TOTAL_EXECUTE_TIME value
-            # import re
-            match = re.search(r'\$TOTAL_EXECUTE_TIME = "(\d+)"', content)
-            if match:
-                return int(match.group(1))
-    except Exception as e:
-        print(f"Error parsing latency report {report_file}: {e}")
-    return None
+# Shared report tooling lives next to HLS/analyzeReports.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'HLS'))
+from reportCache import ReportCache, cached_parse
+from resultsStore import build_results, save_results
+from latencyReport import HEADLINE_METRIC, format_latency_summary, parse_latency_report
+from qorHistory import DEFAULT_HISTORY_FILE, record_results
+from vivadoTiming import TIMING_REPORT_RE, format_critical_path, merge_timing_closure, parse_timing_report
+from hdlcoderReports import artifact_kind, combine_artifacts, parse_hdl_artifact
+from lazyImports import lazy_module, report_timings, timed_import, timed_stage
+
+# pandas/matplotlib are only imported by the code paths that use them
+pd = lazy_module('pandas')
+plt = lazy_module('matplotlib.pyplot')
+
+# Bump when a parser's output changes so stale cache entries are ignored
+PARSER_VERSION = 3
 
 def find_latency_reports(base_dir):
     """Find all latency report files recursively."""
@@ -37,8 +56,10 @@ def compare_latency(reports_data):
         return
 
     plt.figure(figsize=(10, 6))
-    implementations = list(reports_data.keys())
-    latencies = list(reports_data.values())
+    headline = {impl: latency.get(HEADLINE_METRIC) for impl, latency in reports_data.items()
+                if latency.get(HEADLINE_METRIC) is not None}
+    implementations = list(headline.keys())
+    latencies = list(headline.values())
     
     bars = plt.bar(implementations, latencies, color='purple', alpha=0.6)
     plt.title('Latency Comparison')
@@ -77,6 +98,21 @@ def find_impl_reports(base_dir):
             
     return reports
 
+def find_timing_reports(base_dir):
+    """Find the routed Vivado timing reports (impl/verilog/report) recursively."""
+    pattern = os.path.join(base_dir, '**/impl/verilog/report/*.rpt')
+    reports = sorted(path for path in glob.glob(pattern, recursive=True)
+                     if TIMING_REPORT_RE.match(os.path.basename(path)))
+    print(f"Found {len(reports)} Vivado timing reports")
+    return reports
+
+def find_hdl_artifacts(base_dir):
+    """Find the HDL Coder reports in <base_dir>/codegen/<design>/hdlsrc."""
+    pattern = os.path.join(base_dir, 'codegen', '*', 'hdlsrc', '*')
+    artifacts = sorted(path for path in glob.glob(pattern) if artifact_kind(os.path.basename(path)))
+    print(f"Found {len(artifacts)} HDL Coder artifacts")
+    return artifacts
+
 def parse_impl_report(report_file):
     """Parses the Vivado Place & Route report file."""
     resource_summary = {}
@@ -103,7 +139,7 @@ def parse_impl_report(report_file):
                 resource_summary[name] = int(match.group(1))
 
     # Extract Timing Summary
-    timing_section = re.search(r'== Place & Route Timing Summary.*?\| Target\s*\|\s*[\d.]+\s*\|(.*?)\+\-', content, re.DOTALL)
+    timing_section = re.search(r'== Place & Route Timing Summary.*?(\| Target\s*\|.*?)\n\+-', content, re.DOTALL)
     if timing_section:
         timing_text = timing_section.group(1)
         timing_pairs = [
@@ -112,7 +148,7 @@ def parse_impl_report(report_file):
             ('Post-Route', r'\| Post-Route\s*\|\s*([\d.]+)\s*\|')
         ]
         for name, pattern in timing_pairs:
-            match = re.search(pattern, content)
+            match = re.search(pattern, timing_text)
             if match:
                 timing_summary[name] = float(match.group(1))
 
@@ -268,8 +304,7 @@ def save_report_to_txt(resources, timing, latency, base_dir, output_file="implem
         if latency:
             f.write("LATENCY SUMMARY (cycles):\n")
             f.write("------------------------\n")
-            df_latency = pd.Series(latency, name='Latency')
-            f.write(df_latency.to_string())
+            f.write(format_latency_summary(latency))
             f.write("\n\n")
         
         # Write a summary of the report
@@ -279,43 +314,106 @@ def save_report_to_txt(resources, timing, latency, base_dir, output_file="implem
     
     print(f"Report data saved to '{output_file}'")
 
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Read Vitis reports of an HDLCoder variant')
+    parser.add_argument('--base-dir', default="/home/jielei/Projects/UTS/peakPicker/HDLCoder/opt4_HLS",
+                        help='HDLCoder variant directory to analyze')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--summary-only', action='store_true',
+                      help='Only write the TXT report and results store (matplotlib is never imported)')
+    mode.add_argument('--plots', action='store_true',
+                      help='Write the report and render the comparison plots (default)')
+    parser.add_argument('--history', default=DEFAULT_HISTORY_FILE,
+                        help=f'QoR history database each run is appended to (default: {DEFAULT_HISTORY_FILE})')
+    parser.add_argument('--no-history', action='store_true', help='Do not record this run in the QoR history')
+    parser.add_argument('--timings', action='store_true', help='Print lazy-import and stage timings')
+    return parser.parse_args()
+
 def main():
+    args = parse_arguments()
+
     # Set the base directory to the specific path
-    base_dir = "/home/jielei/Projects/UTS/peakPicker/HDLCoder/opt4_HLS"
+    base_dir = args.base_dir
     print(f"Analyzing reports in: {base_dir}")
     
     # Find all reports
-    impl_reports = find_impl_reports(base_dir)
-    latency_reports = find_latency_reports(base_dir)
+    with timed_stage('scan'):
+        impl_reports = find_impl_reports(base_dir)
+        latency_reports = find_latency_reports(base_dir)
+        timing_reports = find_timing_reports(base_dir)
+        hdl_artifacts = find_hdl_artifacts(base_dir)
     
-    if not impl_reports:
+    if not impl_reports and not hdl_artifacts:
         print("No implementation reports found!")
         return
 
     all_resources = {}
     all_timing = {}
     all_latency = {}
+    all_closure = {}
+    parts = {}
 
-    # Process implementation reports
-    for report_file in impl_reports:
-        impl_name = extract_impl_name(report_file)
-        print(f"Processing implementation: {impl_name}")
-        resource_data, timing_data = parse_impl_report(report_file)
-        all_resources[impl_name] = resource_data
-        all_timing[impl_name] = timing_data
-
-    # Process latency reports
-    for report_file in latency_reports:
-        impl_name = extract_impl_name(report_file)
-        latency = parse_latency_report(report_file)
-        if latency is not None:
-            all_latency[impl_name] = latency
+    with timed_stage('parse'), ReportCache() as cache:
+        cache.evict_stale()
 
-    if all_resources and all_timing:
-        compare_resources(all_resources)
-        compare_timing(all_timing)
-        create_timing_resource_plot(all_resources, all_timing)
+        # Process implementation reports
+        for report_file in impl_reports:
+            impl_name = extract_impl_name(report_file)
+            print(f"Processing implementation: {impl_name}")
+            resource_data, timing_data = cached_parse(
+                cache, f"readReports/impl/v{PARSER_VERSION}", parse_impl_report, report_file)
+            all_resources[impl_name] = resource_data
+            all_timing[impl_name] = timing_data
+
+        # Process latency reports
+        for report_file in latency_reports:
+            impl_name = extract_impl_name(report_file)
+            latency = cached_parse(
+                cache, f"readReports/latency/v{PARSER_VERSION}", parse_latency_report, report_file)
+            if latency is not None:
+                all_latency[impl_name] = latency
+
+        # Vivado timing closure: WNS/TNS and the worst setup path per implementation
+        timing_records = {}
+        for report_file in timing_reports:
+            timing_records.setdefault(extract_impl_name(report_file), []).append(cached_parse(
+                cache, f"readReports/timing/v{PARSER_VERSION}", parse_timing_report, report_file))
+        for impl_name, records in timing_records.items():
+            all_closure[impl_name] = merge_timing_closure(records)
+
+        # HDL Coder artifacts: the Vitis project's own reports take precedence
+        if hdl_artifacts:
+            hdl = combine_artifacts([
+                cached_parse(cache, f"readReports/hdlsrc/v{PARSER_VERSION}", parse_hdl_artifact, report_file)
+                for report_file in hdl_artifacts])
+            impl_names = set(all_resources) | set(all_timing) | set(all_latency) | set(all_closure)
+            impl_name = impl_names.pop() if len(impl_names) == 1 else os.path.basename(os.path.normpath(base_dir))
+            print(f"Processing HDL Coder artifacts: {impl_name}")
+            if hdl['resources']:
+                all_resources[impl_name] = {**hdl['resources'], **all_resources.get(impl_name, {})}
+            if hdl['timing']:
+                all_timing[impl_name] = {**hdl['timing'], **all_timing.get(impl_name, {})}
+            if hdl['latency'] and impl_name not in all_latency:
+                all_latency[impl_name] = hdl['latency']
+            if hdl['part']:
+                parts[impl_name] = hdl['part']
+
+        print(cache.summary())
+
+    # Create visualizations
+    if not args.summary_only:
+        with timed_stage('plots'):
+            # Agg backend first; pandas plotting imports pyplot on its own
+            timed_import('matplotlib.pyplot')
+            if all_resources and all_timing:
+                compare_resources(all_resources)
+                compare_timing(all_timing)
+                create_timing_resource_plot(all_resources, all_timing)
+            if all_latency:
+                compare_latency(all_latency)
 
+    if all_resources and all_timing:
         print("\nResource Utilization Summary:")
         df_resources = pd.DataFrame(all_resources)
         print(df_resources.round(2))
@@ -325,18 +423,45 @@ def main():
                                 for impl, timing in all_timing.items()})
         print(df_timing.round(3))
 
+    for impl_name, closure in all_closure.items():
+        if closure and 'Data Path Delay' in closure:
+            print(f"\nCritical path of {impl_name} (WNS {closure.get('WNS', float('nan')):.3f} ns, "
+                  f"TNS {closure.get('TNS', float('nan')):.3f} ns):\n  {format_critical_path(closure)}")
+
     if all_latency:
-        compare_latency(all_latency)
         print("\nLatency Summary (cycles):")
-        df_latency = pd.Series(all_latency, name='Latency')
-        print(df_latency)
+        print(format_latency_summary(all_latency))
     else:
         print("No latency data was collected from the reports.")
     
+    with timed_stage('summary'):
+        results = _save_outputs(all_resources, all_timing, all_latency, base_dir, parts, all_closure)
+        if not args.no_history:
+            record_results(results, 'readReports', base_dir, args.history)
+
+    if args.timings:
+        report_timings()
+
+def _save_outputs(all_resources, all_timing, all_latency, base_dir, parts=None, all_closure=None):
+    """Write the timestamped TXT report and the variant's results store; returns the store."""
     # Save all report data to a text file
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     output_filename = f"implementation_report_{timestamp}.txt"
     save_report_to_txt(all_resources, all_timing, all_latency, base_dir, output_filename)
 
+    # Save a columnar results store that HLS/analyzeReports.py merges without re-parsing.
+    # Rows are named after the HDLCoder variant (e.g. opt4_HLS), qualified by project if several.
+    variant = os.path.basename(os.path.normpath(base_dir))
+    all_closure = all_closure or {}
+    impl_names = set(all_resources) | set(all_timing) | set(all_latency) | set(all_closure)
+    rename = {impl: variant if len(impl_names) == 1 else f"{variant}/{impl}" for impl in impl_names}
+    results = build_results({rename[k]: v for k, v in all_resources.items()},
+                            {rename[k]: v for k, v in all_timing.items()},
+                            {rename[k]: v for k, v in all_latency.items()},
+                            flow='HDLCoder', parts={rename[k]: v for k, v in (parts or {}).items()},
+                            all_closure={rename[k]: v for k, v in all_closure.items()})
+    save_results(results, f"{variant}.npz")
+    return results
+
 if __name__ == "__main__":
     main()
@@ -1,80 +1,50 @@
+"""
+Harvest and compare Vitis HLS / HDLCoder implementation reports.
+
+Usage:
+    python analyzeReports.py [--hls-dir DIR] [--hdlcoder-dir DIR] [--summary-only | --plots]
+                             [--plot-format {png,pdf}] [--per-page N] [--timings]
+                             [--history DB | --no-history]
+                             [--check BASELINE] [--write-baseline BASELINE]
+                             [--watch [--watch-interval SECONDS]]
+
+--summary-only writes the TXT summary and results store without ever
+importing matplotlib; otherwise the dashboard (dashboard.py) is rendered as
+fpga_dashboard_p<N>.png pages or one fpga_dashboard.pdf. --timings prints
+lazy-import and stage timings. Every run (and every --watch refresh) is
+appended to the QoR history (qorHistory.py) unless --no-history. --check
+gates the results against a committed baseline (qorGate.py) and exits 1 on
+a regression, for CI. HDLCoder variants are read from the reports HDL Coder
+generates in <variant>/codegen/<design>/hdlsrc (hdlcoderReports.py), which
+override a hand-copied <variant>.txt summary. --watch keeps polling both
+trees and, as Vitis runs finish, parses only the new or changed reports and
+refreshes the store, summary and dashboard in place.
+"""
+
+import argparse
 import os
-import glob
 import re
-import pandas as pd
-import matplotlib.pyplot as plt
+import sys
+import time
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-def parse_latency_report(report_file):
-    """Parse latency report file and extract total execution time."""
-    try:
-        with open(report_file, 'r') as f:
-            content = f.read()
-            # Find the MAX_LATENCY value
-            # import re
-            match = re.search(r'\$MAX_LATENCY = "(\d+)"', content)
-            if match:
-                return int(match.group(1))
-    except Exception as e:
-        print(f"Error parsing latency report {report_file}: {e}")
-    return None
-
-def find_latency_reports(base_dir):
-    """Find all latency report files recursively."""
-    # Generic pattern to find latency reports
-    pattern = os.path.join(base_dir, '**/sim/report/verilog/lat.rpt')
-    reports = glob.glob(pattern, recursive=True)
-    reports.sort()
-    print(f"Found {len(reports)} latency reports")
-    return reports
-
-def compare_latency(reports_data):
-    """Create comparative visualization of latency results."""
-    if not reports_data:
-        print("No latency data to visualize")
-        return
-
-    plt.figure(figsize=(10, 6))
-    implementations = list(reports_data.keys())
-    latencies = list(reports_data.values())
-    
-    bars = plt.bar(implementations, latencies, color='purple', alpha=0.6)
-    plt.title('Latency Comparison')
-    plt.xlabel('Implementation')
-    plt.ylabel('Total Execute Time (cycles)')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of each bar
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}',
-                ha='center', va='bottom')
-    
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig('latency_comparison.png')
-    plt.close()
-
-def find_impl_reports(base_dir):
-    """Find all implementation report files recursively."""
-    # More generic pattern to find implementation reports
-    pattern = os.path.join(base_dir, '**/impl/report/verilog/export_impl.rpt')
-    reports = glob.glob(pattern, recursive=True)
-    
-    # Sort the reports to ensure consistent ordering
-    reports.sort()
-    
-    if not reports:
-        print(f"No implementation reports found in {base_dir}")
-        print(f"Searched pattern: {pattern}")
-    else:
-        print(f"Found {len(reports)} implementation reports:")
-        for report in reports:
-            print(f"  - {report}")
-            
-    return reports
+from lazyImports import lazy_module, report_timings, timed_import, timed_stage
+from dashboard import IMPLS_PER_PAGE, render_dashboard
+from reportCache import ReportCache, file_stamp
+from latencyReport import HEADLINE_METRIC, SAMPLES_PER_TRANSACTION, format_latency_summary, parse_latency_report
+from resultsStore import RESOURCE_COLUMNS, build_results, load_results, merge_results, results_to_dicts, save_results
+from reportWatcher import TreeWatcher
+from qorHistory import DEFAULT_HISTORY_FILE, record_results
+from derivedMetrics import DERIVED_COLUMNS
+from qorGate import run_check, write_baseline
+from pareto import OBJECTIVE_LABELS, OBJECTIVES, pareto_analysis
+from hdlcoderReports import artifact_kind, combine_artifacts, parse_hdl_artifact
+from vivadoTiming import CLOSURE_COLUMNS, TIMING_REPORT_RE, merge_timing_closure, parse_timing_report
+from loopQoR import QOR_COLUMNS, log_impl_name, merge_pipeline_qor, parse_csynth_xml, parse_hls_log_qor
+
+# pandas is only imported by the code paths that use it
+pd = lazy_module('pandas')
 
 def parse_impl_report(report_file):
     """Parses the Vivado Place & Route report file."""
@@ -107,7 +77,7 @@ def parse_impl_report(report_file):
                 resource_summary[name] = int(match.group(1))
 
     # Extract Timing Summary
-    timing_section = re.search(r'== Place & Route Timing Summary.*?\| Target\s*\|\s*[\d.]+\s*\|(.*?)\+\-', content, re.DOTALL)
+    timing_section = re.search(r'== Place & Route Timing Summary.*?(\| Target\s*\|.*?)\n\+-', content, re.DOTALL)
     if timing_section:
         timing_text = timing_section.group(1)
         timing_pairs = [
@@ -116,124 +86,12 @@ def parse_impl_report(report_file):
             ('Post-Route', r'\| Post-Route\s*\|\s*([\d.]+)\s*\|')
         ]
         for name, pattern in timing_pairs:
-            match = re.search(pattern, content)
+            match = re.search(pattern, timing_text)
             if match:
                 timing_summary[name] = float(match.group(1))
 
     return resource_summary, timing_summary
 
-def compare_resources(reports_data):
-    """Create comparative visualization of resource utilization."""
-    if not reports_data:
-        print("No resource data to visualize")
-        return
-        
-    df = pd.DataFrame(reports_data).T
-    
-    # Create a bar plot
-    ax = df.plot(kind='bar', figsize=(12, 6), width=0.8)
-    plt.title('Resource Utilization Comparison')
-    plt.xlabel('Implementation')
-    plt.ylabel('Resource Count')
-    plt.legend(title='Resource Type')
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig('resource_comparison.png')
-    print(f"Resource comparison saved as 'resource_comparison.png'")
-    plt.close()
-
-def compare_timing(reports_data):
-    """Create comparative visualization of timing results."""
-    if not reports_data:
-        print("No timing data to visualize")
-        return
-        
-    # Convert timing data to MHz
-    mhz_data = {impl: {k: 1000/v if v > 0 else 0 for k, v in timing.items()}
-                for impl, timing in reports_data.items()}
-    df = pd.DataFrame(mhz_data).T
-    
-    # Create a bar plot
-    ax = df['Post-Route'].plot(kind='bar', figsize=(10, 6), color='green', alpha=0.6)
-    if 'Target' in df.columns and len(df['Target']) > 0:
-        plt.axhline(y=df['Target'].iloc[0], color='r', linestyle='--', label='Target')
-    plt.title('Post-Route Timing Comparison')
-    plt.xlabel('Implementation')
-    plt.ylabel('Frequency (MHz)')
-    plt.legend()
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig('timing_comparison.png')
-    print(f"Timing comparison saved as 'timing_comparison.png'")
-    plt.close()
-
-def create_timing_resource_plot(reports_data_resources, reports_data_timing):
-    """Create a plot comparing timing vs resource utilization."""
-    if not reports_data_resources or not reports_data_timing:
-        print("Insufficient data for timing vs resources plot")
-        return
-        
-    # Convert timing data to MHz for x-axis, handling missing keys
-    mhz_data = {}
-    for impl, timing in reports_data_timing.items():
-        if 'Post-Route' in timing and timing['Post-Route'] > 0:
-            mhz_data[impl] = 1000/timing['Post-Route']
-        else:
-            print(f"Warning: Missing or invalid 'Post-Route' timing data for {impl}, skipping in plot")
-    
-    if not mhz_data:
-        print("No valid timing data available for timing vs resources plot")
-        return
-    
-    # Prepare data
-    implementations = list(mhz_data.keys())
-    frequencies = list(mhz_data.values())
-    
-    # Filter resource data to match available timing data
-    lut_values = []
-    bram_values = []
-    for impl in implementations:
-        if impl in reports_data_resources:
-            lut_values.append(reports_data_resources[impl].get('LUT', 0))
-            bram_values.append(reports_data_resources[impl].get('BRAM', 0))
-        else:
-            print(f"Warning: Missing resource data for {impl}, using 0 values")
-            lut_values.append(0)
-            bram_values.append(0)
-
-    # Create the figure and axis
-    plt.figure(figsize=(12, 7))
-
-    # Calculate circle sizes based on BRAM values
-    # Scale BRAM values to reasonable circle sizes (min 100, max 1000)
-    min_bram = min(bram_values) if bram_values else 0
-    max_bram = max(bram_values) if bram_values else 1
-    if min_bram != max_bram:
-        scaled_sizes = [(x - min_bram) * 900 / (max_bram - min_bram) + 100 for x in bram_values]
-    else:
-        scaled_sizes = [500 for x in bram_values]  # Use medium size if all values are the same
-
-    # Plot LUT with circle sizes representing BRAM
-    plt.scatter(frequencies, lut_values, s=scaled_sizes, alpha=0.6, 
-                color='tab:blue', label='LUT (circle size = BRAM count)')
-
-    # Add implementation labels to points
-    for i, impl in enumerate(implementations):
-        plt.annotate(f'{impl}\nBRAM: {bram_values[i]}', 
-                    (frequencies[i], lut_values[i]), 
-                    xytext=(5, 5), textcoords='offset points')
-
-    plt.xlabel('Frequency (MHz)')
-    plt.ylabel('LUT Count')
-    plt.title('Resource Utilization vs Frequency\n(Circle size represents BRAM usage)')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig('timing_vs_resources.png')
-    plt.close()
-
 def extract_impl_name(report_file):
     """Extract implementation name from report file path."""
     path = Path(report_file)
@@ -251,16 +109,6 @@ def extract_impl_name(report_file):
     # Go up 4 levels: impl/report/verilog/export_impl.rpt
     return path.parents[3].name
 
-def find_txt_reports(base_dir):
-    """Find all TXT report files in the specified directory."""
-    pattern = os.path.join(base_dir, '*.txt')
-    reports = glob.glob(pattern)
-    reports.sort()
-    print(f"Found {len(reports)} TXT reports in {base_dir}")
-    for report in reports:
-        print(f"  - {report}")
-    return reports
-
 def parse_txt_report(report_file):
     """Parse a TXT report file and extract resource, timing, and latency data."""
     resource_summary = {}
@@ -313,34 +161,311 @@ def parse_txt_report(report_file):
                 else:
                     print(f"Warning: '{timing_name}' not found in timing summary for {report_file}")
 
-        # Extract Latency
-        latency_match = re.search(r'LATENCY SUMMARY \(cycles\):\n.*?(\w+)\s+(\d+)', content, re.DOTALL)
-        if latency_match:
-            try:
-                latency = int(latency_match.group(2))
-            except ValueError:
+        # Extract Latency - HDLCoder reports hold $TOTAL_EXECUTE_TIME, either as a
+        # 'Total Execute Time' row or as the single row of older reports
+        latency_section = re.search(r'LATENCY SUMMARY \(cycles\):\n-+\n(.*?)\n\n', content, re.DOTALL)
+        if latency_section:
+            latency_text = latency_section.group(1)
+            latency_match = (re.search(r'Total Execute Time\s+(\d+)', latency_text) or
+                             re.search(r'^\s*(?:\w+)\s+(\d+)\s*$', latency_text, re.MULTILINE))
+            if latency_match:
+                latency = {HEADLINE_METRIC: int(latency_match.group(1))}
+            else:
                 print(f"Warning: Invalid latency value in {report_file}")
-                latency = 0
 
         return impl_name, resource_summary, timing_summary, latency, project_name
     except Exception as e:
         print(f"Error parsing TXT report {report_file}: {e}")
         return None, {}, {}, None, None
 
-def write_report_summary(all_resources, all_timing, all_latency, output_file="fpga_implementation_summary.txt"):
-    """Write all report data to a TXT file."""
+# Report locations relative to a solution directory, keyed by report group
+REPORT_SUFFIXES = {
+    'impl': ('impl', 'report', 'verilog', 'export_impl.rpt'),
+    'latency': ('sim', 'report', 'verilog', 'lat.rpt'),
+    'csynth': ('syn', 'report', 'csynth.xml'),
+    'hls_log': ('vitis_hls.log',),
+}
+
+# Report groups in parse/merge order
+REPORT_GROUPS = ('impl', 'timing', 'latency', 'csynth', 'hls_log', 'txt', 'hdlsrc')
+
+# Vivado timing reports of a solution (vivadoTiming.py)
+TIMING_REPORT_DIR = ('impl', 'verilog', 'report')
+
+# Directories inside a solution (or its impl/verilog) with their only interesting children
+# (impl/verilog/project.runs and sim/verilog hold thousands of tool files)
+REPORT_ONLY_DIRS = {
+    ('impl',): ('report', 'verilog'),
+    ('impl', 'verilog'): ('report',),
+    ('sim',): ('report',),
+    ('syn',): ('report',),
+}
+
+def hls_report_group(rel_parts):
+    """Report group of a file below the HLS root (path parts relative to it), or None."""
+    for group, suffix in REPORT_SUFFIXES.items():
+        if rel_parts[-len(suffix):] == suffix:
+            return group
+    if rel_parts[-4:-1] == TIMING_REPORT_DIR and TIMING_REPORT_RE.match(rel_parts[-1]):
+        return 'timing'
+    return None
+
+def walk_hls_dir(rel_parts):
+    """Whether the HLS walk enters a directory: below impl/sim/syn only their report
+    directories (and impl/verilog/report) are entered."""
+    for parent in (rel_parts[-3:-1], rel_parts[-2:-1]):
+        if len(rel_parts) > len(parent) and parent in REPORT_ONLY_DIRS:
+            return rel_parts[-1] in REPORT_ONLY_DIRS[parent]
+    return True
+
+def hdlcoder_report_group(rel_parts):
+    """Report group of an HDLCoder file: top-level TXT summaries and .npz result stores,
+    and the generated reports in <variant>/codegen/<design>/hdlsrc."""
+    if len(rel_parts) == 5:
+        return 'hdlsrc' if walk_hdlcoder_dir(rel_parts[:4]) and artifact_kind(rel_parts[4]) else None
+    if len(rel_parts) != 1:
+        return None
+    if rel_parts[0].endswith('.txt'):
+        return 'txt'
+    if rel_parts[0].endswith('.npz'):
+        return 'store'
+    return None
+
+def walk_hdlcoder_dir(rel_parts):
+    """Whether the HDLCoder walk enters a directory: only <variant>/codegen/<design>/hdlsrc."""
+    return (len(rel_parts) <= 4 and rel_parts[1:2] in ((), ('codegen',))
+            and rel_parts[3:4] in ((), ('hdlsrc',)))
+
+def scan_reports(hls_base_dir, hdlcoder_base_dir=None):
+    """Walk the report trees once and group report files by type.
+
+    The HLS tree is walked recursively with os.scandir, sorting each
+    export_impl.rpt, Vivado timing report (impl/verilog/report), lat.rpt,
+    csynth.xml and vitis_hls.log into its group as it is seen. Summary TXT
+    reports are only taken from the top level of the HDLCoder directory,
+    together with any .npz result stores written by readReports.py; the HDL
+    Coder artifacts (hdlcoderReports.py) are taken from each
+    <variant>/codegen/<design>/hdlsrc. Returns a dict of sorted path lists
+    keyed by group.
+    """
+    groups = {group: [] for group in REPORT_GROUPS}
+    groups['store'] = []
+
+    roots = [(hls_base_dir, hls_report_group, walk_hls_dir)]
+    if hdlcoder_base_dir and os.path.isdir(hdlcoder_base_dir):
+        roots.append((hdlcoder_base_dir, hdlcoder_report_group, walk_hdlcoder_dir))
+
+    for root, classify, descend in roots:
+        stack = [(root, ())]
+        while stack:
+            current_dir, rel_parts = stack.pop()
+            try:
+                entries = list(os.scandir(current_dir))
+            except OSError as e:
+                print(f"Warning: cannot scan {current_dir}: {e}")
+                continue
+
+            for entry in entries:
+                parts = rel_parts + (entry.name,)
+                if entry.is_dir(follow_symlinks=False):
+                    if descend(parts):
+                        stack.append((entry.path, parts))
+                elif entry.is_file():
+                    group = classify(parts)
+                    if group is not None:
+                        groups[group].append(entry.path)
+
+    for reports in groups.values():
+        reports.sort()
+
+    print(f"Found {len(groups['impl'])} implementation reports, "
+          f"{len(groups['timing'])} Vivado timing reports, "
+          f"{len(groups['latency'])} latency reports, "
+          f"{len(groups['csynth'])} csynth reports, "
+          f"{len(groups['hls_log'])} HLS logs, "
+          f"{len(groups['store'])} result stores, "
+          f"{len(groups['txt'])} TXT reports and "
+          f"{len(groups['hdlsrc'])} HDL Coder artifacts")
+    for group in ('impl', 'store', 'txt', 'hdlsrc'):
+        for report in groups[group]:
+            print(f"  - {report}")
+
+    return groups
+
+# Bump when a parser's output changes so stale cache entries are ignored
+PARSER_VERSION = 7
+
+def _parse_report_task(task):
+    """Stamp and parse a single (group, path) report task inside a worker process."""
+    group, report_file = task
+    parser = REPORT_PARSERS[group]
+    return file_stamp(report_file), parser(report_file)
+
+def parse_reports(groups, max_workers=None, cache=None):
+    """Parse grouped report files over a process pool.
+
+    Tasks are submitted in REPORT_GROUPS order and collected with
+    executor.map, so results come back in the same deterministic order
+    regardless of which worker finishes first. With a ReportCache only new or
+    changed reports are sent to the pool. Returns a list of
+    (group, report_file, impl_name, parsed) tuples.
+    """
+    tasks = [(group, report_file)
+             for group in REPORT_GROUPS
+             for report_file in groups.get(group, [])]
+    if not tasks:
+        return []
+
+    parsed_by_task = {}
+    if cache is not None:
+        cache.evict_stale()
+        for task in tasks:
+            found, value = cache.lookup(_cache_key(task[0]), task[1])
+            if found:
+                parsed_by_task[task] = value
+    pending = [task for task in tasks if task not in parsed_by_task]
+
+    # A pool only pays off once there is more than a handful of files
+    if max_workers == 1 or len(pending) < 8:
+        results = list(map(_parse_report_task, pending))
+    else:
+        chunksize = max(1, len(pending) // ((max_workers or os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_parse_report_task, pending, chunksize=chunksize))
+
+    for task, (stamp, parsed) in zip(pending, results):
+        parsed_by_task[task] = parsed
+        if cache is not None:
+            cache.store(_cache_key(task[0]), task[1], stamp, parsed)
+
+    if cache is not None:
+        print(cache.summary())
+
+    return [(group, report_file, report_impl_name(group, report_file),
+             parsed_by_task[(group, report_file)])
+            for group, report_file in tasks]
+
+def report_impl_name(group, report_file):
+    """Implementation name for a report; TXT reports carry their own."""
+    if group == 'txt':
+        return None
+    if group == 'hls_log':
+        return log_impl_name(report_file)
+    if group == 'hdlsrc':
+        # <variant>/codegen/<design>/hdlsrc/<artifact>
+        return Path(report_file).parents[3].name
+    return extract_impl_name(report_file)
+
+def _cache_key(group):
+    """Cache key for a report group's parser."""
+    return f"analyzeReports/{group}/v{PARSER_VERSION}"
+
+REPORT_PARSERS = {
+    'impl': parse_impl_report,
+    'timing': parse_timing_report,
+    'latency': parse_latency_report,
+    'csynth': parse_csynth_xml,
+    'hls_log': parse_hls_log_qor,
+    'txt': parse_txt_report,
+    'hdlsrc': parse_hdl_artifact,
+}
+
+def resource_frame(all_resources):
+    """Resources x implementations table in schema row order, '-' where not reported."""
+    df = pd.DataFrame(all_resources)
+    rows = [label for _, label in RESOURCE_COLUMNS.values() if label in df.index]
+    return df.reindex(rows).astype('Int64').astype(object).fillna('-')
+
+def pipeline_qor_frame(all_pipeline):
+    """Flatten {impl: {loop: row}} pipeline QoR data into a DataFrame indexed by (impl, loop)."""
+    rows = {(impl, loop): row for impl, qor in all_pipeline.items() for loop, row in qor['loops'].items()}
+    if not rows:
+        return pd.DataFrame(columns=QOR_COLUMNS)
+    df = pd.DataFrame.from_dict(rows, orient='index')[QOR_COLUMNS]
+    count_columns = ['Target II', 'Final II', 'Depth', 'Trip Count', 'Latency']
+    df[count_columns] = df[count_columns].astype('Int64')
+    df.index.names = ['Implementation', 'Loop']
+    return df
+
+def derived_frame(results):
+    """Implementations x derived throughput/efficiency metrics, '-' where an input is missing."""
+    df = pd.DataFrame({label: results[column] for column, (_, label) in DERIVED_COLUMNS.items()},
+                      index=results['implementation'])
+    df = df.round({'Latency (us)': 3, 'Throughput (Msps)': 3, 'Cycles/Sample': 4, 'Msps/kLUT': 3, 'Msps/kFF': 3})
+    return df.astype(object).where(df.notna(), '-')
+
+def timing_closure_frame(results):
+    """Implementations x WNS/TNS and worst-setup-path columns, for those with Vivado timing reports."""
+    reported = ~np.all(np.isnan(np.column_stack([results[column] for column in CLOSURE_COLUMNS])), axis=1)
+    df = pd.DataFrame({label: results[column][reported] for column, (_, label) in CLOSURE_COLUMNS.items()},
+                      index=results['implementation'][reported])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['Route %'] = (100 * df['Route Delay'] / df['Data Path Delay']).round(1)
+    counts = ['Failing Endpoints', 'Total Endpoints', 'Logic Levels']
+    df[counts] = df[counts].astype('Int64')
+    return df.round(3).astype(object).where(df.notna(), '-')
+
+def pareto_summary(results):
+    """Dominance rank and an example dominator per implementation, as text."""
+    analysis = pareto_analysis(results)
+    if not analysis['objectives']:
+        return "No Pareto objective is reported for any implementation"
+    ranked = analysis['rank'] > 0
+    df = pd.DataFrame({'Rank': analysis['rank'], 'Frontier': np.where(analysis['dominated'], '', 'yes'),
+                       'Dominated By': analysis['dominator'],
+                       'Missing': [', '.join(OBJECTIVE_LABELS[column] for column in missing)
+                                   for missing in analysis['missing']]},
+                      index=results['implementation'])[ranked]
+    objectives = ', '.join(OBJECTIVE_LABELS[column] for column in analysis['objectives'])
+    text = f"Objectives: {objectives}\n" + df.sort_values('Rank', kind='stable').replace('', '-').to_string()
+    unranked = [f"{name} (missing {'every objective' if len(missing) == len(OBJECTIVES) else ', '.join(missing)})"
+                for name, missing, is_ranked in zip(results['implementation'], analysis['missing'], ranked)
+                if not is_ranked]
+    if unranked:
+        text += "\nNot ranked: " + '; '.join(unranked)
+    return text
+
+def hdl_details_frame(hdl_details):
+    """HDL Coder operator estimates, compliance counts and testbench verdict per variant."""
+    columns = {}
+    for impl, details in hdl_details.items():
+        column = dict(details['estimates'])
+        for key, count in (details['compliance'] or {}).items():
+            column[f"Compliance {key}"] = count
+        if details['sim_passed'] is not None:
+            column['Testbench'] = 'PASSED' if details['sim_passed'] else 'FAILED'
+        columns[impl] = column
+    rows = list(dict.fromkeys(row for column in columns.values() for row in column))
+    df = pd.DataFrame({impl: pd.Series(column, dtype=object) for impl, column in columns.items()})
+    return df.reindex(rows).fillna('-')
+
+def write_report_summary(results, output_file="fpga_implementation_summary.txt", all_pipeline=None,
+                         hdl_details=None):
+    """Render a results store (plus optional pipeline QoR and HDL Coder details) to a TXT file."""
+    all_resources, all_timing, all_latency = results_to_dicts(results)
     with open(output_file, 'w') as f:
         f.write("===============================================\n")
         f.write("FPGA Implementation Report Summary\n")
         f.write(f"Generated on: {pd.Timestamp.now()}\n")
         f.write("===============================================\n\n")
 
+        # Write Flow/Part overview
+        f.write("IMPLEMENTATIONS:\n")
+        f.write("----------------\n")
+        if len(results['implementation']):
+            df_overview = pd.DataFrame({'Flow': results['flow'], 'Part': results['part'],
+                                        'Clock (MHz)': results['clock_mhz'].round(3)},
+                                       index=results['implementation'])
+            f.write(df_overview.replace('', '-').to_string(na_rep='-'))
+            f.write("\n\n")
+        else:
+            f.write("No implementations available\n\n")
+
         # Write Resource Summary
         f.write("RESOURCE UTILIZATION SUMMARY:\n")
         f.write("-----------------------------\n")
         if all_resources:
-            df_resources = pd.DataFrame(all_resources)
-            f.write(df_resources.to_string())
+            f.write(resource_frame(all_resources).to_string())
             f.write("\n\n")
         else:
             f.write("No resource data available\n\n")
@@ -356,82 +481,313 @@ def write_report_summary(all_resources, all_timing, all_latency, output_file="fp
         else:
             f.write("No timing data available\n\n")
 
+        # Write Vivado timing closure and critical paths
+        f.write("TIMING CLOSURE (ns, worst setup path):\n")
+        f.write("--------------------------------------\n")
+        df_closure = timing_closure_frame(results)
+        if len(df_closure):
+            f.write(df_closure.to_string())
+            f.write("\n")
+            for impl, path in zip(results['implementation'], results['critical_path']):
+                if path:
+                    f.write(f"  {impl}: {path}\n")
+            f.write("\n")
+        else:
+            f.write("No Vivado timing reports available\n\n")
+
         # Write Latency Summary
         f.write("LATENCY SUMMARY (cycles):\n")
         f.write("------------------------\n")
         if all_latency:
-            df_latency = pd.Series(all_latency, name='Latency')
-            f.write(df_latency.to_string())
+            f.write(format_latency_summary(all_latency))
             f.write("\n\n")
         else:
             f.write("No latency data available\n\n")
 
+        # Write throughput at post-route Fmax
+        title = f"THROUGHPUT SUMMARY (per {SAMPLES_PER_TRANSACTION}-sample buffer, at post-route Fmax):"
+        f.write(f"{title}\n{'-' * len(title)}\n")
+        if len(results['implementation']):
+            f.write(derived_frame(results).to_string())
+            f.write("\n\n")
+        else:
+            f.write("No throughput data available\n\n")
+
+        # Write the Pareto frontier over resources, Fmax and latency
+        f.write("PARETO FRONTIER:\n")
+        f.write("----------------\n")
+        f.write(pareto_summary(results))
+        f.write("\n\n")
+
+        # Write HDL Coder's own estimates and checks
+        if hdl_details:
+            f.write("HDL CODER ESTIMATES AND COMPLIANCE:\n")
+            f.write("-----------------------------------\n")
+            f.write(hdl_details_frame(hdl_details).to_string())
+            f.write("\n\n")
+
+        # Write loop-level pipeline QoR
+        f.write("PIPELINE QoR SUMMARY (per loop):\n")
+        f.write("-------------------------------\n")
+        if all_pipeline:
+            df_pipeline = pipeline_qor_frame(all_pipeline)
+            f.write(df_pipeline.astype(object).fillna('-').to_string())
+            f.write("\n\n")
+            violations = df_pipeline[df_pipeline['II Violation']]
+            if not violations.empty:
+                f.write("II VIOLATIONS:\n")
+                for (impl, loop), row in violations.iterrows():
+                    f.write(f"  {impl}: {loop} - {row['Note']}\n")
+                f.write("\n")
+            warned = [impl for impl, qor in all_pipeline.items() if qor['first_ii_read_warning']]
+            if warned:
+                f.write(f"FIRST-II READ WARNING (HLS 200-626, design level): {', '.join(warned)}\n\n")
+        else:
+            f.write("No pipeline data available\n\n")
+
         f.write("===============================================\n")
         f.write("End of Report\n")
         f.write("===============================================\n")
 
     print(f"Report summary written to {output_file}")
 
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Compare Vitis HLS and HDLCoder implementation reports')
+    parser.add_argument('--hls-dir', default="/home/amd/UTS/peakPicker/HLS",
+                        help='HLS directory holding the proj_*/solution* trees')
+    parser.add_argument('--hdlcoder-dir', default="/home/amd/UTS/peakPicker/HDLCoder",
+                        help='HDLCoder directory holding TXT summaries, .npz result stores and '
+                             'the <variant>/codegen/<design>/hdlsrc reports')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--summary-only', action='store_true',
+                      help='Only write the TXT summary and results store (matplotlib is never imported)')
+    mode.add_argument('--plots', action='store_true',
+                      help='Write the summary and render the dashboard (default)')
+    parser.add_argument('--plot-format', choices=('png', 'pdf'), default='png',
+                        help='Dashboard as a PNG set (pages rendered in parallel) or one multi-page PDF')
+    parser.add_argument('--per-page', type=int, default=IMPLS_PER_PAGE,
+                        help=f'Implementations per dashboard page (default: {IMPLS_PER_PAGE})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parser/renderer worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Parse every report, ignoring the parse cache')
+    parser.add_argument('--history', default=DEFAULT_HISTORY_FILE,
+                        help=f'QoR history database each run is appended to (default: {DEFAULT_HISTORY_FILE})')
+    parser.add_argument('--no-history', action='store_true', help='Do not record this run in the QoR history')
+    parser.add_argument('--timings', action='store_true', help='Print lazy-import and stage timings')
+    parser.add_argument('--check', metavar='BASELINE', default=None,
+                        help='Compare the results against a baseline JSON and exit 1 on regression (see qorGate.py)')
+    parser.add_argument('--write-baseline', metavar='BASELINE', default=None,
+                        help='Record the current results as the baseline JSON')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and refresh the outputs as reports appear or change')
+    parser.add_argument('--watch-interval', type=float, default=2.0,
+                        help='Seconds between polls in --watch mode (default: 2)')
+    args = parser.parse_args()
+    # A watch never exits, so it has no exit code to gate on and would rewrite the baseline every refresh
+    if args.watch and (args.check or args.write_baseline):
+        parser.error('--watch cannot be combined with --check or --write-baseline')
+    return args
+
+def collect_results(parsed_reports, store_files, verbose=True):
+    """Merge parsed reports into the columnar results table.
+
+    Returns (results, all_pipeline, hdl_details): HLS results, then HDLCoder
+    TXT summaries overlaid with the values parsed from the variant's HDL Coder
+    artifacts, with HDLCoder result stores superseding both; all_pipeline holds
+    the per-implementation loop QoR rows and hdl_details the HDL Coder
+    estimates, compliance counts and testbench verdict per variant.
+    """
+    all_resources = {}
+    all_timing = {}
+    all_latency = {}
+    csynth_data = {}
+    log_data = {}
+    txt_resources = {}
+    txt_timing = {}
+    txt_latency = {}
+    hdl_records = {}
+    timing_records = {}
+
+    for group, report_file, impl_name, parsed in parsed_reports:
+        if group == 'impl':
+            if verbose:
+                print(f"Processing implementation: {impl_name}")
+            resource_data, timing_data = parsed
+            all_resources[impl_name] = resource_data
+            all_timing[impl_name] = timing_data
+        elif group == 'timing':
+            timing_records.setdefault(impl_name, []).append(parsed)
+        elif group == 'latency':
+            if parsed is not None:
+                all_latency[impl_name] = parsed
+        elif group == 'csynth':
+            csynth_data[impl_name] = parsed
+        elif group == 'hls_log':
+            log_data[impl_name] = parsed
+        elif group == 'hdlsrc':
+            hdl_records.setdefault(impl_name, []).append(parsed)
+        else:
+            impl_name, resource_data, timing_data, latency, project_name = parsed
+            if impl_name:
+                if verbose:
+                    print(f"Processing TXT report: {impl_name}")
+                # Use project name as a suffix to differentiate implementations
+                impl_key = f"{impl_name}"
+                if resource_data:
+                    txt_resources[impl_key] = resource_data
+                if timing_data:
+                    txt_timing[impl_key] = timing_data
+                if latency is not None:
+                    txt_latency[impl_key] = latency
+
+    # Join scheduler results from the logs with csynth.xml loop data
+    all_pipeline = {}
+    for impl_name in sorted(set(csynth_data) | set(log_data)):
+        log_qor = log_data.get(impl_name)
+        all_pipeline[impl_name] = merge_pipeline_qor(log_qor, csynth_data.get(impl_name))
+        # HLS-estimated Fmax sits next to the Vivado timing (stored as a period in ns)
+        if log_qor and log_qor['fmax_mhz']:
+            all_timing.setdefault(impl_name, {})['HLS Estimate'] = 1000 / log_qor['fmax_mhz']
+
+    # Values read from the generated HDL Coder reports replace hand-copied TXT values
+    hdl_parts = {}
+    hdl_details = {}
+    for impl_name, records in hdl_records.items():
+        if verbose:
+            print(f"Processing HDL Coder artifacts: {impl_name}")
+        variant = combine_artifacts(records)
+        if variant['resources']:
+            txt_resources[impl_name] = {**txt_resources.get(impl_name, {}), **variant['resources']}
+        if variant['timing']:
+            txt_timing[impl_name] = {**txt_timing.get(impl_name, {}), **variant['timing']}
+        if variant['latency']:
+            txt_latency[impl_name] = {**(txt_latency.get(impl_name) or {}), **variant['latency']}
+        if variant['part']:
+            hdl_parts[impl_name] = variant['part']
+        hdl_details[impl_name] = {key: variant[key] for key in ('estimates', 'compliance', 'sim_passed')}
+
+    all_closure = {impl: merge_timing_closure(records) for impl, records in timing_records.items()}
+    parts = {impl: data['part'] for impl, data in csynth_data.items() if data.get('part')}
+    results = merge_results(
+        build_results(all_resources, all_timing, all_latency, flow='HLS', parts=parts, all_closure=all_closure),
+        build_results(txt_resources, txt_timing, txt_latency, flow='HDLCoder', parts=hdl_parts),
+        *[load_results(store_file) for store_file in store_files])
+    return results, all_pipeline, hdl_details
+
+def write_outputs(results, all_pipeline, args, hdl_details=None):
+    """Write the results store, the TXT summary and (unless --summary-only) the dashboard."""
+    with timed_stage('summary'):
+        save_results(results, "fpga_implementation_results.npz")
+        if not args.no_history:
+            record_results(results, 'analyzeReports', args.hls_dir, args.history)
+        # The TXT summary and the plots are renderings of the store
+        write_report_summary(results, "fpga_implementation_summary.txt", all_pipeline, hdl_details)
+
+    if not args.summary_only:
+        with timed_stage('plots'):
+            timed_import('matplotlib.figure')
+            render_dashboard(results, 'fpga_dashboard', fmt=args.plot_format,
+                             max_workers=args.workers, per_page=args.per_page)
+
+def _report_order(key):
+    """Sort key for (group, path) so watch-mode merges follow scan order."""
+    group, report_file = key
+    return (REPORT_GROUPS.index(group) if group in REPORT_GROUPS else len(REPORT_GROUPS), report_file)
+
+def watch_reports(args):
+    """Poll the report trees and refresh the outputs whenever reports change.
+
+    The first poll parses everything (through the parse cache unless
+    --no-cache); afterwards only new or modified reports are parsed and the
+    results, summary and dashboard are rebuilt from the kept parse results.
+    """
+    watchers = [TreeWatcher(args.hls_dir, hls_report_group, walk_hls_dir)]
+    if args.hdlcoder_dir:
+        watchers.append(TreeWatcher(args.hdlcoder_dir, hdlcoder_report_group, walk_hdlcoder_dir))
+
+    parsed_by_report = {}  # (group, path) -> (impl_name, parsed)
+    store_files = set()
+    cache = None if args.no_cache else ReportCache()
+    print(f"Watching {args.hls_dir} and {args.hdlcoder_dir} every {args.watch_interval}s (Ctrl-C to stop)")
+    try:
+        while True:
+            start = time.perf_counter()
+            changed, removed = [], []
+            for watcher in watchers:
+                new, gone = watcher.poll()
+                changed += new
+                removed += gone
+
+            if changed or removed:
+                for group, report_file in removed:
+                    parsed_by_report.pop((group, report_file), None)
+                    store_files.discard(report_file)
+                    print(f"  - removed {report_file}")
+
+                groups = {}
+                for group, report_file in changed:
+                    if group == 'store':
+                        store_files.add(report_file)
+                    else:
+                        groups.setdefault(group, []).append(report_file)
+                    print(f"  + {report_file}")
+                for group, report_file, impl_name, parsed in parse_reports(groups, args.workers, cache):
+                    parsed_by_report[(group, report_file)] = (impl_name, parsed)
+
+                parsed_reports = [(group, report_file) + parsed_by_report[(group, report_file)]
+                                  for group, report_file in sorted(parsed_by_report, key=_report_order)]
+                results, all_pipeline, hdl_details = collect_results(parsed_reports, sorted(store_files),
+                                                                     verbose=False)
+                write_outputs(results, all_pipeline, args, hdl_details)
+                print(f"Updated {len(results['implementation'])} implementations "
+                      f"in {time.perf_counter() - start:.2f}s "
+                      f"({len(changed)} changed, {len(removed)} removed report files)")
+
+            time.sleep(args.watch_interval)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    finally:
+        if cache is not None:
+            cache.close()
+
 def main():
+    args = parse_arguments()
+
+    if args.watch:
+        watch_reports(args)
+        return
+
     # Set the base directories
-    hls_base_dir = "/home/amd/UTS/peakPicker/HLS"
-    hdlcoder_base_dir = "/home/amd/UTS/peakPicker/HDLCoder"
+    hls_base_dir = args.hls_dir
+    hdlcoder_base_dir = args.hdlcoder_dir
     print(f"Analyzing reports in: {hls_base_dir} and {hdlcoder_base_dir}")
     
-    # Find all reports
-    impl_reports = find_impl_reports(hls_base_dir)
-    latency_reports = find_latency_reports(hls_base_dir)
-    txt_reports = find_txt_reports(hdlcoder_base_dir)
-    
-    if not impl_reports and not txt_reports:
+    # Find all reports in a single walk, then parse them in parallel
+    with timed_stage('scan'):
+        groups = scan_reports(hls_base_dir, hdlcoder_base_dir)
+
+    if not groups['impl'] and not groups['txt'] and not groups['store'] and not groups['hdlsrc']:
         print("No reports found!")
-        return
+        # Nothing harvested cannot pass a QoR gate
+        return 1 if args.check else 0
 
-    all_resources = {}
-    all_timing = {}
-    all_latency = {}
+    # Merge parsed results in scan order, re-parsing only changed reports
+    with timed_stage('parse'):
+        if args.no_cache:
+            parsed_reports = parse_reports(groups, max_workers=args.workers)
+        else:
+            with ReportCache() as cache:
+                parsed_reports = parse_reports(groups, max_workers=args.workers, cache=cache)
 
-    # Process implementation reports
-    for report_file in impl_reports:
-        impl_name = extract_impl_name(report_file)
-        print(f"Processing implementation: {impl_name}")
-        resource_data, timing_data = parse_impl_report(report_file)
-        all_resources[impl_name] = resource_data
-        all_timing[impl_name] = timing_data
-
-    # Process latency reports
-    for report_file in latency_reports:
-        impl_name = extract_impl_name(report_file)
-        latency = parse_latency_report(report_file)
-        if latency is not None:
-            all_latency[impl_name] = latency
-
-    # Process TXT reports
-    for report_file in txt_reports:
-        impl_name, resource_data, timing_data, latency, project_name = parse_txt_report(report_file)
-        if impl_name:
-            print(f"Processing TXT report: {impl_name}")
-            # Use project name as a suffix to differentiate implementations
-            impl_key = f"{impl_name}"
-            if resource_data:
-                all_resources[impl_key] = resource_data
-            if timing_data:
-                all_timing[impl_key] = timing_data
-            if latency is not None:
-                all_latency[impl_key] = latency
-
-    # Write combined data to TXT file
-    write_report_summary(all_resources, all_timing, all_latency, "fpga_implementation_summary.txt")
-
-    # Create visualizations
-    if all_resources and all_timing:
-        compare_resources(all_resources)
-        compare_timing(all_timing)
-        create_timing_resource_plot(all_resources, all_timing)
+    with timed_stage('summary'):
+        results, all_pipeline, hdl_details = collect_results(parsed_reports, groups['store'])
+    write_outputs(results, all_pipeline, args, hdl_details)
+    all_resources, all_timing, all_latency = results_to_dicts(results)
 
+    if all_resources and all_timing:
         print("\nResource Utilization Summary:")
-        df_resources = pd.DataFrame(all_resources)
-        print(df_resources.round(2))
+        print(resource_frame(all_resources))
         
         print("\nTiming Summary (MHz):")
         df_timing = pd.DataFrame({impl: {k: 1000/v if v > 0 else 0 for k, v in timing.items()}
@@ -439,12 +795,21 @@ def main():
         print(df_timing.round(3))
 
     if all_latency:
-        compare_latency(all_latency)
         print("\nLatency Summary (cycles):")
-        df_latency = pd.Series(all_latency, name='Latency')
-        print(df_latency)
+        print(format_latency_summary(all_latency))
     else:
         print("No latency data was collected from the reports.")
 
+    exit_code = 0
+    if args.write_baseline:
+        write_baseline(results, args.write_baseline)
+    if args.check:
+        print()
+        exit_code = run_check(results, args.check)
+
+    if args.timings:
+        report_timings()
+    return exit_code
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Vectorized emulation of Vitis HLS ap_fixed / ap_ufixed arithmetic.
+
+A FixedFormat is the C++ type, parsed from its declaration:
+
+    ap_fixed<20, 1>                      W=20 bits, I=1 integer bit (incl. sign), F=W-I=19
+    ap_fixed<20, 1, AP_RND, AP_SAT>      quantization and overflow modes (default AP_TRN, AP_WRAP)
+    ap_ufixed<16, 0>                     unsigned
+
+The fifth template parameter N (saturation bits for AP_WRAP_SM / AP_WRAP with
+N > 0) is accepted only as 0, its default; other values raise ValueError
+rather than being emulated as plain wrapping.
+
+quantize() converts float64 to the integer codes the hardware holds
+(value * 2^F after quantization and overflow), the way DataType(double) does
+in the C++ testbench; to_float() maps codes back. Every supported mode is a
+handful of whole-array NumPy operations, so millions of samples convert in
+milliseconds:
+
+    AP_TRN (floor)  AP_TRN_ZERO (toward 0)  AP_RND (half up)  AP_RND_ZERO  AP_RND_MIN_INF
+    AP_RND_INF (half away from 0)  AP_RND_CONV (half to even)
+    AP_WRAP  AP_SAT  AP_SAT_ZERO  AP_SAT_SYM
+
+Scaling by 2^F is exact in float64 and the codes stay exact integers while
+W <= 53 (the float64 mantissa), which covers every DataType in this repo;
+wider types are rejected rather than emulated approximately. Comparisons of
+two values of the same format are comparisons of their codes, so a peak
+picker fed with quantize()d (or fixed_values()) inputs decides exactly like
+the HLS C simulation.
+
+fixed_columns() converts one vector to many formats at once, one column per
+format, for sweeping word lengths in a single batched pass.
+
+Usage:
+    fmt = parse_format('ap_fixed<20, 1>')
+    xcorr_q = fmt.fixed_values(xcorr)    # float64 holding representable values only
+    sweep_q = fixed_columns(xcorr, [FixedFormat(w, 1) for w in range(8, 21)])    # (samples, 13)
+"""
+
+import re
+from collections import namedtuple
+import numpy as np
+
+QUANTIZATION_MODES = ('AP_TRN', 'AP_TRN_ZERO', 'AP_RND', 'AP_RND_ZERO', 'AP_RND_MIN_INF', 'AP_RND_INF', 'AP_RND_CONV')
+OVERFLOW_MODES = ('AP_WRAP', 'AP_SAT', 'AP_SAT_ZERO', 'AP_SAT_SYM')
+# Widest type whose codes are exact in float64
+MAX_WIDTH = 53
+
+FORMAT_RE = re.compile(r'^\s*ap_(u?)fixed\s*<\s*(\d+)\s*,\s*(-?\d+)\s*(?:,\s*(\w+)\s*)?(?:,\s*(\w+)\s*)?(?:,\s*(\d+)\s*)?>\s*$')
+
+def _round(scaled, quantization):
+    """Quantize scaled values (value * 2^F) to integers."""
+    if quantization == 'AP_TRN':
+        return np.floor(scaled)
+    if quantization == 'AP_TRN_ZERO':
+        return np.trunc(scaled)
+    if quantization == 'AP_RND':
+        return np.floor(scaled + 0.5)
+    if quantization == 'AP_RND_ZERO':
+        return np.sign(scaled) * np.ceil(np.abs(scaled) - 0.5)
+    if quantization == 'AP_RND_MIN_INF':
+        return np.ceil(scaled - 0.5)
+    if quantization == 'AP_RND_INF':
+        return np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)
+    return np.rint(scaled)  # AP_RND_CONV: ties to even
+
+def _overflow(scaled, width, low, high, overflow, signed):
+    """Apply an overflow mode to quantized values; width/low/high/signed may be per-column arrays."""
+    if overflow == 'AP_WRAP':
+        return np.mod(scaled - low, 2.0 ** width) + low
+    if overflow == 'AP_SAT':
+        return np.clip(scaled, low, high)
+    if overflow == 'AP_SAT_ZERO':
+        return np.where((scaled < low) | (scaled > high), 0.0, scaled)
+    # AP_SAT_SYM: symmetric range, the most negative code is not used
+    return np.clip(scaled, np.where(signed, -high, low), high)
+
+class FixedFormat(namedtuple('FixedFormat', ['width', 'integer', 'quantization', 'overflow', 'signed'])):
+    """An ap_fixed<W, I, Q, O> (signed) or ap_ufixed (unsigned) type."""
+
+    def __new__(cls, width, integer, quantization='AP_TRN', overflow='AP_WRAP', signed=True):
+        if not 1 <= width <= MAX_WIDTH:
+            raise ValueError(f"Width {width} is outside 1..{MAX_WIDTH} (exact float64 emulation)")
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Unknown quantization mode {quantization}, expected one of {QUANTIZATION_MODES}")
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(f"Unknown overflow mode {overflow}, expected one of {OVERFLOW_MODES}")
+        return super().__new__(cls, width, integer, quantization, overflow, signed)
+
+    def __str__(self):
+        modes = '' if (self.quantization, self.overflow) == ('AP_TRN', 'AP_WRAP') else \
+            f", {self.quantization}, {self.overflow}"
+        return f"ap_{'' if self.signed else 'u'}fixed<{self.width}, {self.integer}{modes}>"
+
+    @property
+    def fraction(self):
+        """Fractional bits F = W - I (negative when I > W)."""
+        return self.width - self.integer
+
+    @property
+    def lsb(self):
+        """Value of one code step, 2^-F."""
+        return 2.0 ** -self.fraction
+
+    @property
+    def code_range(self):
+        """(min, max) code."""
+        if self.signed:
+            return -(1 << (self.width - 1)), (1 << (self.width - 1)) - 1
+        return 0, (1 << self.width) - 1
+
+    def quantize(self, values):
+        """float values -> int64 codes, applying the quantization then the overflow mode."""
+        scaled = _round(np.asarray(values, dtype=np.float64) * 2.0 ** self.fraction, self.quantization)
+        low, high = self.code_range
+        return _overflow(scaled, self.width, low, high, self.overflow, self.signed).astype(np.int64)
+
+    def out_of_range(self, values):
+        """Boolean mask of the values the overflow mode acts on (quantized code outside code_range)."""
+        scaled = _round(np.asarray(values, dtype=np.float64) * 2.0 ** self.fraction, self.quantization)
+        low, high = self.code_range
+        return (scaled < low) | (scaled > high)
+
+    def to_float(self, codes):
+        """int codes -> float64 values."""
+        return np.asarray(codes, dtype=np.float64) * self.lsb
+
+    def fixed_values(self, values):
+        """values as this type holds them: to_float(quantize(values))."""
+        return self.to_float(self.quantize(values))
+
+def parse_format(declaration):
+    """Parse 'ap_fixed<W, I[, Q[, O[, N]]]>' or 'ap_ufixed<...>' into a FixedFormat."""
+    match = FORMAT_RE.match(declaration)
+    if not match:
+        raise ValueError(f"Not an ap_fixed/ap_ufixed declaration: {declaration!r}")
+    unsigned, width, integer, quantization, overflow, saturation_bits = match.groups()
+    if saturation_bits is not None and int(saturation_bits) != 0:
+        raise ValueError(f"{declaration!r}: saturation bits N={saturation_bits} are not emulated (only N=0)")
+    return FixedFormat(int(width), int(integer), quantization or 'AP_TRN', overflow or 'AP_WRAP', not unsigned)
+
+def fixed_columns(values, formats):
+    """Represent a 1-D vector in every format: (len(values), len(formats)) float64.
+
+    Formats sharing quantization and overflow modes are converted together
+    with per-column scale and range arrays.
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(-1, 1)
+    columns = np.empty((len(values), len(formats)))
+    groups = {}
+    for index, fmt in enumerate(formats):
+        groups.setdefault((fmt.quantization, fmt.overflow), []).append(index)
+    for (quantization, overflow), indices in groups.items():
+        group = [formats[index] for index in indices]
+        fraction = np.array([fmt.fraction for fmt in group], dtype=np.float64)
+        width = np.array([fmt.width for fmt in group], dtype=np.float64)
+        low, high = (np.array(bounds, dtype=np.float64) for bounds in zip(*(fmt.code_range for fmt in group)))
+        signed = np.array([fmt.signed for fmt in group])
+        scaled = _round(values * 2.0 ** fraction, quantization)
+        columns[:, indices] = _overflow(scaled, width, low, high, overflow, signed) * 2.0 ** -fraction
+    return columns
@@ -0,0 +1,214 @@
+"""
+Batched dashboard renderer for harvested implementation results.
+
+Each dashboard page is a 2x2 grid of panels for a slice of implementations:
+resource utilization, post-route Fmax against the target (labelled with the
+WNS and the critical path's logic levels and route share when Vivado timing
+reports were found), wall-clock latency
+per buffer (labelled with cycles and sustained Msps), and LUT vs. Fmax (all
+implementations, the page's slice highlighted and the Pareto frontier
+outlined). Figures are built with the object-oriented
+matplotlib.figure.Figure API - no pyplot global state - so pages are
+independent and are rendered in parallel worker processes when writing a
+PNG set. A single multi-page PDF is written from
+the main process, since PdfPages cannot merge pages rendered elsewhere.
+
+Usage:
+    render_dashboard(results, 'fpga_dashboard', fmt='png')   # fpga_dashboard_p1.png, ... (stale pages removed)
+    render_dashboard(results, 'fpga_dashboard', fmt='pdf')   # fpga_dashboard.pdf
+"""
+
+import glob
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from latencyReport import HEADLINE_METRIC, SAMPLES_PER_TRANSACTION
+from resultsStore import LATENCY_COLUMNS, RESOURCE_COLUMNS
+from pareto import pareto_analysis
+
+# Implementations per page before the bar panels paginate
+IMPLS_PER_PAGE = 24
+# Point labels on the scatter panel are only drawn up to this many points
+MAX_SCATTER_LABELS = 40
+
+LATENCY_COLUMN = {label: column for column, (_, label) in LATENCY_COLUMNS.items()}[HEADLINE_METRIC]
+
+def _page_data(results):
+    """Extract the plain arrays a page needs (cheap to send to worker processes)."""
+    post_route_ns = results['post_route_ns']
+    target_ns = results['target_ns']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fmax = np.where(post_route_ns > 0, 1000 / post_route_ns, np.nan)
+        target_mhz = np.where(target_ns > 0, 1000 / target_ns, np.nan)
+        route_share = results['route_delay_ns'] / results['path_delay_ns']
+    resources = {label: results[column] for column, (_, label) in RESOURCE_COLUMNS.items()
+                 if not np.all(np.isnan(results[column]))}
+    return {
+        'implementations': [str(name) for name in results['implementation']],
+        'resources': resources,
+        'fmax': fmax,
+        'target_mhz': target_mhz,
+        'wns': results['wns_ns'],
+        'logic_levels': results['logic_levels'],
+        'route_share': route_share,
+        'latency': results[LATENCY_COLUMN],
+        'latency_us': results['latency_us'],
+        'throughput_msps': results['throughput_msps'],
+        'lut': results['lut'],
+        'bram': results['bram'],
+        'frontier': pareto_analysis(results)['rank'] == 1,
+    }
+
+def _bar_axis(ax, names, title, ylabel):
+    """Common bar-panel decoration."""
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+    ax.set_xticks(np.arange(len(names)))
+    ax.set_xticklabels(names, rotation=45, ha='right', fontsize='small')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+def _draw_resources(ax, names, rows, data):
+    """Grouped resource bars for the page's implementations."""
+    resources = data['resources']
+    width = 0.8 / max(len(resources), 1)
+    x = np.arange(len(names))
+    for i, (label, values) in enumerate(resources.items()):
+        ax.bar(x + (i - (len(resources) - 1) / 2) * width, np.nan_to_num(values[rows]), width, label=label)
+    _bar_axis(ax, names, 'Resource Utilization', 'Resource Count')
+    if resources:
+        ax.legend(title='Resource Type', fontsize='small')
+
+def _draw_timing(ax, names, rows, data):
+    """Post-route Fmax bars with the target clock, labelled with WNS and critical-path shape."""
+    bars = ax.bar(np.arange(len(names)), np.nan_to_num(data['fmax'][rows]), color='green', alpha=0.6,
+                  label='Post-Route')
+    target = data['target_mhz'][rows]
+    if np.any(~np.isnan(target)):
+        ax.axhline(y=np.nanmax(target), color='r', linestyle='--', label='Target')
+    if len(names) <= IMPLS_PER_PAGE:
+        for bar, wns, levels, route in zip(bars, data['wns'][rows], data['logic_levels'][rows],
+                                           data['route_share'][rows]):
+            label = [f'WNS {wns:.3f}' if not np.isnan(wns) else '',
+                     f'{int(levels)} LL, {route:.0%} route' if not np.isnan(levels) else '']
+            ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height(), '\n'.join(filter(None, label)),
+                    ha='center', va='bottom', fontsize='x-small')
+    ax.margins(y=0.12)
+    _bar_axis(ax, names, 'Post-Route Timing', 'Frequency (MHz)')
+    ax.legend(fontsize='small')
+
+def _draw_latency(ax, names, rows, data):
+    """Wall-clock latency bars (at post-route Fmax), labelled with cycles and sustained Msps."""
+    latency_us = data['latency_us'][rows]
+    bars = ax.bar(np.arange(len(names)), np.nan_to_num(latency_us), color='purple', alpha=0.6)
+    if len(names) <= IMPLS_PER_PAGE:
+        for bar, cycles, msps in zip(bars, data['latency'][rows], data['throughput_msps'][rows]):
+            label = [f'{int(cycles)} cyc' if not np.isnan(cycles) else '',
+                     f'{msps:.1f} Msps' if not np.isnan(msps) else '']
+            ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height(), '\n'.join(filter(None, label)),
+                    ha='center', va='bottom', fontsize='x-small')
+    ax.margins(y=0.12)  # room for the two-line labels
+    _bar_axis(ax, names, f'Latency per {SAMPLES_PER_TRANSACTION}-sample buffer', 'Latency (us)')
+
+def _draw_timing_vs_resources(ax, rows, data):
+    """LUT vs. Fmax for all implementations, this page's slice highlighted."""
+    fmax, lut, bram = data['fmax'], data['lut'], data['bram']
+    valid = ~np.isnan(fmax) & ~np.isnan(lut)
+    bram = np.nan_to_num(bram)
+    span = np.ptp(bram[valid]) if np.any(valid) else 0
+    sizes = (bram - bram[valid].min()) * 900 / span + 100 if span else np.full(len(bram), 500.0)
+
+    on_page = np.zeros(len(fmax), dtype=bool)
+    on_page[rows] = True
+    others = valid & ~on_page
+    if np.any(others):
+        ax.scatter(fmax[others], lut[others], s=sizes[others],
+                   alpha=0.2, color='tab:gray', label='Other implementations')
+    ax.scatter(fmax[valid & on_page], lut[valid & on_page], s=sizes[valid & on_page],
+               alpha=0.6, color='tab:blue', label='LUT (circle size = BRAM count)')
+    frontier = valid & data['frontier']
+    if np.any(frontier):
+        ax.scatter(fmax[frontier], lut[frontier], s=sizes[frontier], facecolors='none',
+                   edgecolors='black', linewidths=1.5, label='Pareto frontier')
+    page_points = np.flatnonzero(valid & on_page)
+    if len(page_points) <= MAX_SCATTER_LABELS:
+        for i in page_points:
+            ax.annotate(f"{data['implementations'][i]}\nBRAM: {int(bram[i])}", (fmax[i], lut[i]),
+                        xytext=(5, 5), textcoords='offset points', fontsize='x-small')
+    ax.set_title('Resource Utilization vs Frequency')
+    ax.set_xlabel('Frequency (MHz)')
+    ax.set_ylabel('LUT Count')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize='small')
+
+def build_page(data, page, num_pages, rows):
+    """Build one dashboard page Figure (no pyplot involved)."""
+    from matplotlib.figure import Figure
+
+    names = [data['implementations'][i] for i in rows]
+    fig = Figure(figsize=(16, 11))
+    axes = fig.subplots(2, 2)
+    _draw_resources(axes[0, 0], names, rows, data)
+    _draw_timing(axes[0, 1], names, rows, data)
+    _draw_latency(axes[1, 0], names, rows, data)
+    _draw_timing_vs_resources(axes[1, 1], rows, data)
+    fig.suptitle(f'FPGA Implementation Dashboard - page {page + 1}/{num_pages}')
+    fig.tight_layout()
+    return fig
+
+def _render_png_page(task):
+    """Worker: build and save one PNG page."""
+    data, page, num_pages, rows, output_file = task
+    build_page(data, page, num_pages, rows).savefig(output_file)
+    return output_file
+
+def paginate(num_impls, per_page=IMPLS_PER_PAGE):
+    """Split implementation indices into pages of at most per_page."""
+    num_pages = max(1, math.ceil(num_impls / per_page))
+    return [list(range(p * per_page, min((p + 1) * per_page, num_impls))) for p in range(num_pages)]
+
+def remove_stale_pages(output_prefix, page_count):
+    """Delete <prefix>_p<N>.png pages beyond page_count left by an earlier, longer run."""
+    page_re = re.compile(re.escape(os.path.basename(output_prefix)) + r'_p(\d+)\.png$')
+    removed = []
+    for page_file in glob.glob(f"{glob.escape(output_prefix)}_p*.png"):
+        match = page_re.match(os.path.basename(page_file))
+        if match and int(match.group(1)) > page_count:
+            os.remove(page_file)
+            removed.append(page_file)
+    if removed:
+        print(f"Removed {len(removed)} stale dashboard page(s)")
+    return removed
+
+def render_dashboard(results, output_prefix='fpga_dashboard', fmt='png', max_workers=None,
+                     per_page=IMPLS_PER_PAGE):
+    """Render the dashboard for a results store; returns the written file names."""
+    if not len(results['implementation']):
+        print("No data to visualize")
+        if fmt == 'png':
+            remove_stale_pages(output_prefix, 0)
+        return []
+
+    data = _page_data(results)
+    pages = paginate(len(data['implementations']), per_page)
+
+    if fmt == 'pdf':
+        from matplotlib.backends.backend_pdf import PdfPages
+        output_file = f"{output_prefix}.pdf"
+        with PdfPages(output_file) as pdf:
+            for page, rows in enumerate(pages):
+                pdf.savefig(build_page(data, page, len(pages), rows))
+        print(f"Dashboard saved as '{output_file}' ({len(pages)} pages)")
+        return [output_file]
+
+    tasks = [(data, page, len(pages), rows, f"{output_prefix}_p{page + 1}.png")
+             for page, rows in enumerate(pages)]
+    if len(tasks) == 1 or max_workers == 1:
+        written = list(map(_render_png_page, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(tasks))) as executor:
+            written = list(executor.map(_render_png_page, tasks))
+    remove_stale_pages(output_prefix, len(pages))
+    print(f"Dashboard saved as {', '.join(repr(f) for f in written)}")
+    return written
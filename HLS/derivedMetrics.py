@@ -0,0 +1,57 @@
+"""
+Derived throughput and efficiency metrics for the results store.
+
+Joins cosim latency (cycles) with post-route Fmax to get the figures the
+design is provisioned against, per 6001-sample PSS correlation buffer:
+
+    latency_us         transaction latency / Fmax
+    throughput_msps    samples per interval * Fmax (sustained, back-to-back buffers)
+    cycles_per_sample  interval / samples
+    msps_per_klut      throughput_msps / (LUT / 1000)
+    msps_per_kff       throughput_msps / (FF / 1000)
+
+The transaction latency is the headline Total Execute Time
+(latencyReport.HEADLINE_METRIC, the figure the summary and the QoR gate
+report), else Max Latency; the interval is Avg Interval when cosim measured
+one, else the transaction latency - the same choice as
+latencyReport.samples_per_cycle.
+Everything is computed column-wise over all implementations; missing inputs
+give NaN.
+"""
+
+import numpy as np
+from latencyReport import HEADLINE_METRIC, SAMPLES_PER_TRANSACTION
+
+# Results store column of the headline latency ('Total Execute Time' -> 'total_execute_time')
+HEADLINE_COLUMN = HEADLINE_METRIC.lower().replace(' ', '_')
+
+# column -> (dtype, label)
+DERIVED_COLUMNS = {
+    'latency_us': ('f8', 'Latency (us)'),
+    'throughput_msps': ('f8', 'Throughput (Msps)'),
+    'cycles_per_sample': ('f8', 'Cycles/Sample'),
+    'msps_per_klut': ('f8', 'Msps/kLUT'),
+    'msps_per_kff': ('f8', 'Msps/kFF'),
+}
+
+def _first_valid(*columns):
+    """Element-wise first non-NaN, positive value of several columns."""
+    result = np.full(len(columns[0]), np.nan)
+    for column in columns:
+        take = np.isnan(result) & (column > 0)
+        result[take] = column[take]
+    return result
+
+def derive_metrics(results, samples=SAMPLES_PER_TRANSACTION):
+    """Fill the DERIVED_COLUMNS of a results table in place and return it."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fmax_mhz = np.where(results['post_route_ns'] > 0, 1000 / results['post_route_ns'], np.nan)
+        latency_cycles = _first_valid(results[HEADLINE_COLUMN], results['max_latency'])
+        interval_cycles = _first_valid(results['avg_interval'], latency_cycles)
+
+        results['latency_us'] = latency_cycles / fmax_mhz
+        results['throughput_msps'] = samples / interval_cycles * fmax_mhz
+        results['cycles_per_sample'] = interval_cycles / samples
+        results['msps_per_klut'] = np.where(results['lut'] > 0, results['throughput_msps'] / (results['lut'] / 1000), np.nan)
+        results['msps_per_kff'] = np.where(results['ff'] > 0, results['throughput_msps'] / (results['ff'] / 1000), np.nan)
+    return results
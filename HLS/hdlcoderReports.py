@@ -0,0 +1,270 @@
+"""
+Native parsers for the artifacts HDL Coder leaves in codegen/<design>/hdlsrc.
+
+Both HDL Coder flows are read straight from their generated reports, so an
+HDLCoder variant no longer needs a hand-copied <variant>.txt summary:
+
+    post_synth_report.html          Vivado resources and post-route (or post-synthesis)
+                                    timing, HDL workflow
+    *_vivadosim_log_sim.txt         xsim run of the generated testbench; the $stop
+                                    time over the clock period is the latency in cycles
+    clock_constraint.xdc            target clock period
+    *_syn_results.txt               Vitis HLS log of the HLS workflow: target clock,
+                                    device and HLS-estimated Fmax
+    resource_report.html            HDL Coder's own operator-level estimate
+    *_Industry_report.html          industry-standard compliance counts
+
+Every parser streams its file (HTML through html.parser in fixed-size
+chunks, logs line by line) and returns a partial record; combine_artifacts()
+joins the records of one variant into the same resources / timing (clock
+periods in ns) / latency dicts the Vitis report parsers produce. The
+Post-Route period is the achieved one, requirement - slack (1000 / the
+reported clock frequency), like the "CP achieved" of a Vitis export_impl.rpt.
+
+Usage:
+    kind = artifact_kind('post_synth_report.html')    # None for other files
+    record = parse_hdl_artifact(path)
+    variant = combine_artifacts([record, ...])
+"""
+
+import fnmatch
+import re
+from html.parser import HTMLParser
+from loopQoR import FMAX_RE
+
+# Characters fed to the HTML parser per read
+CHUNK_SIZE = 1 << 16
+
+# Filename pattern -> artifact kind, in precedence order
+ARTIFACT_PATTERNS = {
+    'post_synth_report.html': 'post_synth',
+    'resource_report.html': 'resource_estimate',
+    '*_Industry_report.html': 'compliance',
+    '*_syn_results.txt': 'hls_synthesis',
+    '*_vivadosim_log_sim.txt': 'simulation',
+    'clock_constraint.xdc': 'clock',
+}
+
+# Post-synthesis report resource row -> resource label used by the Vitis parsers
+POST_SYNTH_RESOURCES = {
+    'Slice LUTs': 'LUT',
+    'Slice Registers': 'FF',
+    'DSPs': 'DSP',
+    'Block RAM Tile': 'BRAM',
+    'URAM': 'URAM',
+}
+
+# Summary rows of resource_report.html
+ESTIMATE_LABELS = ('Multipliers', 'Adders/Subtractors', 'Registers', 'Total Register Bits',
+                   'RAMs', 'Multiplexers', 'I/O Bits', 'Shifters')
+
+NS_RE = re.compile(r'(-?[\d.]+)\s*ns')
+MHZ_RE = re.compile(r'([\d.]+)\s*MHz')
+TIMING_FILE_RE = re.compile(r'Parsed timing report file:.*?timing_post_(route|synth)', re.DOTALL)
+COMPLIANCE_RE = re.compile(r'Compliance report with (\d+) errors?, (\d+) warnings?, (\d+) messages?')
+CLOCK_RE = re.compile(r"\[SYN 201-201\] Setting up clock '\w+' with a period of ([\d.]+)ns")
+PART_RE = re.compile(r"\[HLS 200-1611\] Setting target device to '([\w-]+)'")
+XDC_PERIOD_RE = re.compile(r'create_clock\b.*?-period\s+([\d.]+)')
+STOP_RE = re.compile(r'\$stop called at time : ([\d.]+) (ps|ns|us)')
+TEST_RE = re.compile(r'TEST COMPLETED \((PASSED|FAILED)\)')
+
+class _TableCells(HTMLParser):
+    """Collect table rows (as lists of cell text) and the visible text of an HTML report."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self.text = []
+        self._row = None
+        self._cell = None
+        self._skip = 0  # inside <script>/<style>
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip += 1
+        elif tag == 'tr':
+            self._row = []
+        elif tag in ('td', 'th') and self._row is not None:
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self._skip = max(0, self._skip - 1)
+        elif tag in ('td', 'th') and self._cell is not None:
+            self._row.append(' '.join(''.join(self._cell).split()))
+            self._cell = None
+        elif tag == 'tr' and self._row is not None:
+            if self._row:
+                self.rows.append(self._row)
+            self._row = None
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._cell is not None:
+            self._cell.append(data)
+        self.text.append(data)
+
+def _read_html(report_file):
+    """Stream an HTML report through _TableCells; returns (rows, text)."""
+    parser = _TableCells()
+    with open(report_file, 'r', encoding='utf-8', errors='replace') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), ''):
+            parser.feed(chunk)
+    parser.close()
+    return parser.rows, ' '.join(''.join(parser.text).split())
+
+def _to_number(text, pattern=None):
+    """First number in a cell (optionally the group of a unit pattern), or None."""
+    match = (pattern or re.compile(r'(-?[\d.]+)')).search(text)
+    try:
+        return float(match.group(1)) if match else None
+    except ValueError:
+        return None
+
+def artifact_kind(file_name):
+    """Artifact kind of an hdlsrc file name, or None if it is not a parsed report."""
+    for pattern, kind in ARTIFACT_PATTERNS.items():
+        if fnmatch.fnmatchcase(file_name, pattern):
+            return kind
+    return None
+
+def parse_post_synth_report(report_file):
+    """post_synth_report.html -> {'resources': {...}, 'timing': {...}, 'slack_ns': ...}."""
+    rows, text = _read_html(report_file)
+    resources = {}
+    properties = {}
+    for row in rows:
+        if len(row) >= 2 and row[0] in POST_SYNTH_RESOURCES:
+            usage = _to_number(row[1])
+            if usage is not None:
+                resources[POST_SYNTH_RESOURCES[row[0]]] = int(usage)
+        elif len(row) == 2:
+            properties[row[0]] = row[1]
+
+    timing = {}
+    requirement = _to_number(properties.get('Requirement', ''), NS_RE)
+    slack = _to_number(properties.get('Slack', ''), NS_RE)
+    frequency = _to_number(properties.get('Clock Frequency', ''), MHZ_RE)
+    if requirement:
+        timing['Target'] = requirement
+    # The report names the Vivado timing report it summarized
+    stage = TIMING_FILE_RE.search(text)
+    label = 'Post-Synthesis' if stage and stage.group(1) == 'synth' else 'Post-Route'
+    if requirement and slack is not None:
+        timing[label] = round(requirement - slack, 6)
+    elif frequency:
+        timing[label] = 1000 / frequency
+    return {'resources': resources, 'timing': timing, 'slack_ns': slack}
+
+def parse_resource_report(report_file):
+    """resource_report.html -> {'estimates': {summary row: count}}."""
+    rows, _ = _read_html(report_file)
+    estimates = {}
+    for row in rows:
+        if len(row) == 2 and row[0] in ESTIMATE_LABELS and row[0] not in estimates:
+            count = _to_number(row[1])
+            if count is not None:
+                estimates[row[0]] = int(count)
+    return {'estimates': estimates}
+
+def parse_industry_report(report_file):
+    """*_Industry_report.html -> {'compliance': {'errors': n, 'warnings': n, 'messages': n}}."""
+    _, text = _read_html(report_file)
+    match = COMPLIANCE_RE.search(text)
+    if not match:
+        return {}
+    errors, warnings, messages = (int(group) for group in match.groups())
+    return {'compliance': {'errors': errors, 'warnings': warnings, 'messages': messages}}
+
+def _scan_lines(report_file, patterns):
+    """First match of each named pattern in a log, streamed line by line."""
+    found = {}
+    with open(report_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            for name, pattern in patterns.items():
+                if name not in found:
+                    match = pattern.search(line)
+                    if match:
+                        found[name] = match
+            if len(found) == len(patterns):
+                break
+    return found
+
+def parse_syn_results(report_file):
+    """*_syn_results.txt (Vitis HLS log) -> target and HLS-estimated periods and the device."""
+    found = _scan_lines(report_file, {'clock': CLOCK_RE, 'part': PART_RE, 'fmax': FMAX_RE})
+    timing = {}
+    if 'clock' in found:
+        timing['Target'] = float(found['clock'].group(1))
+    if 'fmax' in found and float(found['fmax'].group('fmax')) > 0:
+        timing['HLS Estimate'] = 1000 / float(found['fmax'].group('fmax'))
+    record = {'timing': timing}
+    if 'part' in found:
+        record['part'] = found['part'].group(1)
+    return record
+
+def parse_sim_log(report_file):
+    """*_vivadosim_log_sim.txt -> simulated time (ns) at $stop and the testbench verdict."""
+    found = _scan_lines(report_file, {'stop': STOP_RE, 'test': TEST_RE})
+    record = {}
+    if 'stop' in found:
+        value, unit = found['stop'].groups()
+        record['sim_time_ns'] = float(value) * {'ps': 1e-3, 'ns': 1, 'us': 1e3}[unit]
+    if 'test' in found:
+        record['sim_passed'] = found['test'].group(1) == 'PASSED'
+    return record
+
+def parse_clock_constraint(report_file):
+    """clock_constraint.xdc -> target clock period."""
+    found = _scan_lines(report_file, {'period': XDC_PERIOD_RE})
+    return {'timing': {'Target': float(found['period'].group(1))}} if 'period' in found else {}
+
+ARTIFACT_PARSERS = {
+    'post_synth': parse_post_synth_report,
+    'resource_estimate': parse_resource_report,
+    'compliance': parse_industry_report,
+    'hls_synthesis': parse_syn_results,
+    'simulation': parse_sim_log,
+    'clock': parse_clock_constraint,
+}
+
+def parse_hdl_artifact(report_file):
+    """Parse one hdlsrc artifact into a partial record (see combine_artifacts)."""
+    kind = artifact_kind(report_file.replace('\\', '/').rsplit('/', 1)[-1])
+    try:
+        record = ARTIFACT_PARSERS[kind](report_file)
+    except Exception as e:
+        print(f"Error parsing HDL Coder artifact {report_file}: {e}")
+        record = {}
+    record['kind'] = kind
+    return record
+
+def combine_artifacts(records):
+    """Join the partial records of one variant.
+
+    Returns a dict with 'resources', 'timing' (ns), 'latency' (LATENCY_METRICS
+    subset or None), 'part' ('' if unknown), 'estimates', 'compliance' and
+    'sim_passed'. The xsim $stop time becomes Total Execute Time once a
+    target period is known. Where artifacts disagree the earlier kind in
+    ARTIFACT_PATTERNS wins (the post-synthesis requirement over the .xdc).
+    """
+    order = list(ARTIFACT_PATTERNS.values())
+    variant = {'resources': {}, 'timing': {}, 'latency': None, 'part': '',
+               'estimates': {}, 'compliance': None, 'sim_passed': None}
+    sim_time_ns = None
+    for record in sorted(records, key=lambda record: order.index(record['kind'])):
+        variant['resources'].update(record.get('resources', {}))
+        for label, period in record.get('timing', {}).items():
+            variant['timing'].setdefault(label, period)
+        variant['estimates'].update(record.get('estimates', {}))
+        variant['part'] = variant['part'] or record.get('part', '')
+        for key in ('compliance', 'sim_passed'):
+            if record.get(key) is not None:
+                variant[key] = record[key]
+        sim_time_ns = sim_time_ns or record.get('sim_time_ns')
+
+    target = variant['timing'].get('Target')
+    if sim_time_ns and target:
+        variant['latency'] = {'Total Execute Time': int(round(sim_time_ns / target))}
+    return variant
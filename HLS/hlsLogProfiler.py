@@ -0,0 +1,237 @@
+"""
+Vitis HLS tool-phase runtime and memory profiler.
+
+Streams vitis_hls.log files line by line and collects:
+  - [HLS 200-111] Finished <phase>: CPU user/system time, elapsed time and
+    current allocated memory per synthesis phase
+  - [HLS 200-2161] Finished Command <cmd> elapsed time and memory allocated
+    by the command (older logs report commands through 200-111 as well)
+  - [HLS 200-112] run totals and peak allocated memory
+
+Logs are never loaded whole, so multi-hundred-MB logs are fine.
+
+Usage:
+    python hlsLogProfiler.py [base_dir ...] [--output hls_tool_runtime.txt] [--plot hls_tool_runtime.png]
+"""
+
+import argparse
+import math
+import os
+import re
+from lazyImports import lazy_module
+
+pd = lazy_module('pandas')
+plt = lazy_module('matplotlib.pyplot')
+
+# [HLS 200-111] Finished Scheduling: CPU user time: 0.04 seconds. CPU system time: 0.04 seconds.
+#   Elapsed time: 0.07 seconds; current allocated memory: 674.840 MB.
+PHASE_RE = re.compile(
+    r'\[HLS 200-111\] Finished (?P<phase>.+?):? CPU user time: (?P<cpu_user>[\d.]+) seconds\. '
+    r'CPU system time: (?P<cpu_sys>[\d.]+) seconds\. Elapsed time: (?P<wall>[\d.]+) seconds; '
+    r'current allocated memory: (?P<mem>[\d.]+) MB')
+
+# [HLS 200-2161] Finished Command csim_design Elapsed time: 00:00:03; Allocated memory: 0.297 MB.
+COMMAND_RE = re.compile(
+    r'\[HLS 200-2161\] Finished Command (?P<command>\S+) Elapsed time: (?P<wall>[\d:]+); '
+    r'Allocated memory: (?P<mem>[\d.]+) MB')
+
+# [HLS 200-112] Total CPU user time: 175.5 seconds. Total CPU system time: 17.09 seconds.
+#   Total elapsed time: 248.64 seconds; peak allocated memory: 687.680 MB.
+TOTAL_RE = re.compile(
+    r'\[HLS 200-112\] Total CPU user time: (?P<cpu_user>[\d.]+) seconds\. '
+    r'Total CPU system time: (?P<cpu_sys>[\d.]+) seconds\. Total elapsed time: (?P<wall>[\d.]+) seconds; '
+    r'peak allocated memory: (?P<mem>[\d.]+) MB')
+
+LOG_NAME = 'vitis_hls.log'
+
+def hms_to_seconds(value):
+    """Convert an hh:mm:ss elapsed time to seconds."""
+    seconds = 0
+    for part in value.split(':'):
+        seconds = seconds * 60 + int(part)
+    return float(seconds)
+
+def _add(total, value):
+    """Sum of two figures where NaN means not reported (NaN only if both are)."""
+    return value if math.isnan(total) else total if math.isnan(value) else total + value
+
+def _max(peak, value):
+    """Larger of two figures where NaN means not reported."""
+    return value if math.isnan(peak) else peak if math.isnan(value) else max(peak, value)
+
+def _accumulate(table, key, wall, cpu_user=math.nan, cpu_sys=math.nan, mem=math.nan, mem_label='Peak mem (MB)'):
+    """Add one finished phase/command to a running table; figures a log line lacks stay NaN."""
+    entry = table.setdefault(key, {'Wall (s)': 0.0, 'CPU user (s)': math.nan, 'CPU sys (s)': math.nan,
+                                   mem_label: math.nan, 'Runs': 0})
+    entry['Wall (s)'] += wall
+    entry['CPU user (s)'] = _add(entry['CPU user (s)'], cpu_user)
+    entry['CPU sys (s)'] = _add(entry['CPU sys (s)'], cpu_sys)
+    entry[mem_label] = _max(entry[mem_label], mem)
+    entry['Runs'] += 1
+
+def parse_hls_log(log_file, phases=None, commands=None, totals=None):
+    """Stream a vitis_hls.log and accumulate phase, command and total statistics.
+
+    Existing dicts can be passed in to merge several logs of one variant.
+    Returns (phases, commands, totals) keyed by phase/command name.
+    """
+    phases = {} if phases is None else phases
+    commands = {} if commands is None else commands
+    totals = {} if totals is None else totals
+
+    try:
+        with open(log_file, 'r', errors='replace') as f:
+            for line in f:
+                # Cheap substring filter - the vast majority of lines are Vivado chatter
+                if '[HLS 200-11' not in line and '[HLS 200-2161]' not in line:
+                    continue
+
+                match = PHASE_RE.search(line)
+                if match:
+                    name = match.group('phase')
+                    values = (float(match.group('wall')), float(match.group('cpu_user')),
+                              float(match.group('cpu_sys')), float(match.group('mem')))
+                    if name.startswith('Command '):
+                        _accumulate(commands, name[len('Command '):], *values, mem_label='Mem alloc (MB)')
+                    else:
+                        _accumulate(phases, name, *values)
+                    continue
+
+                match = COMMAND_RE.search(line)
+                if match:
+                    # 200-2161 reports memory allocated by the command, not a peak
+                    _accumulate(commands, match.group('command'), hms_to_seconds(match.group('wall')),
+                                mem=float(match.group('mem')), mem_label='Mem alloc (MB)')
+                    continue
+
+                match = TOTAL_RE.search(line)
+                if match:
+                    _accumulate(totals, 'Total', float(match.group('wall')),
+                                float(match.group('cpu_user')), float(match.group('cpu_sys')),
+                                float(match.group('mem')))
+    except Exception as e:
+        print(f"Error parsing HLS log {log_file}: {e}")
+
+    return phases, commands, totals
+
+def find_hls_logs(base_dirs):
+    """Find vitis_hls.log files and key them by variant.
+
+    The variant is the first directory below the base directory, e.g.
+    HLS/perf_opt3/vitis_hls.log -> perf_opt3 and
+    HDLCoder/opt4_HLS/codegen/peakPicker/hdlsrc/vitis_hls.log -> opt4_HLS.
+    """
+    logs = {}
+    for base_dir in base_dirs:
+        for root, dirs, files in os.walk(base_dir):
+            dirs.sort()
+            if LOG_NAME in files:
+                rel_parts = os.path.relpath(root, base_dir).split(os.sep)
+                variant = rel_parts[0] if rel_parts[0] != '.' else os.path.basename(base_dir)
+                logs.setdefault(variant, []).append(os.path.join(root, LOG_NAME))
+    for variant, files in logs.items():
+        print(f"Found {len(files)} HLS log(s) for {variant}")
+    return logs
+
+def profile_variants(logs):
+    """Parse all logs and return per-variant (phases, commands, totals) DataFrames."""
+    profiles = {}
+    for variant, files in logs.items():
+        phases, commands, totals = {}, {}, {}
+        for log_file in files:
+            parse_hls_log(log_file, phases, commands, totals)
+        profiles[variant] = tuple(_to_frame(table) for table in (phases, commands, totals))
+    return profiles
+
+def _to_frame(table):
+    """Turn an accumulated {name: stats} dict into a DataFrame with integer run counts."""
+    df = pd.DataFrame(table).T
+    return df.astype({'Runs': int}) if not df.empty else df
+
+def command_wall_table(profiles):
+    """Return a commands x variants table of wall-clock seconds."""
+    return pd.DataFrame({variant: commands['Wall (s)'] if not commands.empty else pd.Series(dtype=float)
+                         for variant, (_, commands, _) in profiles.items()})
+
+def write_profile_summary(profiles, output_file="hls_tool_runtime.txt"):
+    """Write per-variant phase/command tables to a TXT file."""
+    with open(output_file, 'w') as f:
+        f.write("===============================================\n")
+        f.write("Vitis HLS Tool Runtime Profile\n")
+        f.write(f"Generated on: {pd.Timestamp.now()}\n")
+        f.write("===============================================\n\n")
+
+        f.write("COMMAND WALL TIME SUMMARY (s):\n")
+        f.write("------------------------------\n")
+        f.write(command_wall_table(profiles).round(2).to_string(na_rep='-'))
+        f.write("\n\n")
+
+        for variant, (phases, commands, totals) in profiles.items():
+            f.write(f"VARIANT: {variant}\n")
+            f.write("-" * (9 + len(variant)) + "\n")
+            for title, df in (('Commands', commands), ('Synthesis phases', phases), ('Run totals', totals)):
+                f.write(f"{title}:\n")
+                f.write(df.round(3).to_string(na_rep='not reported') if not df.empty else "No data available")
+                f.write("\n\n")
+
+        f.write("===============================================\n")
+        f.write("End of Report\n")
+        f.write("===============================================\n")
+
+    print(f"HLS runtime profile written to {output_file}")
+
+def plot_profiles(profiles, output_file="hls_tool_runtime.png"):
+    """Plot where build minutes go: stacked command wall time per variant."""
+    table = command_wall_table(profiles)
+    if table.empty:
+        print("No HLS runtime data to visualize")
+        return
+
+    fig, (ax_cmd, ax_phase) = plt.subplots(1, 2, figsize=(14, 6))
+
+    (table.T / 60.0).plot(kind='bar', stacked=True, ax=ax_cmd, width=0.7)
+    ax_cmd.set_title('Vitis HLS Build Time by Command')
+    ax_cmd.set_xlabel('Implementation')
+    ax_cmd.set_ylabel('Wall Time (minutes)')
+    ax_cmd.legend(title='Command')
+    ax_cmd.tick_params(axis='x', rotation=45)
+    ax_cmd.grid(axis='y', linestyle='--', alpha=0.7)
+
+    phase_table = pd.DataFrame({variant: phases['Wall (s)'] if not phases.empty else pd.Series(dtype=float)
+                                for variant, (phases, _, _) in profiles.items()})
+    if not phase_table.empty:
+        phase_table.T.plot(kind='bar', stacked=True, ax=ax_phase, width=0.7, colormap='tab20')
+        ax_phase.legend(title='Phase', fontsize='small')
+    ax_phase.set_title('csynth_design Phase Wall Time')
+    ax_phase.set_xlabel('Implementation')
+    ax_phase.set_ylabel('Wall Time (s)')
+    ax_phase.tick_params(axis='x', rotation=45)
+    ax_phase.grid(axis='y', linestyle='--', alpha=0.7)
+
+    fig.tight_layout()
+    fig.savefig(output_file)
+    plt.close(fig)
+    print(f"HLS runtime plot saved as '{output_file}'")
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile Vitis HLS tool runtime and memory from vitis_hls.log files')
+    parser.add_argument('base_dirs', nargs='*', default=[os.path.dirname(os.path.abspath(__file__))],
+                        help='Directories to search for vitis_hls.log (default: this HLS directory)')
+    parser.add_argument('--output', default='hls_tool_runtime.txt', help='Summary TXT file')
+    parser.add_argument('--plot', default='hls_tool_runtime.png', help='Runtime plot file')
+    args = parser.parse_args()
+
+    logs = find_hls_logs(args.base_dirs)
+    if not logs:
+        print("No HLS logs found!")
+        return
+
+    profiles = profile_variants(logs)
+    write_profile_summary(profiles, args.output)
+    plot_profiles(profiles, args.plot)
+
+    print("\nCommand Wall Time Summary (s):")
+    print(command_wall_table(profiles).round(2))
+
+if __name__ == "__main__":
+    main()
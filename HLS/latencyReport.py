@@ -0,0 +1,93 @@
+"""
+Shared lat.rpt model for the HLS and HDLCoder report analyzers.
+
+A Vitis cosim lat.rpt looks like:
+    $MAX_LATENCY = "6033"
+    $MIN_LATENCY = "6033"
+    $AVER_LATENCY = "6033"
+    $MAX_THROUGHPUT = "NA"
+    $MIN_THROUGHPUT = "NA"
+    $AVER_THROUGHPUT = "NA"
+    $TOTAL_EXECUTE_TIME = "6033"
+
+The *_THROUGHPUT fields are initiation intervals in cycles (NA when the
+testbench ran a single transaction). All metrics are kept so both tools
+label the same quantity the same way.
+"""
+
+import re
+from lazyImports import lazy_module
+
+pd = lazy_module('pandas')
+
+# Summary row -> (lat.rpt field, meaning)
+LATENCY_METRICS = {
+    'Min Latency': ('MIN_LATENCY', 'best-case cycles from ap_start to ap_done'),
+    'Avg Latency': ('AVER_LATENCY', 'average cycles from ap_start to ap_done'),
+    'Max Latency': ('MAX_LATENCY', 'worst-case cycles from ap_start to ap_done'),
+    'Min Interval': ('MIN_THROUGHPUT', 'best-case cycles between successive transactions'),
+    'Avg Interval': ('AVER_THROUGHPUT', 'average cycles between successive transactions'),
+    'Max Interval': ('MAX_THROUGHPUT', 'worst-case cycles between successive transactions'),
+    'Total Execute Time': ('TOTAL_EXECUTE_TIME', 'cycles for the whole cosim run, all transactions'),
+}
+
+# Metric plotted and compared when only one number is wanted
+HEADLINE_METRIC = 'Total Execute Time'
+
+# Samples in one PSS correlation buffer (pssCorrMagSq_3_in.txt)
+SAMPLES_PER_TRANSACTION = 6001
+
+FIELD_RE = re.compile(r'^\$(\w+)\s*=\s*"([^"]*)"', re.MULTILINE)
+
+def parse_latency_report(report_file):
+    """Parse a lat.rpt into {metric: cycles or None} for every LATENCY_METRICS entry."""
+    try:
+        with open(report_file, 'r') as f:
+            fields = dict(FIELD_RE.findall(f.read()))
+    except Exception as e:
+        print(f"Error parsing latency report {report_file}: {e}")
+        return None
+
+    latency = {}
+    for metric, (field, _) in LATENCY_METRICS.items():
+        try:
+            latency[metric] = int(fields[field])
+        except (KeyError, ValueError):
+            latency[metric] = None  # missing or 'NA'
+
+    if all(value is None for value in latency.values()):
+        return None
+    return latency
+
+def samples_per_cycle(latency, samples=SAMPLES_PER_TRANSACTION):
+    """Per-transaction throughput in samples/cycle.
+
+    Uses the average interval when cosim measured one, otherwise the
+    headline total execute time, otherwise the transaction latency.
+    """
+    for metric in ('Avg Interval', HEADLINE_METRIC, 'Max Latency'):
+        cycles = latency.get(metric)
+        if cycles:
+            return samples / cycles
+    return None
+
+def latency_frame(all_latency):
+    """Return a metrics x implementations DataFrame including Samples/Cycle."""
+    rows = list(LATENCY_METRICS) + ['Samples/Cycle']
+    data = {}
+    for impl, latency in all_latency.items():
+        column = {metric: latency.get(metric) for metric in LATENCY_METRICS}
+        column['Samples/Cycle'] = samples_per_cycle(latency)
+        data[impl] = pd.Series(column, index=rows, dtype=object)
+    return pd.DataFrame(data, index=rows)
+
+def format_latency_summary(all_latency):
+    """Render the latency table plus a legend stating what each row measures."""
+    df = latency_frame(all_latency)
+    df.loc['Samples/Cycle'] = [round(v, 4) if v is not None else None for v in df.loc['Samples/Cycle']]
+    lines = [df.fillna('NA').to_string(), '']
+    for metric, (field, meaning) in LATENCY_METRICS.items():
+        lines.append(f"  {metric}: ${field} - {meaning}")
+    lines.append(f"  Samples/Cycle: {SAMPLES_PER_TRANSACTION} samples / (Avg Interval, else Max Latency, "
+                 f"else Total Execute Time)")
+    return '\n'.join(lines)
@@ -0,0 +1,83 @@
+"""
+Lazy heavy imports and timing instrumentation for the report tools.
+
+pandas and matplotlib dominate start-up time, so the tools bind them to
+proxies that import the real module on first attribute access:
+
+    pd = lazy_module('pandas')
+    plt = lazy_module('matplotlib.pyplot')
+
+matplotlib is always switched to the non-interactive Agg backend before
+pyplot is imported. Each lazy import and each timed_stage() is recorded and
+can be printed with report_timings() in a `python -X importtime`-like layout.
+"""
+
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+
+START_TIME = time.perf_counter()
+
+# module name -> import wall time in microseconds (only imports done lazily)
+IMPORT_TIMES = {}
+# stage name -> wall time in seconds
+STAGE_TIMES = {}
+
+def force_agg():
+    """Select the headless Agg backend before pyplot is imported."""
+    if 'matplotlib.pyplot' in sys.modules:
+        sys.modules['matplotlib.pyplot'].switch_backend('Agg')
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+
+def timed_import(name):
+    """Import a module, recording how long it took if it was not loaded yet."""
+    if name in sys.modules:
+        return sys.modules[name]
+    if name == 'matplotlib.pyplot':
+        force_agg()
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    IMPORT_TIMES[name] = (time.perf_counter() - start) * 1e6
+    return module
+
+class _LazyModule:
+    """Module proxy that imports its target on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = timed_import(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+def lazy_module(name):
+    """Return a proxy for a module that is imported on first use."""
+    return _LazyModule(name)
+
+@contextmanager
+def timed_stage(name):
+    """Record the wall time of a named stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_TIMES[name] = STAGE_TIMES.get(name, 0.0) + time.perf_counter() - start
+
+def report_timings():
+    """Print lazy import times and stage times."""
+    print("\nimport time: self [us] | module")
+    for name, us in IMPORT_TIMES.items():
+        print(f"import time: {us:9.0f} | {name}")
+    print("\nstage time: [ms] | stage")
+    for name, seconds in STAGE_TIMES.items():
+        print(f"stage time: {seconds * 1000:9.1f} | {name}")
+    print(f"stage time: {(time.perf_counter() - START_TIME) * 1000:9.1f} | total (since tool import)")
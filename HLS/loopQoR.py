@@ -0,0 +1,194 @@
+"""
+Loop-level pipeline QoR extraction for Vitis HLS implementations.
+
+Two sources are combined per implementation:
+  - vitis_hls.log, streamed line by line, for the scheduler's verdicts:
+      [HLS 200-1470] Pipelining result : Target II = 1, Final II = 1, Depth = 5, loop 'process_signal'
+      [SCHED 204-65] Unable to satisfy pipeline directive for loop 'ProcessSignal': ...
+      [HLS 200-880/885] The II Violation in module '...' (loop '...'): ...
+      [HLS 200-789] **** Estimated Fmax: 298.78 MHz
+      [HLS 200-626] ... unable to schedule all read ports in the first II cycle ...
+  - solution*/syn/report/csynth.xml, read with ElementTree.iterparse, for
+    per-loop trip count, latency, achieved II and pipeline depth.
+
+A loop is flagged as an II violation when its final II exceeds the target,
+when the pipeline directive could not be applied at all, or when the
+scheduler reported an II violation for it. The first-II read warning
+(200-626) is usually worded for the whole design; it is attached to a loop
+only when the message names one, and is otherwise a design-level flag.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+PIPELINE_RE = re.compile(
+    r"\[HLS 200-1470\] Pipelining result : Target II = (?P<target>\d+), Final II = (?P<final>\d+), "
+    r"Depth = (?P<depth>\d+), (?P<kind>loop|function) '(?P<name>[^']+)'")
+UNSATISFIED_RE = re.compile(
+    r"\[SCHED 204-65\] Unable to satisfy pipeline directive for (?P<kind>loop|function) '(?P<name>[^']+)': "
+    r"(?P<reason>.*?)\.?\s*$")
+II_VIOLATION_RE = re.compile(
+    r"\[HLS 200-88[05]\] The II Violation in module '[^']*' \((?P<kind>loop|function) '(?P<name>[^']+)'\): "
+    r"(?P<reason>[^(]*)")
+FMAX_RE = re.compile(r'\[HLS 200-789\] \*+ Estimated Fmax: (?P<fmax>[\d.]+) MHz')
+FIRST_II_READ_MARKER = '[HLS 200-626]'
+NAMED_LOOP_RE = re.compile(r"(?P<kind>loop|function) '(?P<name>[^']+)'")
+
+# Per-loop fields picked up from csynth.xml SummaryOfLoopLatency
+CSYNTH_LOOP_FIELDS = ('TripCount', 'Latency', 'IterationLatency', 'PipelineII', 'PipelineDepth')
+
+QOR_COLUMNS = ['Kind', 'Target II', 'Final II', 'Depth', 'Trip Count', 'Latency',
+               'II Violation', 'First-II Read Warning', 'Note']
+
+def log_impl_name(log_file):
+    """Implementation name for a vitis_hls.log: the directory it was run from."""
+    path = Path(log_file)
+    for i, part in enumerate(path.parts):
+        if part.startswith('proj_') and i > 0:
+            return path.parts[i-1]
+    return path.parent.name
+
+def _to_int(text):
+    """Convert a report value to int, returning None for 'undef', '-' etc."""
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return None
+
+def parse_hls_log_qor(log_file):
+    """Stream a vitis_hls.log and extract pipelining results and design-level estimates.
+
+    Returns {'loops': {name: {...}}, 'fmax_mhz': float or None,
+             'first_ii_read_warning': bool}; the flag is design-level, for
+    200-626 warnings that name no loop.
+    """
+    loops = {}
+    fmax_mhz = None
+    first_ii_read_warning = False
+
+    try:
+        with open(log_file, 'r', errors='replace') as f:
+            for line in f:
+                if '[HLS 200-' not in line and '[SCHED 204-65]' not in line:
+                    continue
+
+                match = PIPELINE_RE.search(line)
+                if match:
+                    loop = loops.setdefault(match.group('name'), {'Kind': match.group('kind')})
+                    loop['Target II'] = int(match.group('target'))
+                    loop['Final II'] = int(match.group('final'))
+                    loop['Depth'] = int(match.group('depth'))
+                    continue
+
+                match = UNSATISFIED_RE.search(line)
+                if match:
+                    loop = loops.setdefault(match.group('name'), {'Kind': match.group('kind')})
+                    loop['Unsatisfied'] = match.group('reason').strip()
+                    continue
+
+                match = II_VIOLATION_RE.search(line)
+                if match:
+                    loop = loops.setdefault(match.group('name'), {'Kind': match.group('kind')})
+                    loop['II Violation Reason'] = match.group('reason').strip()
+                    continue
+
+                match = FMAX_RE.search(line)
+                if match:
+                    # Later csynth runs in the same log supersede earlier ones
+                    fmax_mhz = float(match.group('fmax'))
+                    continue
+
+                if FIRST_II_READ_MARKER in line:
+                    match = NAMED_LOOP_RE.search(line)
+                    if match:
+                        loop = loops.setdefault(match.group('name'), {'Kind': match.group('kind')})
+                        loop['First-II Read Warning'] = True
+                    else:
+                        first_ii_read_warning = True
+    except Exception as e:
+        print(f"Error parsing HLS log {log_file}: {e}")
+
+    return {'loops': loops, 'fmax_mhz': fmax_mhz, 'first_ii_read_warning': first_ii_read_warning}
+
+def parse_csynth_xml(xml_file):
+    """Incrementally parse csynth.xml for per-loop latency/II/depth and clock estimates.
+
+    Nested loops are keyed by their path below SummaryOfLoopLatency, e.g.
+    'outer/inner'. Returns {'loops': {path: {...}}, 'target_clock_ns': float,
+    'estimated_clock_ns': float, 'part': str}.
+    """
+    loops = {}
+    design = {'target_clock_ns': None, 'estimated_clock_ns': None, 'part': None}
+    path = []
+
+    try:
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            if event == 'start':
+                path.append(elem.tag)
+                continue
+
+            tag = path.pop()
+            text = (elem.text or '').strip()
+
+            if 'SummaryOfLoopLatency' in path:
+                rel = path[path.index('SummaryOfLoopLatency') + 1:]
+                if tag in CSYNTH_LOOP_FIELDS and rel and text:
+                    loops.setdefault('/'.join(rel), {})[tag] = _to_int(text)
+                elif tag == 'max' and len(rel) >= 3 and rel[-1] == 'range' and rel[-2] in CSYNTH_LOOP_FIELDS:
+                    # Variable trip counts are reported as <range><min/><max/></range>
+                    loops.setdefault('/'.join(rel[:-2]), {})[rel[-2]] = _to_int(text)
+            elif tag == 'TargetClockPeriod' and text:
+                design['target_clock_ns'] = float(text)
+            elif tag == 'EstimatedClockPeriod' and text:
+                design['estimated_clock_ns'] = float(text)
+            elif tag == 'Part' and text:
+                design['part'] = text
+
+            elem.clear()
+    except (ET.ParseError, OSError) as e:
+        print(f"Error parsing csynth report {xml_file}: {e}")
+
+    design['loops'] = loops
+    return design
+
+def merge_pipeline_qor(log_qor=None, xml_qor=None):
+    """Join log and csynth.xml loop data into per-loop QoR rows.
+
+    Loops are matched on their leaf name. Returns {'loops': {loop:
+    {QOR_COLUMNS...}}, 'first_ii_read_warning': bool (design-level)}.
+    """
+    log_loops = (log_qor or {}).get('loops', {})
+    xml_loops = (xml_qor or {}).get('loops', {})
+
+    xml_by_leaf = {loop_path.split('/')[-1]: (loop_path, fields) for loop_path, fields in xml_loops.items()}
+    names = list(log_loops) + [loop_path for loop_path in xml_loops
+                               if loop_path.split('/')[-1] not in log_loops]
+
+    rows = {}
+    for name in names:
+        log_fields = log_loops.get(name, {})
+        _, xml_fields = xml_by_leaf.get(name.split('/')[-1], (None, {}))
+
+        target_ii = log_fields.get('Target II')
+        final_ii = log_fields.get('Final II', xml_fields.get('PipelineII'))
+        notes = []
+        if 'Unsatisfied' in log_fields:
+            notes.append(f"pipeline directive not satisfied: {log_fields['Unsatisfied']}")
+        if 'II Violation Reason' in log_fields:
+            notes.append(log_fields['II Violation Reason'])
+        if target_ii is not None and final_ii is not None and final_ii > target_ii:
+            notes.append(f"final II {final_ii} > target II {target_ii}")
+
+        rows[name] = {
+            'Kind': log_fields.get('Kind', 'loop'),
+            'Target II': target_ii,
+            'Final II': final_ii,
+            'Depth': log_fields.get('Depth', xml_fields.get('PipelineDepth')),
+            'Trip Count': xml_fields.get('TripCount'),
+            'Latency': xml_fields.get('Latency'),
+            'II Violation': bool(notes),
+            'First-II Read Warning': bool(log_fields.get('First-II Read Warning')),
+            'Note': '; '.join(notes),
+        }
+    return {'loops': rows, 'first_ii_read_warning': bool((log_qor or {}).get('first_ii_read_warning'))}
@@ -0,0 +1,203 @@
+"""
+Monte Carlo detection performance (Pd / Pfa vs SNR) of the peak picker variants.
+
+Every trial is one pssGenerator frame with one PSS; the peak picker runs on
+the transmitted NID2's correlation with each algorithm variant:
+
+    matlab_origin    xcorr >= threshold, float64        (MATLAB/origin, HLS/origin)
+    hls_perf_opt3    xcorr >  threshold, ap_fixed<20, 1> (perf_opt3 DataType)
+    hdl_coder        xcorr >  threshold, ap_ufixed<14, -7> (HDL Coder ufix14_En21)
+
+A trial is detected when a peak lands within --tolerance samples of the
+ground truth; every other peak is a false alarm. Pfa is false alarms per
+tested sample (frame_length - window_length + 1 candidates per trial), Pd
+detected trials over trials. Sweeping --threshold-factors gives ROC points
+(Pd vs Pfa) at each SNR from the same trials. A noise-only sample clears the
+normalized threshold with probability about exp(-factor * L) (L = FFT size,
+256), so the default sweep runs from 2^-2 down to 2^-8 ~ 1/L, where Pfa is
+measurable; Pd vs SNR is plotted for the first factor.
+
+The fixed-point variants quantize with AP_WRAP, as the kernels do. The
+threshold scales with the received energy (peak_level * (1 + noise power)
+per unit factor), so at low SNR it exceeds ap_ufixed<14, -7>'s 2^-7 range
+and wraps to small values: hdl_coder's high Pd and Pfa at <= -10 dB come
+from those wrapped thresholds, not from the comparator. The 'Out Of Range'
+column gives the fraction of samples whose xcorr or threshold wrapped.
+
+Trials run in tasks of about pssGenerator.BATCH_SAMPLES samples on a process
+pool. Each task generates its own frames from a SeedSequence child keyed by
+(SNR point, task index), so results are reproducible for any worker count
+and no trial data crosses process boundaries; only count arrays come back.
+Aggregates are streamed: each SNR point is printed as soon as its last task
+completes.
+
+Usage:
+    python monteCarlo.py [--snr-db -15 -12 -9 -6 -3 0] [--trials 10000] [--threshold-factors 0.25 0.0625 0.0156]
+                         [--variants matlab_origin hls_perf_opt3] [--workers 8] [--output monte_carlo]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from apFixed import parse_format
+from lazyImports import lazy_module
+from peakpicker import DEFAULT_WINDOW_LENGTH, batch_peak_picker
+from pssGenerator import BATCH_SAMPLES, CHANNELS, DEFAULT_FFT_SIZE, detection_threshold, generate_batch
+
+pd = lazy_module('pandas')
+plt = lazy_module('matplotlib.pyplot')
+
+# variant -> (strict threshold compare, DataType or None for float64)
+VARIANTS = {
+    'matlab_origin': (False, None),
+    'hls_perf_opt3': (True, 'ap_fixed<20, 1>'),
+    'hdl_coder': (True, 'ap_ufixed<14, -7>'),
+}
+DEFAULT_SNR_DB = (-15, -12, -9, -6, -3, 0)
+DEFAULT_FRAME_LENGTH = 2048
+# 2^-2 (pssGenerator's default factor) down to 2^-8 = 1 / DEFAULT_FFT_SIZE
+DEFAULT_THRESHOLD_FACTORS = tuple(2.0 ** -k for k in range(2, 9))
+# Counts returned per (variant, threshold factor)
+DETECTED, FALSE_ALARMS, OUT_OF_RANGE = 0, 1, 2
+
+def _run_trials(task):
+    """One task: (snr index, trials, counts (variants, factors, 3), tested samples)."""
+    snr_index, trials, frame_length, nid2, snr_db, cfo, channel, fft_size, variants, factors, \
+        window_length, tolerance, seed = task
+    xcorr, unit_threshold, truth = generate_batch(trials, frame_length, nid2, snr_db, cfo, channel,
+                                                  fft_size=fft_size, hypotheses=(nid2,), seed=seed)
+    xcorr = xcorr[:, :, 0]
+    counts = np.zeros((len(variants), len(factors), 3), dtype=np.int64)
+    for v, (strict, data_type) in enumerate(variants):
+        fmt = parse_format(data_type) if data_type else None
+        xcorr_v = fmt.fixed_values(xcorr) if fmt else xcorr
+        for f, factor in enumerate(factors):
+            threshold = detection_threshold(unit_threshold, factor)
+            threshold_v = fmt.fixed_values(threshold) if fmt else threshold
+            if fmt:
+                counts[v, f, OUT_OF_RANGE] = np.count_nonzero(fmt.out_of_range(xcorr) | fmt.out_of_range(threshold))
+            # One column per trial
+            locations = batch_peak_picker(xcorr_v.T, threshold_v.T, window_length, strict)
+            trial_of_peak = np.repeat(np.arange(trials), np.diff(locations.offsets))
+            hit = np.abs(locations.values - truth[trial_of_peak]) <= tolerance
+            counts[v, f, DETECTED] = np.count_nonzero(np.bincount(trial_of_peak[hit], minlength=trials))
+            counts[v, f, FALSE_ALARMS] = np.count_nonzero(~hit)
+    tested = trials * (frame_length - window_length + 1)
+    return snr_index, trials, counts, tested
+
+def run_monte_carlo(snr_points, trials, variants, factors, frame_length=DEFAULT_FRAME_LENGTH, nid2=0, cfo=0.0,
+                    channel='awgn', fft_size=DEFAULT_FFT_SIZE, window_length=DEFAULT_WINDOW_LENGTH, tolerance=1,
+                    seed=0, max_workers=None, progress=print):
+    """Run trials per SNR point; returns a DataFrame with one row per (variant, SNR, factor)."""
+    names = list(variants)
+    specs = [VARIANTS[name] for name in names]
+    per_task = max(1, BATCH_SAMPLES // frame_length)
+    tasks = []
+    for snr_index, (snr_db, child) in enumerate(zip(snr_points, np.random.SeedSequence(seed).spawn(len(snr_points)))):
+        sizes = [min(per_task, trials - start) for start in range(0, trials, per_task)]
+        for size, task_seed in zip(sizes, child.spawn(len(sizes))):
+            tasks.append((snr_index, size, frame_length, nid2, snr_db, cfo, channel, fft_size, specs,
+                          list(factors), window_length, tolerance, task_seed))
+
+    counts = np.zeros((len(snr_points), len(names), len(factors), 3), dtype=np.int64)
+    done_trials = np.zeros(len(snr_points), dtype=np.int64)
+    tested = np.zeros(len(snr_points), dtype=np.int64)
+    pending = np.bincount([task[0] for task in tasks], minlength=len(snr_points))
+    start = time.perf_counter()
+
+    def collect(result):
+        snr_index, task_trials, task_counts, task_tested = result
+        counts[snr_index] += task_counts
+        done_trials[snr_index] += task_trials
+        tested[snr_index] += task_tested
+        pending[snr_index] -= 1
+        if pending[snr_index] == 0 and progress:
+            rate = done_trials.sum() / (time.perf_counter() - start)
+            pds = ', '.join(f"{name} {counts[snr_index, v, 0, DETECTED] / done_trials[snr_index]:.3f}"
+                            for v, name in enumerate(names))
+            progress(f"  SNR {snr_points[snr_index]:+6.1f} dB: Pd {pds} (factor {factors[0]:g}); "
+                     f"{rate * 3600:.3g} trials/h")
+
+    if max_workers == 1 or len(tasks) < 2:
+        for task in tasks:
+            collect(_run_trials(task))
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(tasks))) as executor:
+            for future in as_completed([executor.submit(_run_trials, task) for task in tasks]):
+                collect(future.result())
+
+    rows = []
+    for s, snr_db in enumerate(snr_points):
+        for v, name in enumerate(names):
+            for f, factor in enumerate(factors):
+                detected, false_alarms, out_of_range = counts[s, v, f]
+                rows.append({'Variant': name, 'SNR (dB)': snr_db, 'Threshold Factor': factor,
+                             'Trials': int(done_trials[s]), 'Detected': int(detected), 'Pd': detected / done_trials[s],
+                             'False Alarms': int(false_alarms), 'Pfa': false_alarms / tested[s],
+                             'Out Of Range': out_of_range / (done_trials[s] * frame_length)})
+    return pd.DataFrame(rows)
+
+def plot_curves(table, output_file):
+    """Pd vs SNR (first threshold factor) and ROC (Pd vs Pfa over factors) per variant."""
+    fig, (ax_pd, ax_roc) = plt.subplots(1, 2, figsize=(13, 5))
+    first_factor = table['Threshold Factor'].iloc[0]
+    for variant, rows in table.groupby('Variant', sort=False):
+        curve = rows[rows['Threshold Factor'] == first_factor]
+        ax_pd.plot(curve['SNR (dB)'], curve['Pd'], marker='o', label=variant)
+        for snr_db, points in rows.groupby('SNR (dB)'):
+            points = points.sort_values('Pfa')
+            ax_roc.plot(points['Pfa'].clip(lower=1e-12), points['Pd'], marker='.',
+                        label=f"{variant} {snr_db:g} dB")
+    ax_pd.set_xlabel('SNR (dB)')
+    ax_pd.set_ylabel('Pd')
+    ax_pd.set_title(f'Detection probability (threshold factor {first_factor:g})')
+    ax_pd.grid(True, alpha=0.3)
+    ax_pd.legend()
+    ax_roc.set_xscale('log')
+    ax_roc.set_xlabel('Pfa (per sample)')
+    ax_roc.set_ylabel('Pd')
+    ax_roc.set_title('ROC over threshold factors')
+    ax_roc.grid(True, alpha=0.3)
+    ax_roc.legend(fontsize='x-small', ncol=2)
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=150)
+    plt.close(fig)
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo Pd/Pfa of the peak picker variants')
+    parser.add_argument('--snr-db', type=float, nargs='+', default=list(DEFAULT_SNR_DB))
+    parser.add_argument('--trials', type=int, default=10000, help='Trials per SNR point')
+    parser.add_argument('--threshold-factors', type=float, nargs='+', default=list(DEFAULT_THRESHOLD_FACTORS),
+                        help='Detection factors; the first is used for Pd vs SNR (default: 2^-2 .. 2^-8)')
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument('--frame-length', type=int, default=DEFAULT_FRAME_LENGTH, help='Samples per trial')
+    parser.add_argument('--nid2', type=int, choices=(0, 1, 2), default=0)
+    parser.add_argument('--cfo', type=float, default=0.0, help='Carrier frequency offset in subcarrier spacings')
+    parser.add_argument('--channel', choices=CHANNELS, default='awgn')
+    parser.add_argument('--tolerance', type=int, default=1, help='Samples a detection may be off the truth')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--output', default='monte_carlo', help='Output prefix (.csv table, .png curves)')
+    args = parser.parse_args()
+
+    print(f"Monte Carlo: {args.trials} trials x {len(args.snr_db)} SNR points, "
+          f"{len(args.variants)} variant(s), {len(args.threshold_factors)} threshold factor(s)")
+    start = time.perf_counter()
+    table = run_monte_carlo(args.snr_db, args.trials, args.variants, args.threshold_factors, args.frame_length,
+                            args.nid2, args.cfo, args.channel, tolerance=args.tolerance, seed=args.seed,
+                            max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+    total = args.trials * len(args.snr_db)
+    print(f"{total} trials in {elapsed:.1f} s ({total / elapsed * 3600:.3g} trials/h)\n")
+    print(table.to_string(index=False))
+
+    table.to_csv(f"{args.output}.csv", index=False)
+    plot_curves(table, f"{args.output}.png")
+    print(f"\nResults written to {args.output}.csv and {args.output}.png")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Pareto frontier (skyline) and dominance ranks over implementation results.
+
+All objectives are minimized. The results store already keeps every
+objective lower-is-better: resources are counts, timing is the post-route
+clock period (a shorter period is a higher Fmax) and latency is cycles.
+
+Points are processed with the sort-filter-skyline algorithm: after sorting
+by the sum of min-max normalized objectives no point can be dominated by a
+point later in the order, so the first remaining point is always on the
+frontier and one vectorized pass removes everything it dominates. This
+costs O(n * skyline) comparisons on a shrinking candidate set instead of
+all pairs, and handles 10^5 points. Dominance ranks (rank 1 = frontier)
+use the same order with a blocked binary search over the fronts found so far.
+
+Objectives an implementation does not report are NaN. A point only
+dominates another if it reports every objective the other reports, is no
+worse on all of them and better on one; missing objectives are encoded as
++inf and never count as the strict improvement. This is still a strict
+partial order compatible with the sort, so the algorithms above are
+unchanged, and a partially reported point is never ranked behind a point
+on an objective it has no figure for.
+
+Usage:
+    front = pareto_mask(points)           # (n, d) array, minimized
+    ranks = dominance_ranks(points)       # 1 = non-dominated
+    analysis = pareto_analysis(results)   # ranks and dominators per implementation
+"""
+
+import numpy as np
+from resultsStore import LATENCY_COLUMNS, RESOURCE_COLUMNS, TIMING_COLUMNS
+
+# Store columns used as objectives (all lower-is-better)
+OBJECTIVES = ['lut', 'ff', 'bram', 'dsp', 'post_route_ns', 'total_execute_time']
+OBJECTIVE_LABELS = {column: f"min {label}" for column, (_, label) in
+                    {**RESOURCE_COLUMNS, **TIMING_COLUMNS, **LATENCY_COLUMNS}.items()}
+OBJECTIVE_LABELS['post_route_ns'] = 'max Post-Route Fmax'
+
+# Points ranked / matched against the frontier per vectorized step (bounds memory)
+BLOCK_SIZE = 256
+
+def _encode(points):
+    """(n, d) float array with missing (NaN) objectives as +inf."""
+    points = np.array(points, dtype=float)
+    points[np.isnan(points)] = np.inf
+    return points
+
+def _dominates(a, b):
+    """Boolean matrix: a[i] dominates b[j] (<= everywhere, < somewhere b is reported)."""
+    # One objective at a time keeps the temporaries 2-D (much faster than (n, m, d) broadcasts)
+    le = a[:, None, 0] <= b[None, :, 0]
+    lt = a[:, None, 0] < b[None, :, 0]
+    for k in range(1, a.shape[1]):
+        le &= a[:, None, k] <= b[None, :, k]
+        lt |= a[:, None, k] < b[None, :, k]
+    reported = np.isfinite(b)
+    if not reported.all():
+        lt = np.zeros_like(lt)
+        for k in range(a.shape[1]):
+            lt |= (a[:, None, k] < b[None, :, k]) & reported[None, :, k]
+    return le & lt
+
+def _sum_order(points):
+    """Order by the sum of min-max normalized objectives (a dominance-compatible order)."""
+    finite = np.isfinite(points)
+    low = np.where(finite, points, np.inf).min(axis=0)
+    span = np.where(finite, points, -np.inf).max(axis=0) - low
+    low[~np.isfinite(low)] = 0
+    span[~np.isfinite(span) | (span == 0)] = 1
+    # Ties (and rounding) on the sum fall back to lexicographic order, which dominance also respects
+    keys = [points[:, k] for k in reversed(range(points.shape[1]))]
+    return np.lexsort(keys + [((points - low) / span).sum(axis=1)])
+
+def pareto_mask(points):
+    """Return a boolean mask of the non-dominated rows of an (n, d) array to be minimized."""
+    points = _encode(points)
+    mask = np.zeros(len(points), dtype=bool)
+    remaining = _sum_order(points) if len(points) else np.empty(0, dtype=int)
+    while len(remaining):
+        # The first remaining point cannot be dominated: any dominator comes earlier in the
+        # order and is either on the frontier (and already pruned what it dominates) or was
+        # itself pruned by a frontier point that then dominates this one too
+        best = remaining[0]
+        mask[best] = True
+        rest = points[remaining[1:]]
+        dominated = np.all(points[best] <= rest, axis=1) & np.any((points[best] < rest) & np.isfinite(rest), axis=1)
+        remaining = remaining[1:][~dominated]
+    return mask
+
+def dominance_ranks(points, block_size=BLOCK_SIZE):
+    """Non-dominated sorting rank of each row: 1 for the frontier, 2 once it is removed, ...
+
+    Efficient non-dominated sort with binary search over fronts (ENS-BS),
+    vectorized per block of the dominance-compatible order. "Some member of
+    front k dominates p" holds for every k below p's rank and for none from
+    it on, so each block is binary-searched against the fronts found before
+    it, one matrix comparison per (step, probed front). Dominance inside the
+    block is then resolved from a small block x block matrix.
+    """
+    points = _encode(points)
+    ranks = np.zeros(len(points), dtype=int)
+    fronts = []  # member arrays per front, rank k at index k - 1
+    order = _sum_order(points) if len(points) else np.empty(0, dtype=int)
+
+    for start in range(0, len(order), block_size):
+        idx = order[start:start + block_size]
+        block = points[idx]
+
+        # Rank implied by the earlier fronts: binary search, all block points at once
+        lo = np.zeros(len(idx), dtype=int)
+        hi = np.full(len(idx), len(fronts))
+        while np.any(lo < hi):
+            active = np.flatnonzero(lo < hi)
+            mid = (lo[active] + hi[active]) // 2
+            for k in np.unique(mid):
+                probe = active[mid == k]
+                dominated = _dominates(fronts[k], block[probe]).any(axis=0)
+                lo[probe[dominated]] = k + 1
+                hi[probe[~dominated]] = k
+
+        # Dominators inside the block come earlier in it
+        within = _dominates(block, block)
+        block_ranks = lo + 1
+        for j in range(len(idx)):
+            dominators_j = within[:j, j]
+            if dominators_j.any():
+                block_ranks[j] = max(block_ranks[j], block_ranks[:j][dominators_j].max() + 1)
+
+        for k in np.unique(block_ranks):
+            members = block[block_ranks == k]
+            if k > len(fronts):
+                fronts.append(members)
+            else:
+                fronts[k - 1] = np.vstack([fronts[k - 1], members])
+        ranks[idx] = block_ranks
+    return ranks
+
+def dominators(points, ranks, block_size=BLOCK_SIZE):
+    """For each row, the index of one frontier point dominating it (-1 for frontier points)."""
+    points = _encode(points)
+    frontier = np.flatnonzero(ranks == 1)
+    result = np.full(len(points), -1)
+    dominated = np.flatnonzero(ranks > 1)
+    for start in range(0, len(dominated), block_size):
+        idx = dominated[start:start + block_size]
+        # Pick the dominator with the smallest objective sum (the "strongest" one)
+        matrix = _dominates(points[frontier], points[idx])
+        strength = np.where(matrix, np.where(np.isfinite(points[frontier]), points[frontier], 0).sum(axis=1)[:, None],
+                            np.inf)
+        result[idx] = frontier[np.argmin(strength, axis=0)]
+    return result
+
+def pareto_analysis(results, objectives=OBJECTIVES):
+    """Rank the implementations of a results store.
+
+    Each implementation is ranked on the objectives it reports (see the
+    module docstring); objectives no implementation reports are dropped and
+    implementations reporting none of the rest are left unranked (rank 0).
+    Returns a dict with 'objectives' (columns used), 'rank', 'dominated',
+    'dominator' (implementation name or '') and 'missing' (objective
+    columns without a figure) aligned with results['implementation'].
+    """
+    names = results['implementation']
+    used = [column for column in objectives if len(names) and not np.all(np.isnan(results[column]))]
+    points = np.column_stack([results[column] for column in used]) if used else np.full((len(names), 1), np.nan)
+    missing = [[column for column in objectives if np.isnan(results[column][i])] for i in range(len(names))]
+    ranked = ~np.all(np.isnan(points), axis=1)
+
+    ranks = np.zeros(len(names), dtype=int)
+    dominator = np.full(len(names), '', dtype=names.dtype)
+    if ranked.any():
+        idx = np.flatnonzero(ranked)
+        ranks[idx] = dominance_ranks(points[idx])
+        dominator_index = dominators(points[idx], ranks[idx])
+        dominator[idx] = np.where(dominator_index >= 0, names[idx][np.maximum(dominator_index, 0)], '')
+    return {'objectives': used, 'rank': ranks, 'dominated': ranks > 1, 'dominator': dominator, 'missing': missing}
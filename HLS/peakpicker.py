@@ -0,0 +1,358 @@
+"""
+NumPy golden reference of the peak picker (MATLAB/origin/peakPicker.m).
+
+A sample is a peak when it is the middle of a window_length-sample window,
+clears the threshold at its own position and is >= every sample in the
+window:
+
+    for index = 1:length(xcorr)-window_length+1
+        candidate = index + floor(window_length/2)
+        peak if xcorr(candidate) >= threshold(candidate)
+                and xcorr(candidate) >= max(xcorr(index:index+window_length-1))
+
+Instead of MATLAB's serial loop (growing `locations` on every hit) the window
+maxima of the whole vector come from sliding_max() and the peak test is a
+single vectorized comparison. Locations are 1-based
+like the MATLAB and HLS outputs. strict=True uses `>` against the threshold,
+as the HLS variants and MATLAB/perf_opt3 do.
+
+A strided view, sliding_window_view(x, W).max(axis=1), compares every sample
+against the whole window, O(N*W) like the hardware's comparator tree. Except
+for tiny windows sliding_max() uses the van Herk/Gil-Werman algorithm
+instead: the signal is cut into W-sample blocks, a running max is taken forwards and backwards inside each
+block, and every window (which spans at most two blocks) is the max of one
+backward and one forward value - three comparisons per sample for any W.
+Both engines return the same values; --benchmark shows the per-sample cost
+of each for W = 11..4096.
+
+batch_peak_picker() runs every column of a (samples x sequences x antennas
+...) array in one pass: the sliding max works along axis 0 for all columns at
+once and the peaks come back as RaggedLocations, a CSR-style pair of offsets
+(columns + 1) and concatenated 1-based values, so column c is
+values[offsets[c]:offsets[c + 1]]. The threshold is one value per sample
+shared by all columns, as in MATLAB, or an array of xcorr's shape.
+sequence_peak_picker() keeps MATLAB/origin's multi-column rule instead: with
+xcorr(:, seqNumber) holding the NID2 hypotheses, a row is a location when at
+least one sequence clears the threshold and every sequence that does is the
+maximum of its window - one location list per antenna.
+
+To predict HLS C simulation, quantize the inputs to the kernel's DataType
+first (apFixed.parse_format('ap_fixed<20, 1>').fixed_values) and use
+strict=True; every comparison then happens on representable values, exactly
+as in peakPicker.cpp. --data-type does this from the command line and counts
+the samples whose threshold decision the quantization flips.
+
+stream_peak_picker() is the streaming form for traces that do not fit in
+memory: it takes aligned (xcorr, threshold) chunks of any size, keeps the
+last window_length-1 samples of each chunk as state (the hardware's shift
+register) and yields the peaks of every chunk with global 1-based indices.
+Every window is evaluated exactly once, so the concatenated output is
+identical to peak_picker() on the whole array, and memory stays at one chunk
+plus the carry.
+
+Usage:
+    locations = peak_picker(load_vector('pssCorrMagSq_3_in.txt'), load_vector('threshold_in.txt'))
+    for locations in stream_peak_picker(zip(chunked(xcorr, 1 << 20), chunked(threshold, 1 << 20))): ...
+    ragged = batch_peak_picker(xcorr_3x8, threshold)    # xcorr_3x8: (samples, 3, 8); ragged.column((nid2, antenna))
+    python peakpicker.py [--dir origin] [--window-length 11] [--strict] [--chunk-size N]   # exit 1 on mismatch
+    python peakpicker.py --dir perf_opt3 --strict --data-type 'ap_fixed<20, 1>'
+    python peakpicker.py --benchmark    # ns/sample of the sliding-max engines
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+from collections import namedtuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from apFixed import parse_format
+import vectorStore
+
+DEFAULT_WINDOW_LENGTH = 11
+XCORR_FILE = 'pssCorrMagSq_3_in.txt'
+THRESHOLD_FILE = 'threshold_in.txt'
+REFERENCE_FILE = 'locations_3_ref.txt'
+OUTPUT_FILE = 'peakLocs_out.txt'
+
+# 'auto' uses the van Herk/Gil-Werman engine from this window length up (it is
+# already ~2x faster than the strided max at W=5..11 on 1M samples)
+VHGW_MIN_WINDOW = 4
+SLIDING_MAX_ENGINES = ('auto', 'strided', 'vhgw')
+BENCHMARK_WINDOWS = (11, 32, 128, 512, 1024, 4096)
+BENCHMARK_SAMPLES = 1 << 20
+
+class RaggedLocations(namedtuple('RaggedLocations', ['offsets', 'values', 'shape'])):
+    """Per-column 1-based locations: column c is values[offsets[c]:offsets[c + 1]].
+
+    shape is the column shape (xcorr.shape[1:]); columns are numbered in C order.
+    """
+
+    def column(self, index):
+        """Locations of one column, by flat number or by (sequence, antenna, ...) index."""
+        flat = np.ravel_multi_index(index, self.shape) if isinstance(index, tuple) else index
+        return self.values[self.offsets[flat]:self.offsets[flat + 1]]
+
+    def counts(self):
+        """Number of peaks per column, in the column shape."""
+        return np.diff(self.offsets).reshape(self.shape)
+
+def load_vector(path, data_type=None):
+    """Read a test vector as float64: text (MATLAB writematrix layout), HDL Coder .dat (needs
+    data_type), or memory-mapped .npy/.f64 (see vectorStore)."""
+    return vectorStore.load(path, data_type)
+
+def _vhgw_max(x, window_length):
+    """van Herk/Gil-Werman sliding max along axis 0: O(1) per sample, independent of window_length."""
+    n = len(x)
+    blocks = -(-n // window_length)
+    padded = np.full((blocks * window_length,) + x.shape[1:], -np.inf)
+    padded[:n] = x
+    padded = padded.reshape((blocks, window_length) + x.shape[1:])
+    # forward[i]: max from the start of i's block to i; backward[i]: max from i to the end of its block
+    forward = np.maximum.accumulate(padded, axis=1).reshape((-1,) + x.shape[1:])
+    backward = np.maximum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape((-1,) + x.shape[1:])
+    return np.maximum(backward[:n - window_length + 1], forward[window_length - 1:n])
+
+def sliding_max(x, window_length, engine='auto'):
+    """Maximum of every window_length-sample window along axis 0: len(x) - window_length + 1 rows."""
+    if engine not in SLIDING_MAX_ENGINES:
+        raise ValueError(f"Unknown sliding max engine {engine!r}, expected one of {SLIDING_MAX_ENGINES}")
+    if engine == 'vhgw' or (engine == 'auto' and window_length >= VHGW_MIN_WINDOW):
+        return _vhgw_max(x, window_length)
+    return sliding_window_view(x, window_length, axis=0).max(axis=-1)
+
+def _window_tests(xcorr, threshold, window_length, strict, engine):
+    """Threshold and window-max tests of every candidate row (window start + middle).
+
+    xcorr and threshold are (samples, columns); returns two boolean
+    (samples - window_length + 1, columns) arrays.
+    """
+    middle = window_length // 2
+    rows = len(xcorr) - window_length + 1
+    candidates = xcorr[middle:rows + middle]
+    limits = threshold[middle:rows + middle]
+    clears = candidates > limits if strict else candidates >= limits
+    return clears, candidates >= sliding_max(xcorr, window_length, engine)
+
+def _as_columns(xcorr, threshold, window_length):
+    """Validate and flatten batched inputs to (samples, columns) float64, plus the column shape."""
+    xcorr = np.asarray(xcorr, dtype=np.float64)
+    threshold = np.asarray(threshold, dtype=np.float64)
+    if xcorr.ndim == 0:
+        raise ValueError("xcorr must have a sample axis")
+    if window_length < 1:
+        raise ValueError(f"window_length must be positive, got {window_length}")
+    if threshold.ndim == 1 and len(threshold) == len(xcorr):
+        # One threshold per sample, shared by every column
+        threshold = threshold.reshape((-1,) + (1,) * (xcorr.ndim - 1))
+    if threshold.shape[:1] != xcorr.shape[:1]:
+        raise ValueError(f"threshold has shape {threshold.shape}, xcorr has {xcorr.shape}")
+    try:
+        threshold = np.broadcast_to(threshold, xcorr.shape)
+    except ValueError:
+        raise ValueError(f"threshold of shape {threshold.shape} does not broadcast to xcorr {xcorr.shape}") from None
+    columns = int(np.prod(xcorr.shape[1:]))
+    return xcorr.reshape(len(xcorr), columns), threshold.reshape(len(xcorr), columns), xcorr.shape[1:]
+
+def _ragged(is_peak, window_length, shape):
+    """RaggedLocations from a (candidate rows, columns) peak mask."""
+    rows, columns = is_peak.shape
+    flat = np.flatnonzero(is_peak.T)  # column-major, so each column's rows come out together
+    counts = np.bincount(flat // rows, minlength=columns) if rows else np.zeros(columns, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    values = (flat % rows if rows else flat) + window_length // 2 + 1
+    return RaggedLocations(offsets, values.astype(np.int64), shape)
+
+def peak_picker(xcorr, threshold, window_length=DEFAULT_WINDOW_LENGTH, strict=False, engine='auto'):
+    """Return the 1-based locations of the peaks of xcorr (see the module docstring)."""
+    xcorr = np.asarray(xcorr, dtype=np.float64).reshape(-1)
+    threshold = np.asarray(threshold, dtype=np.float64).reshape(-1)
+    if len(threshold) != len(xcorr):
+        raise ValueError(f"threshold has {len(threshold)} samples, xcorr has {len(xcorr)}")
+    if window_length < 1:
+        raise ValueError(f"window_length must be positive, got {window_length}")
+    if len(xcorr) < window_length:
+        return np.empty(0, dtype=np.int64)
+
+    clears, is_max = _window_tests(xcorr, threshold, window_length, strict, engine)
+    # 0-based window start + middle is the candidate; +1 for MATLAB indexing
+    return np.flatnonzero(clears & is_max) + window_length // 2 + 1
+
+def batch_peak_picker(xcorr, threshold, window_length=DEFAULT_WINDOW_LENGTH, strict=False, engine='auto'):
+    """Peaks of every column of xcorr (samples x sequences x antennas ...) in one pass.
+
+    Returns RaggedLocations over xcorr.shape[1:]; each column matches
+    peak_picker() on that column alone.
+    """
+    xcorr, threshold, shape = _as_columns(xcorr, threshold, window_length)
+    if len(xcorr) < window_length:
+        return _ragged(np.zeros((0, xcorr.shape[1]), dtype=bool), window_length, shape)
+    clears, is_max = _window_tests(xcorr, threshold, window_length, strict, engine)
+    return _ragged(clears & is_max, window_length, shape)
+
+def sequence_peak_picker(xcorr, threshold, window_length=DEFAULT_WINDOW_LENGTH, strict=False, engine='auto'):
+    """MATLAB/origin's multi-column rule over axis 1 of xcorr (samples x sequences [x antennas ...]).
+
+    A row is a location when any sequence clears the threshold and all that
+    do are their window's maximum. Returns RaggedLocations over
+    xcorr.shape[2:] (one column, shape (), for a 2-D xcorr).
+    """
+    xcorr = np.asarray(xcorr, dtype=np.float64)
+    if xcorr.ndim < 2:
+        xcorr = xcorr.reshape(-1, 1)
+    sequences = xcorr.shape[1]
+    xcorr, threshold, shape = _as_columns(xcorr, threshold, window_length)
+    antennas = xcorr.shape[1] // sequences
+    if len(xcorr) < window_length:
+        return _ragged(np.zeros((0, antennas), dtype=bool), window_length, shape[1:])
+    clears, is_max = _window_tests(xcorr, threshold, window_length, strict, engine)
+    rows = len(clears)
+    clears = clears.reshape(rows, sequences, antennas)
+    is_max = is_max.reshape(rows, sequences, antennas)
+    is_peak = clears.any(axis=1) & (is_max | ~clears).all(axis=1)
+    return _ragged(is_peak, window_length, shape[1:])
+
+def threshold_flips(xcorr, threshold, data_type, strict=False):
+    """1-based samples whose xcorr-vs-threshold decision differs between float64 and data_type (a FixedFormat)."""
+    xcorr = np.asarray(xcorr, dtype=np.float64)
+    threshold = np.asarray(threshold, dtype=np.float64)
+    xcorr_q, threshold_q = data_type.fixed_values(xcorr), data_type.fixed_values(threshold)
+    if strict:
+        flipped = (xcorr > threshold) != (xcorr_q > threshold_q)
+    else:
+        flipped = (xcorr >= threshold) != (xcorr_q >= threshold_q)
+    return np.flatnonzero(flipped.reshape(len(xcorr), -1).any(axis=1)) + 1
+
+def chunked(x, chunk_size):
+    """Yield successive chunk_size-sample views of an array (or np.memmap)."""
+    for start in range(0, len(x), chunk_size):
+        yield x[start:start + chunk_size]
+
+def read_text_chunks(path, chunk_size):
+    """Yield float64 chunks of a one-value-per-line text vector without reading it whole."""
+    with open(path, 'r') as f:
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                return
+            yield np.array([float(line) for line in lines if line.strip()], dtype=np.float64)
+
+def stream_peak_picker(chunks, window_length=DEFAULT_WINDOW_LENGTH, strict=False, engine='auto'):
+    """Peak-pick a stream of aligned (xcorr_chunk, threshold_chunk) pairs.
+
+    Yields one int64 array of global 1-based locations per input chunk
+    (possibly empty). Chunks may be any length, including shorter than the
+    window; window_length-1 samples are carried across chunk boundaries.
+    """
+    carry = window_length - 1
+    xcorr_tail = np.empty(0, dtype=np.float64)
+    threshold_tail = np.empty(0, dtype=np.float64)
+    offset = 0  # global 0-based index of xcorr_tail[0]
+    for xcorr_chunk, threshold_chunk in chunks:
+        xcorr_chunk = np.asarray(xcorr_chunk, dtype=np.float64).reshape(-1)
+        threshold_chunk = np.asarray(threshold_chunk, dtype=np.float64).reshape(-1)
+        if len(xcorr_chunk) != len(threshold_chunk):
+            raise ValueError(f"Unaligned chunk: {len(xcorr_chunk)} xcorr vs {len(threshold_chunk)} threshold samples")
+        xcorr_buffer = np.concatenate([xcorr_tail, xcorr_chunk])
+        threshold_buffer = np.concatenate([threshold_tail, threshold_chunk])
+        yield peak_picker(xcorr_buffer, threshold_buffer, window_length, strict, engine) + offset
+
+        # Keep the samples of the windows that are not complete yet
+        keep = min(carry, len(xcorr_buffer))
+        offset += len(xcorr_buffer) - keep
+        xcorr_tail = xcorr_buffer[len(xcorr_buffer) - keep:]
+        threshold_tail = threshold_buffer[len(threshold_buffer) - keep:]
+
+def benchmark_sliding_max(samples=BENCHMARK_SAMPLES, windows=BENCHMARK_WINDOWS, seed=0):
+    """Time each explicit engine per window length; returns (window, engine, ns_per_sample) rows."""
+    x = np.random.default_rng(seed).random(samples)
+    rows = []
+    for window_length in windows:
+        expected = None
+        for engine in SLIDING_MAX_ENGINES[1:]:
+            start = time.perf_counter()
+            result = sliding_max(x, window_length, engine)
+            elapsed = time.perf_counter() - start
+            if expected is None:
+                expected = result
+            elif not np.array_equal(result, expected):
+                raise AssertionError(f"{engine} sliding max differs from strided at W={window_length}")
+            rows.append((window_length, engine, elapsed / samples * 1e9))
+    return rows
+
+def write_locations(locations, path):
+    """Write locations one per line, like the MATLAB testbench's writematrix."""
+    np.savetxt(path, np.asarray(locations, dtype=np.int64).reshape(-1, 1), fmt='%d')
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Run the NumPy peak picker on a variant\'s test vectors')
+    parser.add_argument('--dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'origin'),
+                        help=f'Directory holding {XCORR_FILE}, {THRESHOLD_FILE} and {REFERENCE_FILE}')
+    parser.add_argument('--window-length', type=int, default=DEFAULT_WINDOW_LENGTH)
+    parser.add_argument('--strict', action='store_true', help='Require xcorr > threshold (HLS variants)')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='Locations output file')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='Stream the vectors in chunks of this many samples instead of loading them whole')
+    parser.add_argument('--engine', choices=SLIDING_MAX_ENGINES, default='auto',
+                        help=f'Sliding max engine (auto: vhgw from W={VHGW_MIN_WINDOW})')
+    parser.add_argument('--data-type', type=parse_format, default=None,
+                        help="Quantize the inputs to this HLS type first, e.g. 'ap_fixed<20, 1>' or "
+                             "'ap_fixed<20, 1, AP_RND, AP_SAT>'")
+    parser.add_argument('--benchmark', action='store_true',
+                        help=f'Time the sliding max engines on {BENCHMARK_SAMPLES} samples for W={BENCHMARK_WINDOWS}')
+    return parser.parse_args()
+
+def main():
+    args = parse_arguments()
+    if args.benchmark:
+        print(f"{'W':>6}  {'engine':<8} ns/sample")
+        for window_length, engine, ns_per_sample in benchmark_sliding_max():
+            print(f"{window_length:>6}  {engine:<8} {ns_per_sample:9.2f}")
+        return 0
+
+    xcorr_file = os.path.join(args.dir, XCORR_FILE)
+    threshold_file = os.path.join(args.dir, THRESHOLD_FILE)
+
+    # Quantization is elementwise, so chunks can be converted independently
+    quantize = args.data_type.fixed_values if args.data_type else (lambda values: values)
+    start = time.perf_counter()
+    if args.chunk_size:
+        # Only one chunk of each vector (plus the carry) is held at a time
+        lengths = []
+        def chunks():
+            for xcorr_chunk, threshold_chunk in zip(read_text_chunks(xcorr_file, args.chunk_size),
+                                                    read_text_chunks(threshold_file, args.chunk_size)):
+                lengths.append(len(xcorr_chunk))
+                yield quantize(xcorr_chunk), quantize(threshold_chunk)
+        locations = np.concatenate([np.empty(0, dtype=np.int64)] +
+                                   list(stream_peak_picker(chunks(), args.window_length, args.strict, args.engine)))
+        samples = sum(lengths)
+    else:
+        xcorr = load_vector(xcorr_file)
+        threshold = load_vector(threshold_file)
+        samples = len(xcorr)
+        locations = peak_picker(quantize(xcorr), quantize(threshold), args.window_length, args.strict, args.engine)
+    elapsed = time.perf_counter() - start
+    write_locations(locations, args.output)
+    print(f"{len(locations)} peak(s) in {samples} samples "
+          f"({samples / elapsed / 1e6:.1f} Msps); locations written to {args.output}")
+    if args.data_type and not args.chunk_size:
+        flips = threshold_flips(xcorr, threshold, args.data_type, args.strict)
+        print(f"{args.data_type}: {len(flips)} threshold decision(s) differ from float64"
+              + (f" (first at sample {flips[0]})" if len(flips) else ''))
+
+    reference_file = os.path.join(args.dir, REFERENCE_FILE)
+    if not os.path.exists(reference_file):
+        return 0
+    reference = load_vector(reference_file).astype(np.int64)
+    if np.array_equal(locations, reference):
+        print('Test passed: The output matches the reference output.')
+        return 0
+    print('Test failed: The output does not match the reference output.')
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
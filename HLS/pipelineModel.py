@@ -0,0 +1,249 @@
+"""
+Cycle-approximate transaction-level model of the streaming peak picker loop.
+
+perf_opt3's process_signal loop (II=1, depth 5) shifts the window, reads one
+xcorr/threshold pair if `!xcorrStream.empty() && !thresholdStream.empty()`,
+and writes a location when the window's middle sample is a peak. The model
+steps through its iterations and tracks:
+
+    input FIFO     a producer pushes sample k at its arrival cycle, or once the FIFO
+                   (fifo_depth entries) has room; the kernel can read it fifo_latency
+                   cycles later (0: a sample arriving at cycle t is read at t)
+    iteration i    issues II cycles after iteration i-1 (plus any stall)
+                     conditional read (perf_opt3): reads only if a sample is visible,
+                     otherwise the window shifts in a copy of its newest sample
+                     blocking read (perf_opt2): stalls until the sample is visible
+    output FIFO    a peak is written depth-1 cycles after its iteration issues; a full
+                   FIFO (output_fifo_depth entries, drained one per drain_interval
+                   cycles) stalls the pipeline
+
+xcorr and threshold are assumed to arrive together. Total latency is
+the issue cycle of the last iteration + depth + FIXED_OVERHEAD (the ap_ctrl
+handshake and buffer init, calibrated on perf_opt3's 6033 cycles), which
+matches the csynth/cosim figure when every sample is already waiting. Given
+the data, the model also returns the locations the kernel would emit: with
+conditional reads and late samples these differ from the reference.
+
+Whole-array kernels (perf_opt1 buffers the signal in BRAM first) are
+sequences of loops, each (trip - 1) * II + depth cycles; LOOP_PRESETS holds
+the three variants. II and depth come from the vitis_hls.log pipelining
+result (--log); for loops that were not pipelined it holds no figure, and
+the presets use the iteration latency implied by the reported cosim
+latency.
+
+Usage:
+    result = simulate_process_signal(arrival_cycles('periodic:2', 6001), 6001, ii=1, depth=5)
+    python pipelineModel.py [--arrival burst|periodic:P|random:p|file:cycles.txt] [--read-mode conditional]
+                            [--ii 1] [--depth 5] [--fifo-depth 2] [--log perf_opt3/vitis_hls.log] [--dir perf_opt3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+import numpy as np
+from loopQoR import parse_hls_log_qor
+from peakpicker import DEFAULT_WINDOW_LENGTH, REFERENCE_FILE, THRESHOLD_FILE, XCORR_FILE, load_vector
+
+# Cycles outside process_signal (start handshake, init_buffers, ap_done), from perf_opt3: 6033 - (6000 + 5)
+FIXED_OVERHEAD = 28
+READ_MODES = ('conditional', 'blocking')
+DEFAULT_SIGNAL_LENGTH = 6001
+LOOP_NAMES = ('process_signal', 'ProcessSignal')
+
+# variant -> [(loop, trip count ('N' samples or 'N-W+1' windows), II, depth)]
+LOOP_PRESETS = {
+    'perf_opt1': [('InputRead', 'N', 1, 2), ('ProcessSignal', 'N-W+1', 51, 51)],
+    'perf_opt2': [('process_signal', 'N', 36, 36)],
+    'perf_opt3': [('process_signal', 'N', 1, 5)],
+}
+
+def loop_latency(trip_count, ii, depth):
+    """Cycles of a loop whose iterations issue every II cycles: (trip - 1) * II + depth."""
+    return (trip_count - 1) * ii + depth if trip_count > 0 else 0
+
+def preset_latency(variant, signal_length=DEFAULT_SIGNAL_LENGTH, window_length=DEFAULT_WINDOW_LENGTH):
+    """Latency of a LOOP_PRESETS variant with every sample already available."""
+    trips = {'N': signal_length, 'N-W+1': signal_length - window_length + 1}
+    return sum(loop_latency(trips[trip], ii, depth) for _, trip, ii, depth in LOOP_PRESETS[variant]) + FIXED_OVERHEAD
+
+def arrival_cycles(spec, count, seed=0):
+    """Arrival cycle of each input sample from a pattern spec.
+
+    burst          every sample waits from cycle 0
+    periodic:P     one sample every P cycles
+    random:p       a sample arrives in each cycle with probability p
+    file:path      one cycle per line
+    """
+    kind, _, value = spec.partition(':')
+    if kind == 'burst':
+        return np.zeros(count, dtype=np.int64)
+    if kind == 'periodic':
+        return np.arange(count, dtype=np.int64) * int(value or 1)
+    if kind == 'random':
+        gaps = np.random.default_rng(seed).geometric(float(value), count)
+        return np.cumsum(gaps) - gaps[0]
+    if kind == 'file':
+        return np.loadtxt(value, dtype=np.int64, ndmin=1)[:count]
+    raise ValueError(f"Unknown arrival pattern {spec!r} (burst, periodic:P, random:p, file:path)")
+
+def simulate_process_signal(arrivals, signal_length=None, ii=1, depth=5, fifo_depth=2, read_mode='conditional',
+                            output_fifo_depth=2, drain_interval=1, fifo_latency=0, window_length=DEFAULT_WINDOW_LENGTH,
+                            xcorr=None, threshold=None):
+    """Step through the process_signal iterations (see the module docstring).
+
+    Returns a dict with 'latency' (cycles incl. FIXED_OVERHEAD), 'issue'
+    (cycle of each iteration), 'reads' (sample read per iteration, -1 for
+    none), 'stall_cycles', 'missed_reads', 'unread_samples' and, when
+    xcorr/threshold are given, 'locations' and 'output_cycles'.
+    """
+    if read_mode not in READ_MODES:
+        raise ValueError(f"Unknown read mode {read_mode!r}, expected one of {READ_MODES}")
+    arrivals = np.asarray(arrivals, dtype=np.int64)
+    signal_length = len(arrivals) if signal_length is None else signal_length
+    with_data = xcorr is not None and threshold is not None
+    if with_data:
+        xcorr = np.asarray(xcorr, dtype=np.float64).tolist()
+        threshold = np.asarray(threshold, dtype=np.float64).tolist()
+    middle = window_length // 2
+
+    pops = []                       # cycle each sample left the input FIFO
+    issue = np.empty(signal_length, dtype=np.int64)
+    reads = np.full(signal_length, -1, dtype=np.int64)
+    window = deque([0.0] * window_length, maxlen=window_length)
+    limits = deque([0.0] * window_length, maxlen=window_length)
+    output_pops = deque()           # drain cycles of the entries still in the output FIFO
+    last_drain = -drain_interval
+    locations, output_cycles = [], []
+    cycle, stall_cycles, next_sample = 0, 0, 0
+
+    def visible_at(sample):
+        # The producer can only push once the FIFO has room
+        pushed = arrivals[sample]
+        if sample >= fifo_depth:
+            pushed = max(pushed, pops[sample - fifo_depth] + 1)
+        return pushed + fifo_latency
+
+    for index in range(signal_length):
+        if index:
+            cycle += ii
+        available = next_sample < len(arrivals)
+        if available and read_mode == 'blocking':
+            ready = visible_at(next_sample)
+            if ready > cycle:
+                stall_cycles += ready - cycle
+                cycle = ready
+        elif available:
+            available = visible_at(next_sample) <= cycle
+        if available:
+            pops.append(cycle)
+            reads[index] = next_sample
+            if with_data:
+                window.appendleft(xcorr[next_sample])
+                limits.appendleft(threshold[next_sample])
+            next_sample += 1
+        elif with_data:
+            # Shifted buffers without a read: element 0 keeps its value
+            window.appendleft(window[0])
+            limits.appendleft(limits[0])
+        issue[index] = cycle
+
+        if with_data and index >= window_length - 1:
+            mid = window[middle]
+            if mid > limits[middle] and mid >= max(window):
+                write = cycle + depth - 1
+                while output_pops and output_pops[0] <= write:
+                    output_pops.popleft()
+                if len(output_pops) >= output_fifo_depth:
+                    # Blocking write into a full FIFO stalls the whole pipeline
+                    stall = output_pops[0] - write
+                    stall_cycles += stall
+                    cycle += stall
+                    write += stall
+                    output_pops.popleft()
+                last_drain = max(write + 1, last_drain + drain_interval)
+                output_pops.append(last_drain)
+                locations.append(index - middle + 1)
+                output_cycles.append(write)
+
+    result = {
+        'latency': int(issue[-1]) + depth + FIXED_OVERHEAD if signal_length else FIXED_OVERHEAD,
+        'issue': issue,
+        'reads': reads,
+        'stall_cycles': stall_cycles,
+        'missed_reads': int(np.count_nonzero(reads < 0)),
+        'unread_samples': len(arrivals) - next_sample,
+    }
+    if with_data:
+        result['locations'] = np.array(locations, dtype=np.int64)
+        result['output_cycles'] = np.array(output_cycles, dtype=np.int64)
+    return result
+
+def loop_from_log(log_file, loop_names=LOOP_NAMES):
+    """(II, depth) of the pipelined process_signal loop in a vitis_hls.log, or None."""
+    loops = parse_hls_log_qor(log_file)['loops']
+    for name in loop_names:
+        loop = loops.get(name, {})
+        if 'Final II' in loop:
+            return loop['Final II'], loop['Depth']
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Predict peak picker latency and output timing without synthesis')
+    parser.add_argument('--arrival', default='burst', help='burst, periodic:P, random:p or file:path')
+    parser.add_argument('--read-mode', choices=READ_MODES, default='conditional')
+    parser.add_argument('--ii', type=int, default=None, help='process_signal II (default: from --log, else 1)')
+    parser.add_argument('--depth', type=int, default=None, help='Pipeline depth (default: from --log, else 5)')
+    parser.add_argument('--log', default=None, help='vitis_hls.log to take II and depth from')
+    parser.add_argument('--fifo-depth', type=int, default=2, help='Input stream FIFO depth')
+    parser.add_argument('--output-fifo-depth', type=int, default=2, help='Location stream FIFO depth')
+    parser.add_argument('--drain-interval', type=int, default=1, help='Cycles between location stream reads')
+    parser.add_argument('--signal-length', type=int, default=None, help='Iterations (default: samples in --dir)')
+    parser.add_argument('--dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perf_opt3'),
+                        help='Test vectors to run through the model')
+    parser.add_argument('--fifo-latency', type=int, default=0, help='Cycles from a push until the sample can be read')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    ii, depth = 1, 5
+    if args.log:
+        found = loop_from_log(args.log)
+        if found:
+            ii, depth = found
+        else:
+            print(f"No pipelined process_signal loop in {args.log}; using II={ii}, depth={depth}")
+    ii = args.ii or ii
+    depth = args.depth or depth
+
+    xcorr = load_vector(os.path.join(args.dir, XCORR_FILE))
+    threshold = load_vector(os.path.join(args.dir, THRESHOLD_FILE))
+    signal_length = args.signal_length or len(xcorr)
+    arrivals = arrival_cycles(args.arrival, len(xcorr), args.seed)
+
+    start = time.perf_counter()
+    result = simulate_process_signal(arrivals, signal_length, ii, depth, args.fifo_depth, args.read_mode,
+                                     args.output_fifo_depth, args.drain_interval, args.fifo_latency, xcorr=xcorr, threshold=threshold)
+    elapsed = time.perf_counter() - start
+
+    print(f"process_signal: II={ii}, depth={depth}, {args.read_mode} reads, input FIFO {args.fifo_depth}, "
+          f"arrival {args.arrival}")
+    print(f"  Total latency:  {result['latency']} cycles ({elapsed * 1e3:.1f} ms to model)")
+    print(f"  Stall cycles:   {result['stall_cycles']}")
+    print(f"  Missed reads:   {result['missed_reads']} iteration(s) without a sample, "
+          f"{result['unread_samples']} sample(s) never read")
+    for location, cycle in zip(result['locations'], result['output_cycles']):
+        print(f"  Peak at {location} written at cycle {cycle}")
+
+    print("\nPreset latencies (all samples waiting):")
+    for variant in LOOP_PRESETS:
+        print(f"  {variant:<10} {preset_latency(variant, len(xcorr)):>8} cycles")
+
+    reference_file = os.path.join(args.dir, REFERENCE_FILE)
+    if os.path.exists(reference_file):
+        matches = np.array_equal(result['locations'], load_vector(reference_file).astype(np.int64))
+        print(f"\nLocations {'match' if matches else 'DIFFER from'} {reference_file}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Synthetic 5G NR PSS correlation test vectors for the peak picker.
+
+Each frame carries one PSS of the chosen NID2 at a random offset, passed
+through the channel and buried in noise:
+
+    d_PSS(n) = 1 - 2 x((n + 43 NID2) mod 127)       TS 38.211 7.4.2.2, x(i+7) = x(i+4) + x(i) mod 2
+    pss      = IFFT of d_PSS on subcarriers -63..63 of an fft_size grid, unit mean power
+    rx       = g * pss * exp(j 2 pi cfo n / fft_size) + CN(0, 10^(-SNR/10))
+               g = 1 (awgn) or CN(0, 1) per frame (rayleigh, flat)
+
+and the three NID2 hypotheses are correlated against it with one FFT per
+batch:
+
+    xcorr[n, h]  = |sum_k rx[n - L + 1 + k] conj(pss_h[k])|^2            (L = fft_size)
+    threshold[n] = max(factor * L * sum_{m=n-L+1..n} |rx[m]|^2, floor)
+
+i.e. a normalized-correlation detector: the peak of a clean PSS is L^2 and
+clears the threshold when factor * (1 + noise power) < 1. Both are scaled by
+peak_level / L^2 so a clean peak lands near the repo's vector (0.005) and
+fits the HDL Coder ufix14_En21 codes; the floor is the repo's 2^-16. The
+ground-truth location is the 1-based index of the PSS's last sample, kept
+EDGE_GUARD samples clear of the frame end so that a peak picker window can
+still be centred on it.
+
+Frames are generated in batches of about BATCH_SAMPLES samples, each from its
+own SeedSequence child, so the output does not depend on how the batches are
+spread over the worker processes.
+
+write_vectors() lays the frames out back to back as one stream in the files
+the testbenches read: pssCorrMagSq_3_in.txt (the transmitted NID2's
+hypothesis), threshold_in.txt, locations_3_ref.txt (the reference peak
+picker on the stream) and locations_truth.txt, plus xcorr.dat / threshold.dat
+and .npy copies (pssCorrMagSq_all.npy holds all three hypotheses) on request.
+
+Usage:
+    vectors = generate_vectors(frames=100, frame_length=6001, nid2=1, snr_db=-3, cfo=0.1, seed=1)
+    python pssGenerator.py --output-dir vectors/snr-3 --frames 1000 --snr-db -3 [--channel rayleigh]
+                           [--cfo 0.1] [--formats txt dat npy] [--workers 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from apFixed import parse_format
+from peakpicker import DEFAULT_WINDOW_LENGTH, REFERENCE_FILE, THRESHOLD_FILE, XCORR_FILE, peak_picker
+import vectorStore
+
+PSS_LENGTH = 127
+NID2_VALUES = (0, 1, 2)
+DEFAULT_FFT_SIZE = 256
+DEFAULT_FRAME_LENGTH = 6001
+DEFAULT_THRESHOLD_FACTOR = 0.25
+DEFAULT_PEAK_LEVEL = 0.005
+MIN_THRESHOLD = 2.0 ** -16
+# Samples between the last PSS sample and the frame end (half a peak picker window)
+EDGE_GUARD = DEFAULT_WINDOW_LENGTH // 2
+CHANNELS = ('awgn', 'rayleigh')
+# Samples generated per task (frames are not split across batches)
+BATCH_SAMPLES = 1 << 20
+DEFAULT_DAT_TYPE = 'ap_ufixed<14, -7>'
+TRUTH_FILE = 'locations_truth.txt'
+ALL_HYPOTHESES_FILE = 'pssCorrMagSq_all.npy'
+FORMATS = ('txt', 'dat', 'npy')
+
+def pss_sequence(nid2):
+    """BPSK PSS d_PSS(0..126) for NID2 in 0..2."""
+    x = np.zeros(PSS_LENGTH, dtype=np.int64)
+    x[:7] = [0, 1, 1, 0, 1, 1, 1]  # x(0)..x(6)
+    for i in range(PSS_LENGTH - 7):
+        x[i + 7] = (x[i + 4] + x[i]) % 2
+    return 1 - 2 * x[(np.arange(PSS_LENGTH) + 43 * nid2) % PSS_LENGTH]
+
+def pss_waveform(nid2, fft_size=DEFAULT_FFT_SIZE):
+    """Time-domain PSS symbol (no cyclic prefix), unit mean power."""
+    grid = np.zeros(fft_size, dtype=np.complex128)
+    grid[(np.arange(PSS_LENGTH) - PSS_LENGTH // 2) % fft_size] = pss_sequence(nid2)
+    waveform = np.fft.ifft(grid)
+    return waveform / np.sqrt(np.mean(np.abs(waveform) ** 2))
+
+def detection_threshold(unit_threshold, factor=DEFAULT_THRESHOLD_FACTOR):
+    """Threshold for a detection factor from the factor-1, unfloored threshold."""
+    return np.maximum(factor * unit_threshold, MIN_THRESHOLD)
+
+def generate_batch(frames, frame_length, nid2, snr_db, cfo=0.0, channel='awgn', peak_level=DEFAULT_PEAK_LEVEL,
+                   fft_size=DEFAULT_FFT_SIZE, hypotheses=NID2_VALUES, seed=None):
+    """One batch of frames, correlated against the given NID2 hypotheses only.
+
+    Returns (xcorr (frames, samples, len(hypotheses)), unit threshold
+    (frames, samples; see detection_threshold), truth (frames,)).
+    """
+    rng = np.random.default_rng(seed)
+    length = fft_size
+    noise_power = 10.0 ** (-snr_db / 10)
+    rx = rng.standard_normal((frames, frame_length)) + 1j * rng.standard_normal((frames, frame_length))
+    rx *= np.sqrt(noise_power / 2)
+
+    offsets = rng.integers(0, frame_length - length - EDGE_GUARD + 1, frames)
+    gain = np.ones(frames, dtype=np.complex128) if channel == 'awgn' else \
+        (rng.standard_normal(frames) + 1j * rng.standard_normal(frames)) / np.sqrt(2)
+    positions = offsets[:, None] + np.arange(length)
+    rotation = np.exp(2j * np.pi * cfo * positions / fft_size)
+    rx[np.arange(frames)[:, None], positions] += gain[:, None] * pss_waveform(nid2, fft_size) * rotation
+
+    # One forward FFT of rx, one inverse per hypothesis
+    size = 1 << (frame_length + length - 2).bit_length()
+    spectrum = np.fft.fft(rx, size, axis=1)
+    scale = peak_level / length ** 2
+    xcorr = np.empty((frames, frame_length, len(hypotheses)))
+    for column, hypothesis in enumerate(hypotheses):
+        reference = np.fft.fft(np.conj(pss_waveform(hypothesis, fft_size)[::-1]), size)
+        xcorr[:, :, column] = np.abs(np.fft.ifft(spectrum * reference, axis=1)[:, :frame_length]) ** 2 * scale
+
+    energy = np.cumsum(np.abs(rx) ** 2, axis=1)
+    energy[:, length:] -= energy[:, :-length].copy()
+    return xcorr, length * energy * scale, offsets + length
+
+def _generate_batch(task):
+    """generate_batch() for the process pool, with the detection factor applied."""
+    frames, frame_length, nid2, snr_db, cfo, channel, factor, peak_level, fft_size, seed = task
+    xcorr, unit_threshold, truth = generate_batch(frames, frame_length, nid2, snr_db, cfo, channel, peak_level,
+                                                  fft_size, seed=seed)
+    return xcorr, detection_threshold(unit_threshold, factor), truth
+
+def generate_vectors(frames, frame_length=DEFAULT_FRAME_LENGTH, nid2=0, snr_db=10.0, cfo=0.0, channel='awgn',
+                     threshold_factor=DEFAULT_THRESHOLD_FACTOR, peak_level=DEFAULT_PEAK_LEVEL,
+                     fft_size=DEFAULT_FFT_SIZE, seed=0, max_workers=None):
+    """Generate frames (see the module docstring).
+
+    Returns {'xcorr': (frames, frame_length, 3), 'threshold': (frames, frame_length),
+    'truth': (frames,) 1-based locations within each frame}.
+    """
+    if nid2 not in NID2_VALUES:
+        raise ValueError(f"NID2 must be one of {NID2_VALUES}, got {nid2}")
+    if channel not in CHANNELS:
+        raise ValueError(f"Unknown channel {channel!r}, expected one of {CHANNELS}")
+    if frame_length < fft_size + EDGE_GUARD:
+        raise ValueError(f"frame_length {frame_length} is shorter than the PSS ({fft_size} samples) "
+                         f"plus the {EDGE_GUARD}-sample edge guard")
+
+    per_batch = max(1, BATCH_SAMPLES // frame_length)
+    sizes = [min(per_batch, frames - start) for start in range(0, frames, per_batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(size, frame_length, nid2, snr_db, cfo, channel, threshold_factor, peak_level, fft_size, child)
+             for size, child in zip(sizes, seeds)]
+    if max_workers == 1 or len(tasks) < 2:
+        batches = list(map(_generate_batch, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count() or 1, len(tasks))) as executor:
+            batches = list(executor.map(_generate_batch, tasks))
+    if not batches:
+        return {'xcorr': np.empty((0, frame_length, len(NID2_VALUES))),
+                'threshold': np.empty((0, frame_length)), 'truth': np.empty(0, dtype=np.int64)}
+    xcorr, threshold, truth = (np.concatenate(parts) for parts in zip(*batches))
+    return {'xcorr': xcorr, 'threshold': threshold, 'truth': truth}
+
+def write_vectors(vectors, output_dir, nid2=0, formats=('txt',), dat_type=None):
+    """Write the frames back to back as one stream in the testbench file layout; returns the files."""
+    os.makedirs(output_dir, exist_ok=True)
+    frames, frame_length = vectors['threshold'].shape
+    xcorr = vectors['xcorr'][:, :, nid2].reshape(-1)
+    threshold = vectors['threshold'].reshape(-1)
+    truth = vectors['truth'] + np.arange(frames) * frame_length
+    reference = peak_picker(xcorr, threshold)
+    written = []
+
+    def save(values, name, data_type=None):
+        path = os.path.join(output_dir, name)
+        vectorStore.save(values, path, data_type)
+        written.append(path)
+
+    if 'txt' in formats:
+        save(xcorr, XCORR_FILE)
+        save(threshold, THRESHOLD_FILE)
+    if 'dat' in formats:
+        data_type = dat_type or parse_format(DEFAULT_DAT_TYPE)
+        save(xcorr, 'xcorr.dat', data_type)
+        save(threshold, 'threshold.dat', data_type)
+    if 'npy' in formats:
+        save(xcorr, os.path.splitext(XCORR_FILE)[0] + '.npy')
+        save(threshold, os.path.splitext(THRESHOLD_FILE)[0] + '.npy')
+        save(vectors['xcorr'].reshape(-1, len(NID2_VALUES)), ALL_HYPOTHESES_FILE)
+    np.savetxt(os.path.join(output_dir, REFERENCE_FILE), reference.reshape(-1, 1), fmt='%d')
+    np.savetxt(os.path.join(output_dir, TRUTH_FILE), truth.reshape(-1, 1), fmt='%d')
+    written += [os.path.join(output_dir, REFERENCE_FILE), os.path.join(output_dir, TRUTH_FILE)]
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate NR PSS correlation test vectors for the peak picker')
+    parser.add_argument('--output-dir', default='pss_vectors', help='Directory for the test vector files')
+    parser.add_argument('--frames', type=int, default=1, help='Frames, each with one PSS')
+    parser.add_argument('--frame-length', type=int, default=DEFAULT_FRAME_LENGTH, help='Samples per frame')
+    parser.add_argument('--nid2', type=int, choices=NID2_VALUES, default=0)
+    parser.add_argument('--snr-db', type=float, default=10.0)
+    parser.add_argument('--cfo', type=float, default=0.0, help='Carrier frequency offset in subcarrier spacings')
+    parser.add_argument('--channel', choices=CHANNELS, default='awgn')
+    parser.add_argument('--threshold-factor', type=float, default=DEFAULT_THRESHOLD_FACTOR)
+    parser.add_argument('--fft-size', type=int, default=DEFAULT_FFT_SIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=['txt'])
+    parser.add_argument('--dat-type', type=parse_format, default=None,
+                        help=f"Fixed-point format of the .dat codes (default {DEFAULT_DAT_TYPE})")
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    vectors = generate_vectors(args.frames, args.frame_length, args.nid2, args.snr_db, args.cfo, args.channel,
+                               args.threshold_factor, fft_size=args.fft_size, seed=args.seed,
+                               max_workers=args.workers)
+    generated = time.perf_counter()
+    written = write_vectors(vectors, args.output_dir, args.nid2, args.formats, args.dat_type)
+    elapsed = time.perf_counter() - start
+    # End to end: the files are the product, so writing them counts against the rate
+    samples = args.frames * args.frame_length
+    print(f"{args.frames} frame(s), {samples} samples x {len(NID2_VALUES)} hypotheses in {elapsed:.2f} s "
+          f"({samples / elapsed / 1e6:.1f} Msps; {generated - start:.2f} s generating, "
+          f"{elapsed - (generated - start):.2f} s writing {' '.join(args.formats)})")
+    for path in written:
+        print(f"  {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+QoR regression gate: compare harvested results against a committed baseline.
+
+The baseline is a JSON file of per-implementation metric values plus
+per-metric tolerances ('*' is the default):
+
+    {
+      "tolerances": {"*": {"abs": 0, "rel": 0.0}, "lut": {"rel": 0.05}},
+      "implementations": {
+        "perf_opt3": {"fmax_mhz": 300, "total_execute_time": 6033}
+      }
+    }
+
+Metrics are results store columns plus fmax_mhz (post-route). A metric
+regresses when it is worse than the baseline by more than
+max(abs, rel * |baseline|); throughput-like metrics (fmax_mhz and the
+derived Msps columns) and the slacks (wns_ns, tns_ns) are higher-is-better,
+everything else lower-is-better.
+Baseline implementations or metrics missing from the results fail the gate;
+implementations without a baseline are reported as NEW and do not. A metric
+is IMPROVED once it beats the baseline by more than its tolerance (and 0.1%).
+
+Usage:
+    python analyzeReports.py --check qor_baseline.json           # exit 1 on regression
+    python analyzeReports.py --write-baseline qor_baseline.json  # (re)record the current values
+"""
+
+import json
+import math
+import os
+import numpy as np
+from resultsStore import SCHEMA, STRING_COLUMNS
+
+HIGHER_IS_BETTER = {'fmax_mhz', 'throughput_msps', 'msps_per_klut', 'msps_per_kff', 'wns_ns', 'tns_ns'}
+CHECK_METRICS = {column for column in SCHEMA if column not in STRING_COLUMNS} | {'fmax_mhz'}
+
+# Metrics recorded by --write-baseline when the baseline does not list its own
+DEFAULT_GATED_METRICS = ['lut', 'ff', 'dsp', 'bram', 'fmax_mhz', 'total_execute_time']
+DEFAULT_TOLERANCE = {'abs': 0.0, 'rel': 0.0}
+# A metric only counts as IMPROVED when it beats the baseline by more than this (relative)
+IMPROVEMENT_MARGIN = 0.001
+
+def load_baseline(baseline_file):
+    """Load and validate a baseline file."""
+    with open(baseline_file, 'r') as f:
+        baseline = json.load(f)
+    baseline.setdefault('tolerances', {})
+    baseline.setdefault('implementations', {})
+    for impl, metrics in baseline['implementations'].items():
+        unknown = set(metrics) - CHECK_METRICS
+        if unknown:
+            raise ValueError(f"{baseline_file}: unknown metric(s) for {impl}: {', '.join(sorted(unknown))}")
+    return baseline
+
+def metric_values(results, metric):
+    """Column values for a gated metric (fmax_mhz is derived from the post-route period)."""
+    if metric == 'fmax_mhz':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(results['post_route_ns'] > 0, 1000 / results['post_route_ns'], np.nan)
+    return results[metric]
+
+def tolerance(baseline, metric):
+    """Allowed slack for a metric: {'abs': ..., 'rel': ...}."""
+    tol = dict(DEFAULT_TOLERANCE)
+    tol.update(baseline['tolerances'].get('*', {}))
+    tol.update(baseline['tolerances'].get(metric, {}))
+    return tol
+
+def check_results(results, baseline):
+    """Compare results against a baseline.
+
+    Returns a list of (status, implementation, metric, baseline, current, limit)
+    rows; status is FAIL, MISSING, PASS, IMPROVED or NEW.
+    """
+    names = [str(name) for name in results['implementation']]
+    index = {name: i for i, name in enumerate(names)}
+    rows = []
+
+    for impl, metrics in baseline['implementations'].items():
+        if impl not in index:
+            rows.append(('MISSING', impl, '-', None, None, None))
+            continue
+        for metric, expected in metrics.items():
+            current = metric_values(results, metric)[index[impl]]
+            tol = tolerance(baseline, metric)
+            slack = max(tol['abs'], tol['rel'] * abs(expected))
+            margin = max(slack, IMPROVEMENT_MARGIN * abs(expected))
+            if metric in HIGHER_IS_BETTER:
+                limit = expected - slack
+                regressed, improved = current < limit, current > expected + margin
+            else:
+                limit = expected + slack
+                regressed, improved = current > limit, current < expected - margin
+            if np.isnan(current):
+                status = 'MISSING'
+            elif regressed:
+                status = 'FAIL'
+            else:
+                status = 'IMPROVED' if improved else 'PASS'
+            rows.append((status, impl, metric, expected, None if np.isnan(current) else float(current), limit))
+
+    for impl in names:
+        if impl not in baseline['implementations']:
+            rows.append(('NEW', impl, '-', None, None, None))
+    return rows
+
+def format_check(rows, baseline_file):
+    """Compact diff of the check rows, failures first."""
+    order = {'FAIL': 0, 'MISSING': 1, 'IMPROVED': 2, 'NEW': 3, 'PASS': 4}
+    lines = [f"QoR CHECK against {baseline_file}:"]
+    for status, impl, metric, expected, current, limit in sorted(rows, key=lambda row: order[row[0]]):
+        if metric == '-':
+            note = 'not in results' if status == 'MISSING' else 'no baseline'
+            lines.append(f"  {status:<8} {impl:<16} {note}")
+            continue
+        bound = '>=' if metric in HIGHER_IS_BETTER else '<='
+        current_text = 'n/a' if current is None else f"{current:.6g}"
+        change = '' if current is None or not expected else f" ({(current - expected) / abs(expected):+.1%})"
+        lines.append(f"  {status:<8} {impl:<16} {metric:<20} {expected:.6g} -> {current_text}{change}"
+                     f"  [{bound} {limit:.6g}]")
+    failed = sum(row[0] in ('FAIL', 'MISSING') for row in rows)
+    lines.append(f"{'FAILED' if failed else 'PASSED'}: {failed} regression(s), "
+                 f"{sum(row[0] == 'PASS' for row in rows)} pass, "
+                 f"{sum(row[0] == 'IMPROVED' for row in rows)} improved, "
+                 f"{sum(row[0] == 'NEW' for row in rows)} new")
+    return '\n'.join(lines)
+
+def run_check(results, baseline_file):
+    """Print the check against baseline_file; returns the exit code (0 pass, 1 regression)."""
+    rows = check_results(results, load_baseline(baseline_file))
+    print(format_check(rows, baseline_file))
+    return 1 if any(row[0] in ('FAIL', 'MISSING') for row in rows) else 0
+
+def _baseline_value(metric, value):
+    """Round to 3 decimals towards the worse side, so the recorded run itself passes."""
+    if value == int(value):
+        return int(value)
+    return (math.floor if metric in HIGHER_IS_BETTER else math.ceil)(value * 1000) / 1000
+
+def write_baseline(results, baseline_file):
+    """Record the current values as the baseline, keeping tolerances and per-implementation metric lists."""
+    baseline = load_baseline(baseline_file) if os.path.exists(baseline_file) else {
+        'tolerances': {'*': dict(DEFAULT_TOLERANCE)}, 'implementations': {}}
+    for i, impl in enumerate(str(name) for name in results['implementation']):
+        metrics = list(baseline['implementations'].get(impl, DEFAULT_GATED_METRICS))
+        values = {metric: float(metric_values(results, metric)[i]) for metric in metrics}
+        baseline['implementations'][impl] = {metric: _baseline_value(metric, value)
+                                             for metric, value in values.items() if not np.isnan(value)}
+    with open(baseline_file, 'w') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+    print(f"Baseline written to {baseline_file}")
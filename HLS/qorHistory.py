@@ -0,0 +1,247 @@
+"""
+Historical QoR database for the report analyzers.
+
+Every analysis run appends its results table to a SQLite history, one value
+per (run, series), where a series is one (variant, metric, part, clock), with
+the git commit the reports were produced from. Metrics are the numeric resultsStore columns (lut, ff,
+..., post_route_ns, total_execute_time, ...); all of them are
+lower-is-better, so a regression is always an increase. Unknown parts are
+stored as '' and unknown clocks as 0.
+
+The qor table is keyed by (series_id, run_id), so a trend line is one range
+scan and "worst regression since X" is two index seeks per series; both stay
+in the milliseconds over months of nightly runs.
+
+Usage:
+    python qorHistory.py runs
+    python qorHistory.py trend perf_opt3 post_route_ns [--part xc7k410t-ffg900-2] [--clock 256]
+    python qorHistory.py regressions --since <commit or YYYY-MM-DD> [--metric lut] [--limit 20]
+"""
+
+import argparse
+import datetime
+import os
+import sqlite3
+import subprocess
+import numpy as np
+from lazyImports import lazy_module
+from resultsStore import LATENCY_COLUMNS, RESOURCE_COLUMNS, TIMING_COLUMNS
+
+pd = lazy_module('pandas')
+
+DEFAULT_HISTORY_FILE = 'qor_history.sqlite'
+
+# Stored metrics: every numeric store column except the clock, which is part of the key
+METRIC_COLUMNS = [column for column in {**RESOURCE_COLUMNS, **TIMING_COLUMNS, **LATENCY_COLUMNS}
+                  if column != 'clock_mhz']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_time   TEXT    NOT NULL,
+    git_commit TEXT    NOT NULL,
+    dirty      INTEGER NOT NULL,
+    tool       TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_git_commit ON runs (git_commit);
+CREATE INDEX IF NOT EXISTS runs_run_time ON runs (run_time);
+CREATE TABLE IF NOT EXISTS series (
+    id        INTEGER PRIMARY KEY,
+    variant   TEXT    NOT NULL,
+    metric    TEXT    NOT NULL,
+    part      TEXT    NOT NULL,
+    clock_mhz REAL    NOT NULL,
+    flow      TEXT    NOT NULL,
+    UNIQUE (variant, metric, part, clock_mhz)
+);
+CREATE TABLE IF NOT EXISTS qor (
+    series_id INTEGER NOT NULL REFERENCES series (id),
+    run_id    INTEGER NOT NULL REFERENCES runs (id),
+    value     REAL    NOT NULL,
+    PRIMARY KEY (series_id, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS qor_run_id ON qor (run_id);
+"""
+
+def git_commit(path='.'):
+    """Return (commit sha, dirty) of the git checkout containing path, ('unknown', False) outside git."""
+    try:
+        sha = subprocess.run(['git', '-C', path, 'rev-parse', 'HEAD'], capture_output=True,
+                             text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', '-C', path, 'status', '--porcelain', '--untracked-files=no'],
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return sha, bool(status.strip())
+
+class QorHistory:
+    """SQLite-backed history of analysis runs."""
+
+    def __init__(self, db_path=DEFAULT_HISTORY_FILE):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Commit pending writes and close the database."""
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def record_run(self, results, tool, commit='unknown', dirty=False, run_time=None):
+        """Append a results table as a new run; returns the run id."""
+        run_time = run_time or datetime.datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (run_time, git_commit, dirty, tool) VALUES (?, ?, ?, ?)",
+                (run_time, commit, int(dirty), tool)).lastrowid
+            rows = []
+            for i, variant in enumerate(results['implementation']):
+                clock = results['clock_mhz'][i]
+                key = (str(variant), str(results['part'][i]), 0.0 if np.isnan(clock) else round(float(clock), 3))
+                for metric in METRIC_COLUMNS:
+                    value = results[metric][i]
+                    if not np.isnan(value):
+                        rows.append((self._series_id(key[0], metric, key[1], key[2], str(results['flow'][i])),
+                                     run_id, float(value)))
+            self.conn.executemany("INSERT INTO qor (series_id, run_id, value) VALUES (?, ?, ?)", rows)
+        return run_id
+
+    def _series_id(self, variant, metric, part, clock_mhz, flow):
+        """Id of a (variant, metric, part, clock) series, created on first use."""
+        row = self.conn.execute(
+            "SELECT id FROM series WHERE variant = ? AND metric = ? AND part = ? AND clock_mhz = ?",
+            (variant, metric, part, clock_mhz)).fetchone()
+        if row is not None:
+            return row[0]
+        return self.conn.execute(
+            "INSERT INTO series (variant, metric, part, clock_mhz, flow) VALUES (?, ?, ?, ?, ?)",
+            (variant, metric, part, clock_mhz, flow)).lastrowid
+
+    def runs(self, limit=20):
+        """Most recent runs as (id, run_time, git_commit, dirty, tool) rows, newest first."""
+        return self.conn.execute(
+            "SELECT id, run_time, git_commit, dirty, tool FROM runs ORDER BY id DESC LIMIT ?",
+            (limit,)).fetchall()
+
+    def trend(self, variant, metric, part=None, clock_mhz=None):
+        """Trend line of one metric: (run_time, git_commit, part, clock_mhz, value) rows, oldest first."""
+        query = ("SELECT r.run_time, r.git_commit, s.part, s.clock_mhz, q.value "
+                 "FROM series s JOIN qor q ON q.series_id = s.id JOIN runs r ON r.id = q.run_id "
+                 "WHERE s.variant = ? AND s.metric = ?")
+        params = [variant, metric]
+        if part is not None:
+            query += " AND s.part = ?"
+            params.append(part)
+        if clock_mhz is not None:
+            query += " AND s.clock_mhz = ?"
+            params.append(round(clock_mhz, 3))
+        return self.conn.execute(query + " ORDER BY q.run_id", params).fetchall()
+
+    def resolve_run(self, since):
+        """Last run at or before `since`: a git commit (prefix) or an ISO date/time."""
+        row = self.conn.execute(
+            "SELECT MAX(id) FROM runs WHERE git_commit LIKE ?", (since + '%',)).fetchone()
+        if row[0] is None:
+            try:
+                datetime.datetime.fromisoformat(since)
+            except ValueError:
+                raise ValueError(f"'{since}' is neither a recorded commit nor an ISO date")
+            # Dates compare as text against the ISO run times; a bare date means its whole day
+            until = since + 'T23:59:59' if len(since) == 10 else since
+            row = self.conn.execute("SELECT MAX(id) FROM runs WHERE run_time <= ?", (until,)).fetchone()
+        if row[0] is None:
+            raise ValueError(f"No run recorded on or before {since}")
+        return row[0]
+
+    def worst_regressions(self, since, metric=None, limit=10):
+        """Largest relative increases from the baseline run `since` to each series' latest value.
+
+        Returns (variant, metric, part, clock_mhz, baseline, latest, change, latest_commit)
+        rows, worst first. Series that did not exist at the baseline are skipped.
+        """
+        base_run = self.resolve_run(since)
+        metric_filter = " WHERE s.metric = :metric" if metric else ""
+        query = f"""
+            WITH ends AS (
+                SELECT s.*,
+                       (SELECT run_id FROM qor WHERE series_id = s.id
+                        ORDER BY run_id DESC LIMIT 1) AS latest_run,
+                       (SELECT value FROM qor WHERE series_id = s.id
+                        ORDER BY run_id DESC LIMIT 1) AS latest,
+                       (SELECT value FROM qor WHERE series_id = s.id AND run_id <= :base
+                        ORDER BY run_id DESC LIMIT 1) AS baseline
+                FROM series s{metric_filter})
+            SELECT e.variant, e.metric, e.part, e.clock_mhz, e.baseline, e.latest,
+                   (e.latest - e.baseline) / ABS(e.baseline) AS change, r.git_commit
+            FROM ends e JOIN runs r ON r.id = e.latest_run
+            WHERE e.baseline != 0 AND e.latest > e.baseline
+            ORDER BY change DESC LIMIT :limit"""
+        params = {'base': base_run, 'metric': metric, 'limit': limit}
+        return self.conn.execute(query, params).fetchall()
+
+def record_results(results, tool, report_dir='.', db_path=DEFAULT_HISTORY_FILE):
+    """Append a results table to the history, tagged with report_dir's git commit."""
+    commit, dirty = git_commit(report_dir if os.path.isdir(report_dir) else '.')
+    with QorHistory(db_path) as history:
+        run_id = history.record_run(results, tool, commit, dirty)
+    print(f"QoR history run {run_id} recorded in {db_path} (commit {commit[:12]}{'+dirty' if dirty else ''})")
+    return run_id
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Query the historical QoR database')
+    parser.add_argument('--db', default=DEFAULT_HISTORY_FILE, help='History database file')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    runs = commands.add_parser('runs', help='List recorded runs, newest first')
+    runs.add_argument('--limit', type=int, default=20)
+
+    trend = commands.add_parser('trend', help='Trend line of one metric for one variant')
+    trend.add_argument('variant', help='Implementation, e.g. perf_opt3 or opt4_HDL')
+    trend.add_argument('metric', choices=METRIC_COLUMNS)
+    trend.add_argument('--part', default=None)
+    trend.add_argument('--clock', type=float, default=None, help='Target clock in MHz')
+
+    regressions = commands.add_parser('regressions', help='Worst regressions since a commit or date')
+    regressions.add_argument('--since', required=True, help='Git commit (prefix) or YYYY-MM-DD[THH:MM:SS]')
+    regressions.add_argument('--metric', choices=METRIC_COLUMNS, default=None)
+    regressions.add_argument('--limit', type=int, default=10)
+    return parser.parse_args()
+
+def main():
+    args = parse_arguments()
+    if not os.path.exists(args.db):
+        print(f"No QoR history at {args.db}")
+        return
+
+    with QorHistory(args.db) as history:
+        if args.command == 'runs':
+            df = pd.DataFrame(history.runs(args.limit), columns=['Run', 'Time', 'Commit', 'Dirty', 'Tool'])
+            df['Commit'] = df['Commit'].str[:12]
+        elif args.command == 'trend':
+            df = pd.DataFrame(history.trend(args.variant, args.metric, args.part, args.clock),
+                              columns=['Time', 'Commit', 'Part', 'Clock (MHz)', args.metric])
+            df['Commit'] = df['Commit'].str[:12]
+        else:
+            try:
+                rows = history.worst_regressions(args.since, args.metric, args.limit)
+            except ValueError as e:
+                print(e)
+                return
+            df = pd.DataFrame(rows, columns=['Variant', 'Metric', 'Part', 'Clock (MHz)', 'Baseline',
+                                             'Latest', 'Change', 'Latest Commit'])
+            df['Change'] = df['Change'].map(lambda change: f"+{change:.1%}")
+            df['Latest Commit'] = df['Latest Commit'].str[:12]
+
+    print(df.to_string(index=False) if len(df) else "No matching QoR history")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Persistent incremental parse cache for HLS/Vivado report parsers.
+
+Parsed results are stored in a SQLite database keyed by parser and report
+path, together with the report's size, mtime and SHA-1 content hash. On a
+re-run a report whose size and mtime are unchanged is served straight from
+the cache; if only the mtime moved, the content hash decides. Entries are
+evicted once the solution directory they came from no longer exists.
+
+Usage:
+    with ReportCache() as cache:
+        data = cached_parse(cache, 'analyzeReports/impl/v1', parse_impl_report, report_file)
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+
+DEFAULT_CACHE_FILE = '.report_cache.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    parser       TEXT    NOT NULL,
+    path         TEXT    NOT NULL,
+    size         INTEGER NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    sha1         TEXT    NOT NULL,
+    solution_dir TEXT    NOT NULL,
+    value        BLOB    NOT NULL,
+    PRIMARY KEY (parser, path)
+);
+CREATE INDEX IF NOT EXISTS reports_solution_dir ON reports (solution_dir);
+"""
+
+def file_stamp(report_file):
+    """Return the (size, mtime_ns, sha1) stamp of a report file."""
+    st = os.stat(report_file)
+    sha1 = hashlib.sha1()
+    with open(report_file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha1.update(block)
+    return st.st_size, st.st_mtime_ns, sha1.hexdigest()
+
+def solution_dir_of(report_file):
+    """Return the solution* directory a report belongs to.
+
+    Falls back to the report's own directory for files that do not live
+    under a Vitis solution (e.g. HDLCoder summary TXT files).
+    """
+    path = Path(os.path.abspath(report_file))
+    for parent in path.parents:
+        if parent.name.startswith('solution'):
+            return str(parent)
+    return str(path.parent)
+
+class ReportCache:
+    """SQLite-backed cache of parsed report results."""
+
+    def __init__(self, db_path=DEFAULT_CACHE_FILE):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Commit pending writes and close the database."""
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def lookup(self, parser, report_file):
+        """Return (True, value) for a fresh cache entry, else (False, None)."""
+        path = os.path.abspath(report_file)
+        row = self.conn.execute(
+            'SELECT size, mtime_ns, sha1, value FROM reports WHERE parser = ? AND path = ?',
+            (parser, path)).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+
+        size, mtime_ns, sha1, value = row
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.misses += 1
+            return False, None
+
+        if st.st_size != size:
+            self.misses += 1
+            return False, None
+
+        if st.st_mtime_ns != mtime_ns:
+            # Touched but possibly unchanged (e.g. rsync, re-export) - check content
+            _, new_mtime_ns, new_sha1 = file_stamp(path)
+            if new_sha1 != sha1:
+                self.misses += 1
+                return False, None
+            self.conn.execute(
+                'UPDATE reports SET mtime_ns = ? WHERE parser = ? AND path = ?',
+                (new_mtime_ns, parser, path))
+
+        self.hits += 1
+        return True, pickle.loads(value)
+
+    def store(self, parser, report_file, stamp, value):
+        """Store a parsed value for a report with its (size, mtime_ns, sha1) stamp."""
+        path = os.path.abspath(report_file)
+        size, mtime_ns, sha1 = stamp
+        self.conn.execute(
+            'INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (parser, path, size, mtime_ns, sha1, solution_dir_of(path),
+             pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def evict_stale(self):
+        """Drop entries whose solution directory has disappeared."""
+        solution_dirs = [row[0] for row in
+                         self.conn.execute('SELECT DISTINCT solution_dir FROM reports')]
+        stale = [(d,) for d in solution_dirs if not os.path.isdir(d)]
+        if stale:
+            self.conn.executemany('DELETE FROM reports WHERE solution_dir = ?', stale)
+            self.conn.commit()
+        return len(stale)
+
+    def summary(self):
+        """Return a one-line hit/miss summary."""
+        return f"Report cache {self.db_path}: {self.hits} hits, {self.misses} misses"
+
+def cached_parse(cache, parser_key, parser, report_file):
+    """Parse a report through the cache, parsing and storing it on a miss."""
+    if cache is None:
+        return parser(report_file)
+
+    found, value = cache.lookup(parser_key, report_file)
+    if found:
+        return value
+
+    stamp = file_stamp(report_file)
+    value = parser(report_file)
+    cache.store(parser_key, report_file, stamp, value)
+    return value
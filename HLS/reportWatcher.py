@@ -0,0 +1,96 @@
+"""
+Polling watcher for report trees.
+
+A TreeWatcher remembers the mtime of every directory it has walked and the
+(size, mtime_ns) of every report file it has found. Creating or deleting a
+file bumps its parent directory's mtime, so a poll only stats the known
+directories and files and re-lists just the directories that changed - a
+finished Vitis run is picked up without walking the whole sweep again.
+Plain os.stat polling is used so it works the same on NFS farm mounts,
+where inotify does not see remote writes.
+
+Usage:
+    watcher = TreeWatcher(root, classify, descend)
+    changed, removed = watcher.poll()   # first poll reports everything as changed
+"""
+
+import os
+
+class TreeWatcher:
+    """Incrementally track report files below a root directory.
+
+    classify(rel_parts) returns the report group of a file (or None to
+    ignore it) and descend(rel_parts) says whether a directory is walked;
+    both get the path relative to the root as a tuple of names.
+    """
+
+    def __init__(self, root, classify, descend):
+        self.root = root
+        self.classify = classify
+        self.descend = descend
+        self.dirs = {}   # dir path -> (mtime_ns, rel_parts)
+        self.files = {}  # file path -> (group, size, mtime_ns)
+
+    def _list_dir(self, path, rel_parts, changed):
+        """(Re)list one directory: record new files and walk new subdirectories."""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            return
+        self.dirs[path] = (mtime_ns, rel_parts)
+
+        for entry in entries:
+            parts = rel_parts + (entry.name,)
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path not in self.dirs and self.descend(parts):
+                    self._list_dir(entry.path, parts, changed)
+            elif entry.path not in self.files and entry.is_file():
+                group = self.classify(parts)
+                if group is not None:
+                    st = entry.stat()
+                    self.files[entry.path] = (group, st.st_size, st.st_mtime_ns)
+                    changed.append((group, entry.path))
+
+    def _forget_dir(self, path, removed):
+        """Drop a vanished directory and everything recorded below it."""
+        prefix = path + os.sep
+        for dir_path in [d for d in self.dirs if d == path or d.startswith(prefix)]:
+            del self.dirs[dir_path]
+        for file_path in [f for f in self.files if f.startswith(prefix)]:
+            removed.append((self.files.pop(file_path)[0], file_path))
+
+    def poll(self):
+        """Return ([(group, path)] new or modified, [(group, path)] removed) since the last poll."""
+        changed, removed = [], []
+        if not self.dirs:
+            if os.path.isdir(self.root):
+                self._list_dir(self.root, (), changed)
+            return changed, removed
+
+        # Known report files: rewritten in place (e.g. a re-run cosim)
+        for path, (group, size, mtime_ns) in list(self.files.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self.files[path]
+                removed.append((group, path))
+                continue
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                self.files[path] = (group, st.st_size, st.st_mtime_ns)
+                changed.append((group, path))
+
+        # Known directories: an mtime change means entries were added or removed
+        for path, (mtime_ns, rel_parts) in list(self.dirs.items()):
+            if path not in self.dirs:
+                continue  # forgotten along with a removed parent
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                self._forget_dir(path, removed)
+                continue
+            if current != mtime_ns:
+                # Deleted files were already caught above; pick up new entries
+                self._list_dir(path, rel_parts, changed)
+
+        return changed, removed
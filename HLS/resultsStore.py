@@ -0,0 +1,164 @@
+"""
+Columnar results store for harvested FPGA implementation results.
+
+Results are kept as one NumPy array per column and saved as an .npz file
+with a fixed schema, so HLS and HDLCoder results can be merged by loading
+arrays rather than re-parsing rendered text. Missing numeric values are NaN;
+timing columns are clock periods in ns, timing-closure columns
+(vivadoTiming.py) are the WNS/TNS and the worst setup path in ns, latency
+columns are cycles and the derived throughput columns (derivedMetrics.py)
+are recomputed on build/load.
+
+Usage:
+    results = build_results(all_resources, all_timing, all_latency, flow='HLS')
+    save_results(results, 'fpga_implementation_results.npz')
+    merged = merge_results(results, load_results('opt4_HDL.npz'))
+"""
+
+import os
+import numpy as np
+from latencyReport import LATENCY_METRICS
+from derivedMetrics import DERIVED_COLUMNS, derive_metrics
+from vivadoTiming import CLOSURE_COLUMNS, format_critical_path
+
+SCHEMA_VERSION = 3
+
+# column -> (dtype, label used by the text/DataFrame renderings)
+# Strings are unsized 'U': NumPy sizes each array to its longest value, so a long
+# critical path (start -> end cell names) is never truncated
+STRING_COLUMNS = {
+    'implementation': ('U', 'Implementation'),
+    'flow': ('U', 'Flow'),
+    'part': ('U', 'Part'),
+    'critical_path': ('U', 'Critical Path'),
+}
+RESOURCE_COLUMNS = {
+    'lut': ('f8', 'LUT'),
+    'ff': ('f8', 'FF'),
+    'dsp': ('f8', 'DSP'),
+    'bram': ('f8', 'BRAM'),
+    'uram': ('f8', 'URAM'),
+}
+TIMING_COLUMNS = {
+    'clock_mhz': ('f8', 'Clock (MHz)'),
+    'target_ns': ('f8', 'Target'),
+    'post_synth_ns': ('f8', 'Post-Synthesis'),
+    'post_route_ns': ('f8', 'Post-Route'),
+    'hls_estimate_ns': ('f8', 'HLS Estimate'),
+}
+# 'Min Latency' -> 'min_latency', ..., 'Total Execute Time' -> 'total_execute_time'
+LATENCY_COLUMNS = {metric.lower().replace(' ', '_'): ('f8', metric) for metric in LATENCY_METRICS}
+
+SCHEMA = {**STRING_COLUMNS, **RESOURCE_COLUMNS, **TIMING_COLUMNS, **CLOSURE_COLUMNS, **LATENCY_COLUMNS,
+          **DERIVED_COLUMNS}
+
+def empty_results():
+    """Return a zero-row results table."""
+    return {column: np.empty(0, dtype=dtype) for column, (dtype, _) in SCHEMA.items()}
+
+def _value(source, label):
+    """Numeric value for a column, NaN when missing."""
+    value = (source or {}).get(label)
+    return np.nan if value is None else float(value)
+
+def build_results(all_resources, all_timing, all_latency, flow='HLS', parts=None, all_closure=None):
+    """Build a results table from the analyzers' per-implementation dicts.
+
+    all_timing holds clock periods in ns keyed by 'Target', 'Post-Synthesis',
+    'Post-Route' and 'HLS Estimate'; all_latency holds LATENCY_METRICS dicts
+    and all_closure vivadoTiming.merge_timing_closure dicts. flow is a single
+    flow name or a {impl: flow} dict.
+    """
+    all_closure = all_closure or {}
+    implementations = list(dict.fromkeys(list(all_resources) + list(all_timing) + list(all_latency)
+                                         + list(all_closure)))
+    parts = parts or {}
+
+    rows = []
+    for impl in implementations:
+        row = {
+            'implementation': impl,
+            'flow': flow.get(impl, '') if isinstance(flow, dict) else flow,
+            'part': parts.get(impl) or '',
+        }
+        for column, (_, label) in RESOURCE_COLUMNS.items():
+            row[column] = _value(all_resources.get(impl), label)
+        for column, (_, label) in TIMING_COLUMNS.items():
+            row[column] = _value(all_timing.get(impl), label)
+        target_ns = row['target_ns']
+        row['clock_mhz'] = 1000 / target_ns if target_ns > 0 else np.nan
+        closure = all_closure.get(impl) or {}
+        for column, (_, label) in CLOSURE_COLUMNS.items():
+            row[column] = _value(closure, label)
+        row['critical_path'] = format_critical_path(closure) if 'Data Path Delay' in closure else ''
+        for column, (_, label) in LATENCY_COLUMNS.items():
+            row[column] = _value(all_latency.get(impl), label)
+        rows.append(row)
+
+    results = {column: np.array([row[column] for row in rows], dtype=dtype)
+               for column, (dtype, _) in SCHEMA.items() if column not in DERIVED_COLUMNS}
+    return derive_metrics(results)
+
+def save_results(results, output_file):
+    """Atomically write a results table to an .npz file."""
+    tmp_file = f"{output_file}.tmp.npz"
+    np.savez(tmp_file, schema_version=np.array(SCHEMA_VERSION), **results)
+    os.replace(tmp_file, output_file)
+    print(f"Results store written to {output_file}")
+
+def load_results(store_file):
+    """Load a results table; every schema column is returned, missing ones as NaN/''."""
+    with np.load(store_file, allow_pickle=False) as data:
+        version = int(data['schema_version']) if 'schema_version' in data else 0
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"{store_file} has schema version {version}, newer than {SCHEMA_VERSION}")
+        n = len(data['implementation'])
+        results = {}
+        for column, (dtype, _) in SCHEMA.items():
+            if column in data:
+                results[column] = data[column].astype(dtype)
+            else:
+                results[column] = np.full(n, '' if dtype.startswith('U') else np.nan, dtype=dtype)
+    # Stores older than the derived columns (schema 1) get them filled in
+    return derive_metrics(results)
+
+def merge_results(*tables):
+    """Concatenate results tables; later rows win for a repeated implementation."""
+    tables = [t for t in tables if t is not None and len(t['implementation'])]
+    if not tables:
+        return empty_results()
+    merged = {column: np.concatenate([t[column] for t in tables]) for column in SCHEMA}
+
+    # Keep the last occurrence of each implementation, in first-seen order
+    names = merged['implementation']
+    last = {name: i for i, name in enumerate(names)}
+    order = [last[name] for name in dict.fromkeys(names)]
+    return {column: values[order] for column, values in merged.items()}
+
+def _row_values(results, i, columns, cast):
+    """Non-NaN values of one row for a column group, keyed by label."""
+    values = {}
+    for column, (_, label) in columns.items():
+        value = results[column][i]
+        if column != 'clock_mhz' and not np.isnan(value):
+            values[label] = cast(value)
+    return values
+
+def results_to_dicts(results):
+    """Convert a results table back to (all_resources, all_timing, all_latency) dicts, dropping NaN."""
+    all_resources, all_timing, all_latency = {}, {}, {}
+    for i, impl in enumerate(results['implementation']):
+        impl = str(impl)
+        for target, columns, cast in ((all_resources, RESOURCE_COLUMNS, int),
+                                      (all_timing, TIMING_COLUMNS, float),
+                                      (all_latency, LATENCY_COLUMNS, int)):
+            values = _row_values(results, i, columns, cast)
+            if values:
+                target[impl] = values
+    return all_resources, all_timing, all_latency
+
+def results_frame(results):
+    """Return the results table as a pandas DataFrame indexed by implementation."""
+    import pandas as pd
+    df = pd.DataFrame({label: results[column] for column, (_, label) in SCHEMA.items()})
+    return df.set_index('Implementation')
@@ -0,0 +1,69 @@
+"""Checks of the report tree walk: group assignment and the tool directories it skips."""
+
+import os
+from analyzeReports import scan_reports
+
+SOLUTION = 'perf_opt3/proj_peakPicker/solution1'
+HDLSRC = 'opt4_HDL/codegen/peakPicker/hdlsrc'
+
+# Files under the HLS and HDLCoder roots -> expected group (None: not a report)
+HLS_FILES = {
+    f'{SOLUTION}/impl/report/verilog/export_impl.rpt': 'impl',
+    f'{SOLUTION}/impl/verilog/report/peakPicker_timing_routed.rpt': 'timing',
+    f'{SOLUTION}/impl/verilog/report/peakPicker_timing_paths_routed.rpt': 'timing',
+    f'{SOLUTION}/impl/verilog/report/peakPicker_timing_synth.rpt': None,
+    f'{SOLUTION}/sim/report/verilog/lat.rpt': 'latency',
+    f'{SOLUTION}/syn/report/csynth.xml': 'csynth',
+    'perf_opt3/vitis_hls.log': 'hls_log',
+    # Report-shaped files inside the tool run directories the walk must not enter
+    f'{SOLUTION}/impl/verilog/project.runs/impl/report/verilog/export_impl.rpt': None,
+    f'{SOLUTION}/sim/verilog/sim/report/verilog/lat.rpt': None,
+    f'{SOLUTION}/syn/verilog/syn/report/csynth.xml': None,
+}
+HDLCODER_FILES = {
+    'opt4_HDL.txt': 'txt',
+    'opt4_HDL.npz': 'store',
+    'opt4_HDL/notes.txt': None,
+    f'{HDLSRC}/post_synth_report.html': 'hdlsrc',
+    f'{HDLSRC}/peakPicker_fixpt_vivadosim_log_sim.txt': 'hdlsrc',
+    f'{HDLSRC}/peakPicker_fixpt.v': None,
+    f'{HDLSRC}/html/post_synth_report.html': None,
+    'opt4_HDL/other/peakPicker/hdlsrc/post_synth_report.html': None,
+}
+SKIPPED_DIRS = ('impl/verilog/project.runs', 'sim/verilog', 'syn/verilog')
+
+def make_tree(root, files):
+    for rel_path in files:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('')
+
+def expected_groups(root, files):
+    groups = {}
+    for rel_path, group in files.items():
+        if group is not None:
+            groups.setdefault(group, []).append(os.path.join(root, *rel_path.split('/')))
+    return {group: sorted(paths) for group, paths in groups.items()}
+
+def test_group_assignment(tmp_path):
+    hls_dir, hdlcoder_dir = tmp_path / 'HLS', tmp_path / 'HDLCoder'
+    make_tree(hls_dir, HLS_FILES)
+    make_tree(hdlcoder_dir, HDLCODER_FILES)
+    groups = scan_reports(str(hls_dir), str(hdlcoder_dir))
+    expected = {**expected_groups(str(hls_dir), HLS_FILES), **expected_groups(str(hdlcoder_dir), HDLCODER_FILES)}
+    assert {group: paths for group, paths in groups.items() if paths} == expected
+
+def test_tool_directories_not_entered(tmp_path, monkeypatch):
+    make_tree(tmp_path, HLS_FILES)
+    scanned = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, 'scandir', lambda path: scanned.append(path) or scandir(path))
+    scan_reports(str(tmp_path))
+    scanned = [os.path.relpath(path, tmp_path).replace(os.sep, '/') for path in scanned]
+    assert f'{SOLUTION}/impl/report/verilog' in scanned
+    assert not [path for path in scanned if any(skipped in path for skipped in SKIPPED_DIRS)]
+
+def test_missing_hdlcoder_dir(tmp_path):
+    make_tree(tmp_path, HLS_FILES)
+    groups = scan_reports(str(tmp_path), str(tmp_path / 'HDLCoder'))
+    assert not groups['txt'] and groups['impl']
@@ -0,0 +1,65 @@
+"""Checks of the ap_fixed emulation against hand-computed codes."""
+
+import numpy as np
+import pytest
+from apFixed import FixedFormat, fixed_columns, parse_format
+
+# Values in LSBs of ap_fixed<8, 4> (F = 4): ties, non-ties, both signs
+STEPS = [2.5, -2.5, 1.5, -1.5, 2.3, -2.3, 0.5, -0.5]
+QUANTIZED = {
+    'AP_TRN': [2, -3, 1, -2, 2, -3, 0, -1],
+    'AP_TRN_ZERO': [2, -2, 1, -1, 2, -2, 0, 0],
+    'AP_RND': [3, -2, 2, -1, 2, -2, 1, 0],
+    'AP_RND_ZERO': [2, -2, 1, -1, 2, -2, 0, 0],
+    'AP_RND_MIN_INF': [2, -3, 1, -2, 2, -2, 0, -1],
+    'AP_RND_INF': [3, -3, 2, -2, 2, -2, 1, -1],
+    'AP_RND_CONV': [2, -2, 2, -2, 2, -2, 0, 0],
+}
+
+# ap_fixed<4, 4> holds -8..7; ap_ufixed<4, 4> holds 0..15
+SIGNED_VALUES = [9, -9, 7, -8, 16]
+UNSIGNED_VALUES = [17, -1, 15, 0]
+OVERFLOWED = {
+    'AP_WRAP': ([-7, 7, 7, -8, 0], [1, 15, 15, 0]),
+    'AP_SAT': ([7, -8, 7, -8, 7], [15, 0, 15, 0]),
+    'AP_SAT_ZERO': ([0, 0, 7, -8, 0], [0, 0, 15, 0]),
+    'AP_SAT_SYM': ([7, -7, 7, -7, 7], [15, 0, 15, 0]),
+}
+
+@pytest.mark.parametrize('mode', sorted(QUANTIZED))
+def test_quantization_modes(mode):
+    fmt = FixedFormat(8, 4, mode)
+    values = np.array(STEPS) * fmt.lsb
+    np.testing.assert_array_equal(fmt.quantize(values), QUANTIZED[mode])
+    np.testing.assert_array_equal(fmt.fixed_values(values), np.array(QUANTIZED[mode]) * fmt.lsb)
+
+@pytest.mark.parametrize('mode', sorted(OVERFLOWED))
+def test_overflow_modes(mode):
+    signed, unsigned = OVERFLOWED[mode]
+    np.testing.assert_array_equal(FixedFormat(4, 4, 'AP_TRN', mode).quantize(SIGNED_VALUES), signed)
+    np.testing.assert_array_equal(FixedFormat(4, 4, 'AP_TRN', mode, signed=False).quantize(UNSIGNED_VALUES), unsigned)
+
+def test_out_of_range():
+    np.testing.assert_array_equal(FixedFormat(4, 4).out_of_range(SIGNED_VALUES), [True, True, False, False, True])
+
+def test_hdl_coder_type():
+    # ufix14_En21: 14 bits, LSB 2^-21, largest value just below 2^-7
+    fmt = parse_format('ap_ufixed<14, -7>')
+    assert (fmt.width, fmt.fraction, fmt.signed) == (14, 21, False)
+    np.testing.assert_array_equal(fmt.quantize([2.0 ** -21, 2.0 ** -7 - 2.0 ** -21, 2.0 ** -7]), [1, 16383, 0])
+
+def test_parse_format():
+    assert parse_format('ap_fixed<20, 1>') == FixedFormat(20, 1)
+    assert parse_format(' ap_fixed< 20,1 , AP_RND , AP_SAT , 0 > ') == FixedFormat(20, 1, 'AP_RND', 'AP_SAT')
+    assert str(parse_format('ap_ufixed<8, 2, AP_RND_CONV, AP_SAT>')) == 'ap_ufixed<8, 2, AP_RND_CONV, AP_SAT>'
+    for declaration in ('ap_fixed<8, 2, AP_TRN, AP_WRAP, 2>', 'ap_int<8>', 'ap_fixed<8, 2, AP_FOO>', 'ap_fixed<54, 1>'):
+        with pytest.raises(ValueError):
+            parse_format(declaration)
+
+def test_fixed_columns_match_formats():
+    values = np.random.default_rng(0).uniform(-3, 3, 500)
+    formats = [FixedFormat(w, i, q, o, s) for w, i in ((4, 1), (8, 2), (12, -1))
+               for q in ('AP_TRN', 'AP_RND_CONV') for o in ('AP_WRAP', 'AP_SAT_SYM') for s in (True, False)]
+    columns = fixed_columns(values, formats)
+    for index, fmt in enumerate(formats):
+        np.testing.assert_array_equal(columns[:, index], fmt.fixed_values(values))
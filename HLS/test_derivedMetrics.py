@@ -0,0 +1,26 @@
+"""Checks of the derived latency and throughput columns."""
+
+import numpy as np
+import pytest
+from latencyReport import SAMPLES_PER_TRANSACTION, samples_per_cycle
+from resultsStore import build_results
+
+def test_headline_latency_first():
+    latency = {
+        'both': {'Max Latency': 6005, 'Total Execute Time': 6033},
+        'max_only': {'Max Latency': 6005},
+        'pipelined': {'Total Execute Time': 12012, 'Avg Interval': 6001},
+    }
+    results = build_results({impl: {'LUT': 500, 'FF': 250} for impl in latency},
+                             {impl: {'Post-Route': 2.5} for impl in latency}, latency)
+    np.testing.assert_allclose(results['latency_us'], [6033 / 400, 6005 / 400, 12012 / 400])
+    np.testing.assert_allclose(results['cycles_per_sample'], np.array([6033, 6005, 6001]) / SAMPLES_PER_TRANSACTION)
+    np.testing.assert_allclose(results['throughput_msps'], SAMPLES_PER_TRANSACTION / np.array([6033, 6005, 6001]) * 400)
+    np.testing.assert_allclose(results['msps_per_klut'], results['throughput_msps'] / 0.5)
+    for i, impl in enumerate(latency):
+        assert samples_per_cycle(latency[impl]) == pytest.approx(1 / results['cycles_per_sample'][i])
+
+def test_missing_inputs_give_nan():
+    results = build_results({'no_timing': {'LUT': 500}}, {}, {'no_timing': {'Total Execute Time': 6033}})
+    assert np.isnan(results['latency_us'][0]) and np.isnan(results['msps_per_klut'][0])
+    assert results['cycles_per_sample'][0] == 6033 / SAMPLES_PER_TRANSACTION
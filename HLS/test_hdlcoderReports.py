@@ -0,0 +1,39 @@
+"""Checks of the native HDL Coder artifact parsers against HDLCoder/opt4_HDL."""
+
+import os
+from hdlcoderReports import artifact_kind, combine_artifacts, parse_hdl_artifact
+
+HDLSRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'HDLCoder', 'opt4_HDL', 'codegen',
+                      'peakPicker', 'hdlsrc')
+
+def artifact_records():
+    return [parse_hdl_artifact(os.path.join(HDLSRC, name)) for name in sorted(os.listdir(HDLSRC))
+            if artifact_kind(name)]
+
+def test_artifact_kinds():
+    kinds = {name: artifact_kind(name) for name in os.listdir(HDLSRC) if artifact_kind(name)}
+    assert kinds == {
+        'post_synth_report.html': 'post_synth',
+        'resource_report.html': 'resource_estimate',
+        'peakPicker_fixpt_Industry_report.html': 'compliance',
+        'peakPicker_fixpt_vivadosim_log_sim.txt': 'simulation',
+        'clock_constraint.xdc': 'clock',
+    }
+
+def test_opt4_hdl():
+    variant = combine_artifacts(artifact_records())
+    assert variant['resources'] == {'LUT': 270, 'FF': 199, 'DSP': 0, 'BRAM': 0, 'URAM': 0}
+    assert variant['timing'] == {'Target': 5.0, 'Post-Route': 3.554}
+    assert variant['latency'] == {'Total Execute Time': 12012}
+    assert variant['sim_passed'] is True
+    assert variant['compliance'] == {'errors': 2, 'warnings': 2, 'messages': 4}
+    assert variant['estimates']['Total Register Bits'] == 335
+
+def test_record_order_does_not_matter():
+    records = artifact_records()
+    assert combine_artifacts(records[::-1]) == combine_artifacts(records)
+
+def test_without_simulation_log():
+    variant = combine_artifacts([record for record in artifact_records() if record['kind'] != 'simulation'])
+    assert variant['latency'] is None and variant['sim_passed'] is None
+    assert variant['resources']['LUT'] == 270
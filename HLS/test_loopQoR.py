@@ -0,0 +1,107 @@
+"""Checks of the loop-level QoR extraction against the repo's vitis_hls.log files."""
+
+import os
+import pytest
+from loopQoR import log_impl_name, merge_pipeline_qor, parse_csynth_xml, parse_hls_log_qor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OPT4_HLS_LOG = os.path.join(HERE, '..', 'HDLCoder', 'opt4_HLS', 'codegen', 'peakPicker', 'hdlsrc', 'vitis_hls.log')
+
+CSYNTH_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<profile>
+  <UserAssignments>
+    <TargetClockPeriod>3.33</TargetClockPeriod>
+  </UserAssignments>
+  <PerformanceEstimates>
+    <SummaryOfTimingAnalysis>
+      <EstimatedClockPeriod>2.431</EstimatedClockPeriod>
+    </SummaryOfTimingAnalysis>
+    <SummaryOfLoopLatency>
+      <InputRead>
+        <TripCount>6001</TripCount>
+        <Latency>6001</Latency>
+        <PipelineII>1</PipelineII>
+        <PipelineDepth>2</PipelineDepth>
+      </InputRead>
+      <ProcessSignal>
+        <TripCount>5991</TripCount>
+        <Latency>305541</Latency>
+        <IterationLatency>51</IterationLatency>
+        <WindowMax>
+          <TripCount>
+            <range><min>1</min><max>11</max></range>
+          </TripCount>
+          <Latency>undef</Latency>
+        </WindowMax>
+      </ProcessSignal>
+    </SummaryOfLoopLatency>
+  </PerformanceEstimates>
+</profile>
+"""
+
+@pytest.mark.parametrize('variant, fmax_mhz, loops', [
+    ('perf_opt1', 331.7, {'InputRead': (1, 1, 2), 'ProcessSignal': (None, None, None)}),
+    ('perf_opt2', 331.27, {'process_signal': (None, None, None)}),
+    ('perf_opt3', 298.78, {'process_signal': (1, 1, 5)}),
+])
+def test_repo_logs(variant, fmax_mhz, loops):
+    qor = parse_hls_log_qor(os.path.join(HERE, variant, 'vitis_hls.log'))
+    assert qor['fmax_mhz'] == fmax_mhz
+    assert {name: (loop.get('Target II'), loop.get('Final II'), loop.get('Depth'))
+            for name, loop in qor['loops'].items()} == loops
+    for loop in qor['loops'].values():
+        if 'Final II' not in loop:
+            assert loop['Unsatisfied'] == 'contains subloop(s) that are not unrolled or flattened'
+
+def test_ii_violation():
+    rows = merge_pipeline_qor(parse_hls_log_qor(OPT4_HLS_LOG))['loops']
+    row = rows['peakPicker_fixpt_wrapper']
+    assert (row['Kind'], row['Target II'], row['Final II'], row['Depth']) == ('function', 1, 2, 3)
+    assert row['II Violation']
+    assert row['Note'] == 'Unable to enforce a carried dependence constraint; final II 2 > target II 1'
+
+def test_csynth_xml(tmp_path):
+    xml_file = tmp_path / 'csynth.xml'
+    xml_file.write_text(CSYNTH_XML)
+    design = parse_csynth_xml(str(xml_file))
+    assert (design['target_clock_ns'], design['estimated_clock_ns']) == (3.33, 2.431)
+    assert design['loops'] == {
+        'InputRead': {'TripCount': 6001, 'Latency': 6001, 'PipelineII': 1, 'PipelineDepth': 2},
+        'ProcessSignal': {'TripCount': 5991, 'Latency': 305541, 'IterationLatency': 51},
+        'ProcessSignal/WindowMax': {'TripCount': 11, 'Latency': None},
+    }
+
+def test_merge_log_and_csynth(tmp_path):
+    xml_file = tmp_path / 'csynth.xml'
+    xml_file.write_text(CSYNTH_XML)
+    rows = merge_pipeline_qor(parse_hls_log_qor(os.path.join(HERE, 'perf_opt1', 'vitis_hls.log')),
+                              parse_csynth_xml(str(xml_file)))['loops']
+    assert list(rows) == ['InputRead', 'ProcessSignal', 'ProcessSignal/WindowMax']
+    assert (rows['InputRead']['Final II'], rows['InputRead']['Trip Count'], rows['InputRead']['II Violation']) \
+        == (1, 6001, False)
+    assert rows['ProcessSignal']['Latency'] == 305541
+    assert rows['ProcessSignal']['II Violation']
+    assert rows['ProcessSignal']['Note'].startswith('pipeline directive not satisfied')
+    assert rows['ProcessSignal/WindowMax']['Trip Count'] == 11
+
+def test_first_ii_read_warning_split(tmp_path):
+    # The repo logs only carry the design-level wording
+    qor = parse_hls_log_qor(os.path.join(HERE, 'perf_opt3', 'vitis_hls.log'))
+    merged = merge_pipeline_qor(qor)
+    assert qor['first_ii_read_warning'] and merged['first_ii_read_warning']
+    assert not merged['loops']['process_signal']['First-II Read Warning']
+    assert not parse_hls_log_qor(os.path.join(HERE, 'perf_opt1', 'vitis_hls.log'))['first_ii_read_warning']
+
+    log_file = tmp_path / 'vitis_hls.log'
+    log_file.write_text(
+        "INFO: [HLS 200-1470] Pipelining result : Target II = 1, Final II = 1, Depth = 5, loop 'process_signal'\n"
+        "INFO: [HLS 200-1470] Pipelining result : Target II = 1, Final II = 1, Depth = 2, loop 'InputRead'\n"
+        "WARNING: [HLS 200-626] Unable to schedule all read ports in the first II cycle of loop 'process_signal'\n")
+    merged = merge_pipeline_qor(parse_hls_log_qor(str(log_file)))
+    assert not merged['first_ii_read_warning']
+    assert merged['loops']['process_signal']['First-II Read Warning']
+    assert not merged['loops']['InputRead']['First-II Read Warning']
+
+def test_log_impl_name():
+    assert log_impl_name('HLS/perf_opt3/proj_peakPicker/solution1/vitis_hls.log') == 'perf_opt3'
+    assert log_impl_name('HLS/perf_opt3/vitis_hls.log') == 'perf_opt3'
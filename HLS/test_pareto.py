@@ -0,0 +1,69 @@
+"""Checks of the Pareto engine against brute-force dominance, including missing (NaN) objectives."""
+
+import numpy as np
+import pytest
+from pareto import dominance_ranks, dominators, pareto_analysis, pareto_mask
+
+def brute_dominates(a, b):
+    """a dominates b: a reports every objective b reports, no worse on them, better on one."""
+    reported = ~np.isnan(b)
+    if np.any(np.isnan(a[reported])) or np.any(a[reported] > b[reported]):
+        return False
+    return bool(np.any(a[reported] < b[reported]))
+
+def brute_force(points):
+    """(dominance matrix, ranks by peeling fronts)."""
+    n = len(points)
+    matrix = np.array([[brute_dominates(points[i], points[j]) for j in range(n)] for i in range(n)]).reshape(n, n)
+    ranks = np.zeros(n, dtype=int)
+    remaining = np.ones(n, dtype=bool)
+    rank = 0
+    while remaining.any():
+        rank += 1
+        front = remaining & ~matrix[remaining].any(axis=0)
+        ranks[front] = rank
+        remaining &= ~front
+    return matrix, ranks
+
+def random_points(rng, missing):
+    # Few distinct values so ties and duplicate points are common
+    points = rng.integers(0, 4, (rng.integers(1, 40), rng.integers(1, 5))).astype(float)
+    points[rng.random(points.shape) < missing] = np.nan
+    return points
+
+@pytest.mark.parametrize('missing', [0.0, 0.2])
+def test_against_brute_force(missing):
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        points = random_points(rng, missing)
+        matrix, expected = brute_force(points)
+        np.testing.assert_array_equal(pareto_mask(points), expected == 1)
+        ranks = dominance_ranks(points, block_size=int(rng.integers(1, 8)))
+        np.testing.assert_array_equal(ranks, expected)
+        for j, i in enumerate(dominators(points, ranks)):
+            if ranks[j] == 1:
+                assert i == -1
+            else:
+                assert ranks[i] == 1 and matrix[i, j]
+
+def test_empty():
+    assert pareto_mask(np.empty((0, 3))).shape == (0,)
+    assert dominance_ranks(np.empty((0, 3))).shape == (0,)
+
+def test_analysis_ranks_partial_rows():
+    nan = np.nan
+    results = {
+        'implementation': np.array(['full', 'no_dsp', 'worse', 'nothing']),
+        'lut': np.array([270.0, 336.0, 400.0, nan]),
+        'ff': np.array([199.0, 296.0, 300.0, nan]),
+        'bram': np.array([0.0, 0.0, 0.0, nan]),
+        'dsp': np.array([0.0, nan, 0.0, nan]),
+        'post_route_ns': np.array([3.5, 3.0, 3.6, nan]),
+        'total_execute_time': np.array([nan, nan, nan, nan]),
+    }
+    analysis = pareto_analysis(results)
+    assert 'total_execute_time' not in analysis['objectives']
+    np.testing.assert_array_equal(analysis['rank'], [1, 1, 2, 0])
+    assert analysis['dominator'][2] == 'full'
+    assert analysis['missing'][1] == ['dsp', 'total_execute_time']
+    assert len(analysis['missing'][3]) == 6
@@ -0,0 +1,109 @@
+"""Checks of the NumPy golden reference peak picker, its sliding-max engines, streaming and batched forms."""
+
+import os
+import numpy as np
+import pytest
+from peakpicker import REFERENCE_FILE, THRESHOLD_FILE, XCORR_FILE, batch_peak_picker, chunked, load_vector, \
+    peak_picker, sequence_peak_picker, sliding_max, stream_peak_picker
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def loop_peak_picker(xcorr, threshold, window_length, strict=False):
+    """Line-by-line translation of MATLAB/origin/peakPicker.m."""
+    locations = []
+    middle = window_length // 2
+    for index in range(len(xcorr) - window_length + 1):
+        candidate = index + middle
+        clears = xcorr[candidate] > threshold[candidate] if strict else xcorr[candidate] >= threshold[candidate]
+        if clears and xcorr[candidate] >= max(xcorr[index:index + window_length]):
+            locations.append(candidate + 1)
+    return np.array(locations, dtype=np.int64)
+
+def loop_sequence_peak_picker(xcorr, threshold, window_length):
+    """Line-by-line translation of MATLAB/origin/peakPicker.m for a (samples, sequences) xcorr."""
+    locations = []
+    middle = window_length // 2
+    for index in range(len(xcorr) - window_length + 1):
+        current_window = xcorr[index:index + window_length]
+        candidate = index + middle
+        if np.any(xcorr[candidate] >= threshold[candidate]):
+            sequences = np.flatnonzero(xcorr[candidate] >= threshold[candidate])
+            if np.all(np.sum(xcorr[candidate, sequences] >= current_window[:, sequences], axis=0) == window_length):
+                locations.append(candidate + 1)
+    return np.array(locations, dtype=np.int64)
+
+def random_vectors(rng, samples):
+    # Few distinct levels so windows often hold ties and samples sit exactly on the threshold
+    return rng.integers(0, 6, samples).astype(float), rng.integers(0, 6, samples).astype(float)
+
+@pytest.mark.parametrize('window_length', [1, 2, 3, 11, 32])
+@pytest.mark.parametrize('strict', [False, True])
+def test_matches_loop(window_length, strict):
+    rng = np.random.default_rng(window_length)
+    for samples in (0, window_length - 1, window_length, 500):
+        xcorr, threshold = random_vectors(rng, samples)
+        np.testing.assert_array_equal(peak_picker(xcorr, threshold, window_length, strict),
+                                      loop_peak_picker(xcorr, threshold, window_length, strict))
+
+@pytest.mark.parametrize('variant', ['origin', 'perf_opt3'])
+def test_repo_vectors(variant):
+    directory = os.path.join(HERE, variant)
+    locations = peak_picker(load_vector(os.path.join(directory, XCORR_FILE)),
+                            load_vector(os.path.join(directory, THRESHOLD_FILE)))
+    np.testing.assert_array_equal(locations, load_vector(os.path.join(directory, REFERENCE_FILE)).astype(np.int64))
+
+def test_unaligned_threshold():
+    with pytest.raises(ValueError):
+        peak_picker(np.zeros(20), np.zeros(19))
+
+@pytest.mark.parametrize('window_length', [1, 11])
+def test_stream_matches_whole_array(window_length):
+    xcorr, threshold = random_vectors(np.random.default_rng(1), 1000)
+    expected = peak_picker(xcorr, threshold, window_length)
+    for chunk_size in (1, 7, len(xcorr)):
+        pieces = list(stream_peak_picker(zip(chunked(xcorr, chunk_size), chunked(threshold, chunk_size)),
+                                         window_length))
+        assert len(pieces) == -(-len(xcorr) // chunk_size)
+        np.testing.assert_array_equal(np.concatenate(pieces), expected)
+
+@pytest.mark.parametrize('window_length', [1, 2, 3, 4, 11, 64, 257])
+def test_vhgw_matches_strided(window_length):
+    rng = np.random.default_rng(window_length)
+    for samples in (window_length, window_length + 1, 1000):
+        x = rng.integers(0, 50, samples).astype(float)
+        np.testing.assert_array_equal(sliding_max(x, window_length, 'vhgw'), sliding_max(x, window_length, 'strided'))
+    # Along axis 0 of a batch, with -inf and inf present
+    x = rng.standard_normal((300, 3, 2))
+    x[::17] = -np.inf
+    x[5, 1, 0] = np.inf
+    np.testing.assert_array_equal(sliding_max(x, min(window_length, 300), 'vhgw'),
+                                  sliding_max(x, min(window_length, 300), 'strided'))
+
+@pytest.mark.parametrize('window_length', [1, 3, 11])
+def test_sequences_match_matlab_loop(window_length):
+    rng = np.random.default_rng(window_length)
+    xcorr = rng.integers(0, 6, (500, 3, 2)).astype(float)
+    threshold = rng.integers(0, 6, 500).astype(float)
+    locations = sequence_peak_picker(xcorr, threshold, window_length)
+    assert locations.shape == (2,)
+    for antenna in range(2):
+        np.testing.assert_array_equal(locations.column(antenna),
+                                      loop_sequence_peak_picker(xcorr[:, :, antenna], threshold, window_length))
+    np.testing.assert_array_equal(sequence_peak_picker(xcorr[:, :, 0], threshold, window_length).column(0),
+                                  locations.column(0))
+
+def test_batch_matches_per_column():
+    rng = np.random.default_rng(2)
+    xcorr = rng.integers(0, 6, (400, 3, 2)).astype(float)
+    for threshold in (rng.integers(0, 6, 400).astype(float), rng.integers(0, 6, (400, 3, 2)).astype(float)):
+        locations = batch_peak_picker(xcorr, threshold)
+        assert locations.counts().shape == (3, 2)
+        for sequence in range(3):
+            for antenna in range(2):
+                column_threshold = threshold if threshold.ndim == 1 else threshold[:, sequence, antenna]
+                np.testing.assert_array_equal(locations.column((sequence, antenna)),
+                                              peak_picker(xcorr[:, sequence, antenna], column_threshold))
+    short = batch_peak_picker(xcorr[:5], threshold[:5])
+    assert short.counts().tolist() == [[0, 0]] * 3
+    with pytest.raises(ValueError):
+        batch_peak_picker(xcorr, threshold[:, :2])
@@ -0,0 +1,46 @@
+"""Checks of the QoR gate against the committed qor_baseline.json."""
+
+import os
+import pytest
+from qorGate import check_results, load_baseline, run_check, write_baseline
+from resultsStore import build_results
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qor_baseline.json')
+
+def results_for(implementations):
+    """Results store from {impl: (post-route Fmax in MHz, total execute time)}."""
+    timing = {impl: {'Post-Route': 1000 / fmax} for impl, (fmax, _) in implementations.items()}
+    latency = {impl: {'Total Execute Time': cycles} for impl, (_, cycles) in implementations.items()}
+    return build_results({}, timing, latency)
+
+def statuses(results):
+    return {(impl, metric): status for status, impl, metric, *_ in check_results(results, load_baseline(BASELINE_FILE))}
+
+def test_baseline_values_pass():
+    assert set(statuses(results_for({'perf_opt3': (300, 6033)})).values()) == {'PASS'}
+    assert run_check(results_for({'perf_opt3': (300, 6033)}), BASELINE_FILE) == 0
+
+@pytest.mark.parametrize('fmax, cycles, metric', [(299, 6033, 'fmax_mhz'), (300, 6034, 'total_execute_time')])
+def test_regression_fails(fmax, cycles, metric):
+    results = results_for({'perf_opt3': (fmax, cycles)})
+    assert statuses(results)[('perf_opt3', metric)] == 'FAIL'
+    assert run_check(results, BASELINE_FILE) == 1
+
+def test_improvement_and_new_implementation():
+    result = statuses(results_for({'perf_opt3': (320, 6000), 'opt4_HDL': (280, 12012)}))
+    assert result[('perf_opt3', 'fmax_mhz')] == 'IMPROVED'
+    assert result[('perf_opt3', 'total_execute_time')] == 'IMPROVED'
+    assert result[('opt4_HDL', '-')] == 'NEW'
+
+def test_missing_implementation_or_metric_fails():
+    assert statuses(results_for({'perf_opt1': (300, 6033)}))[('perf_opt3', '-')] == 'MISSING'
+    results = results_for({'perf_opt3': (300, 6033)})
+    results['total_execute_time'][:] = float('nan')
+    assert statuses(results)[('perf_opt3', 'total_execute_time')] == 'MISSING'
+    assert run_check(results, BASELINE_FILE) == 1
+
+def test_written_baseline_passes(tmp_path):
+    results = results_for({'perf_opt3': (1000 / 3.33, 6033)})
+    baseline_file = str(tmp_path / 'baseline.json')
+    write_baseline(results, baseline_file)
+    assert run_check(results, baseline_file) == 0
@@ -0,0 +1,57 @@
+"""Checks of the QoR history database: series keys, trends and regression queries."""
+
+import pytest
+from qorHistory import QorHistory
+from resultsStore import build_results
+
+def results_for(luts, post_route_ns=3.0, part='xc7k410t-ffg900-2'):
+    """Results table from {impl: LUT count}, every implementation at a 3.33 ns target."""
+    return build_results({impl: {'LUT': lut} for impl, lut in luts.items()},
+                         {impl: {'Target': 3.33, 'Post-Route': post_route_ns} for impl in luts},
+                         {}, parts={impl: part for impl in luts})
+
+@pytest.fixture
+def history(tmp_path):
+    with QorHistory(str(tmp_path / 'history.sqlite')) as history:
+        history.record_run(results_for({'perf_opt3': 300, 'opt4_HDL': 270}), 'test', 'aaaa1111',
+                           run_time='2026-01-01T00:00:00')
+        history.record_run(results_for({'perf_opt3': 330, 'opt4_HDL': 270}, 3.3), 'test', 'bbbb2222',
+                           run_time='2026-01-02T00:00:00')
+        history.record_run(results_for({'perf_opt3': 360, 'opt4_HDL': 250}), 'test', 'cccc3333', dirty=True,
+                           run_time='2026-01-03T00:00:00')
+        yield history
+
+def test_runs_and_trend(history):
+    assert [(run[0], run[2], run[3]) for run in history.runs()] == [(3, 'cccc3333', 1), (2, 'bbbb2222', 0),
+                                                                     (1, 'aaaa1111', 0)]
+    trend = history.trend('perf_opt3', 'lut')
+    assert [(commit, value) for _, commit, _, _, value in trend] == [('aaaa1111', 300), ('bbbb2222', 330),
+                                                                      ('cccc3333', 360)]
+    assert {(part, clock) for _, _, part, clock, _ in trend} == {('xc7k410t-ffg900-2', 300.3)}
+    # NaN values (no DSP reported) are not stored
+    assert history.trend('perf_opt3', 'dsp') == []
+
+def test_series_keyed_by_part_and_clock(history):
+    history.record_run(results_for({'perf_opt3': 100}, part='xcvu9p-flga2104-2-i'), 'test', 'dddd4444')
+    assert len(history.trend('perf_opt3', 'lut')) == 4
+    assert len(history.trend('perf_opt3', 'lut', part='xc7k410t-ffg900-2')) == 3
+    assert len(history.trend('perf_opt3', 'lut', clock_mhz=1000 / 3.33)) == 4
+    assert history.trend('perf_opt3', 'lut', clock_mhz=250) == []
+
+def test_worst_regressions(history):
+    rows = history.worst_regressions('aaaa')
+    assert [(variant, metric) for variant, metric, *_ in rows] == [('perf_opt3', 'lut')]
+    variant, metric, part, clock, baseline, latest, change, commit = rows[0]
+    assert (baseline, latest, commit) == (300, 360, 'cccc3333')
+    assert change == pytest.approx(0.2)
+    # The post-route regression of run 2 was recovered by run 3
+    assert history.worst_regressions('2026-01-01', metric='post_route_ns') == []
+    assert [row[:2] for row in history.worst_regressions('bbbb2222')] == [('perf_opt3', 'lut')]
+
+def test_resolve_run(history):
+    assert history.resolve_run('bbbb') == 2
+    assert history.resolve_run('2026-01-02') == 2
+    assert history.resolve_run('2026-01-02T12:00:00') == 2
+    for since in ('eeee', '2025-12-31'):
+        with pytest.raises(ValueError):
+            history.resolve_run(since)
@@ -0,0 +1,72 @@
+"""Checks of the SQLite parse cache: hits, stamp changes and eviction."""
+
+import os
+from reportCache import ReportCache, cached_parse
+
+class CountingParser:
+    """Parser stand-in that records how often it really ran."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, report_file):
+        self.calls += 1
+        with open(report_file) as f:
+            return {'text': f.read()}
+
+def make_report(tmp_path, text='Slice LUTs 270\n'):
+    report = tmp_path / 'perf_opt3' / 'solution1' / 'impl' / 'export_impl.rpt'
+    report.parent.mkdir(parents=True, exist_ok=True)
+    report.write_text(text)
+    return report
+
+def test_hit_after_first_parse(tmp_path):
+    report = make_report(tmp_path)
+    parser = CountingParser()
+    with ReportCache(str(tmp_path / 'cache.sqlite')) as cache:
+        assert cached_parse(cache, 'impl/v1', parser, str(report)) == {'text': 'Slice LUTs 270\n'}
+        assert cached_parse(cache, 'impl/v1', parser, str(report)) == {'text': 'Slice LUTs 270\n'}
+        assert (parser.calls, cache.hits, cache.misses) == (1, 1, 1)
+    # Persisted across instances; a new parser key is a separate entry
+    with ReportCache(str(tmp_path / 'cache.sqlite')) as cache:
+        cached_parse(cache, 'impl/v1', parser, str(report))
+        cached_parse(cache, 'impl/v2', parser, str(report))
+        assert (parser.calls, cache.hits, cache.misses) == (2, 1, 1)
+
+def test_stamp_changes(tmp_path):
+    report = make_report(tmp_path)
+    parser = CountingParser()
+    with ReportCache(str(tmp_path / 'cache.sqlite')) as cache:
+        cached_parse(cache, 'impl/v1', parser, str(report))
+
+        # Touched, same content: served from the cache after the hash check
+        stat = os.stat(report)
+        os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        cached_parse(cache, 'impl/v1', parser, str(report))
+        assert parser.calls == 1
+
+        # Same size, new content and mtime: re-parsed
+        report.write_text('Slice LUTs 336\n')
+        os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        assert cached_parse(cache, 'impl/v1', parser, str(report)) == {'text': 'Slice LUTs 336\n'}
+
+        # Different size
+        report.write_text('Slice LUTs 1336\n')
+        assert cached_parse(cache, 'impl/v1', parser, str(report)) == {'text': 'Slice LUTs 1336\n'}
+        assert parser.calls == 3
+
+def test_evict_stale_solutions(tmp_path):
+    report = make_report(tmp_path)
+    with ReportCache(str(tmp_path / 'cache.sqlite')) as cache:
+        cached_parse(cache, 'impl/v1', CountingParser(), str(report))
+        assert cache.evict_stale() == 0
+        report.unlink()
+        report.parent.rmdir()
+        report.parent.parent.rmdir()
+        assert cache.evict_stale() == 1
+        assert cache.lookup('impl/v1', str(report)) == (False, None)
+
+def test_no_cache():
+    parser = CountingParser()
+    assert cached_parse(None, 'impl/v1', parser, __file__)['text'].startswith('"""')
+    assert parser.calls == 1
@@ -0,0 +1,56 @@
+"""Checks of the .npz results store: save/load round trip, merging and back-conversion."""
+
+import numpy as np
+from resultsStore import SCHEMA, build_results, load_results, merge_results, results_to_dicts, save_results
+
+RESOURCES = {'perf_opt3': {'LUT': 336, 'FF': 296, 'DSP': 0, 'BRAM': 0}, 'opt4_HDL': {'LUT': 270, 'FF': 199}}
+TIMING = {'perf_opt3': {'Target': 3.33, 'Post-Route': 2.952}, 'opt4_HDL': {'Target': 5.0, 'Post-Route': 3.554}}
+LATENCY = {'perf_opt3': {'Total Execute Time': 6033}, 'opt4_HDL': {'Total Execute Time': 12012}}
+
+def assert_tables_equal(actual, expected):
+    assert list(actual) == list(expected)
+    for column, values in expected.items():
+        np.testing.assert_array_equal(actual[column], values, err_msg=column)
+
+def test_round_trip(tmp_path):
+    results = build_results(RESOURCES, TIMING, LATENCY, flow={'perf_opt3': 'HLS', 'opt4_HDL': 'HDLCoder'},
+                            parts={'perf_opt3': 'xc7k410t-ffg900-2'})
+    store_file = str(tmp_path / 'results.npz')
+    save_results(results, store_file)
+    loaded = load_results(store_file)
+    assert_tables_equal(loaded, results)
+    assert list(loaded['flow']) == ['HLS', 'HDLCoder']
+    assert list(loaded['part']) == ['xc7k410t-ffg900-2', '']
+    np.testing.assert_array_equal(loaded['lut'], [336, 270])
+    assert np.isnan(loaded['dsp'][1])
+    np.testing.assert_allclose(loaded['clock_mhz'], [1000 / 3.33, 200])
+
+def test_missing_columns_load_as_nan(tmp_path):
+    store_file = str(tmp_path / 'old.npz')
+    np.savez(store_file, implementation=np.array(['perf_opt1']), lut=np.array([1000.0]))
+    loaded = load_results(store_file)
+    assert list(loaded) == list(SCHEMA)
+    assert loaded['lut'][0] == 1000 and np.isnan(loaded['ff'][0]) and loaded['part'][0] == ''
+
+def test_merge_and_back_to_dicts():
+    hls = build_results(RESOURCES, TIMING, LATENCY)
+    rerun = build_results({'perf_opt3': {'LUT': 400}}, {}, {})
+    merged = merge_results(hls, None, rerun)
+    assert list(merged['implementation']) == ['perf_opt3', 'opt4_HDL']
+    np.testing.assert_array_equal(merged['lut'], [400, 270])
+
+    all_resources, all_timing, all_latency = results_to_dicts(hls)
+    assert all_resources == RESOURCES
+    assert all_timing == TIMING
+    assert all_latency['opt4_HDL'] == {'Total Execute Time': 12012}
+
+def test_long_strings_round_trip(tmp_path):
+    name = 'perf_opt3_' + 'unroll' * 20
+    part = 'xcvu9p-flga2104-2-i' * 3
+    results = build_results({name: {'LUT': 336}}, {}, {}, flow='HLS_' + 'x' * 40, parts={name: part})
+    store_file = str(tmp_path / 'results.npz')
+    save_results(results, store_file)
+    loaded = load_results(store_file)
+    assert (loaded['implementation'][0], loaded['part'][0], loaded['flow'][0]) == (name, part, 'HLS_' + 'x' * 40)
+    assert list(merge_results(loaded, build_results({'opt4_HDL': {'LUT': 270}}, {}, {}))['implementation']) \
+        == [name, 'opt4_HDL']
@@ -0,0 +1,39 @@
+"""Checks of the text and hex vector writers against np.savetxt and HDL Coder's *.dat files."""
+
+import os
+import numpy as np
+import pytest
+from apFixed import parse_format
+from vectorStore import read_hex, read_text, write_hex, write_text
+
+HDLSRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'HDLCoder', 'opt4_HDL', 'codegen',
+                      'peakPicker', 'hdlsrc')
+
+@pytest.mark.parametrize('name', ['xcorr.dat', 'threshold.dat'])
+def test_hex_reproduces_hdl_coder_file(tmp_path, name):
+    data_type = parse_format('ap_ufixed<14, -7>')
+    write_hex(read_hex(os.path.join(HDLSRC, name), data_type), str(tmp_path / name), data_type)
+    with open(os.path.join(HDLSRC, name), 'rb') as expected, open(tmp_path / name, 'rb') as written:
+        assert written.read() == expected.read()
+
+def test_text_matches_savetxt(tmp_path):
+    values = np.random.default_rng(0).standard_normal(1000) * np.logspace(-300, 300, 1000)
+    write_text(values, str(tmp_path / 'values.txt'))
+    np.savetxt(tmp_path / 'savetxt.txt', values.reshape(-1, 1), fmt='%.17g')
+    assert (tmp_path / 'values.txt').read_text() == (tmp_path / 'savetxt.txt').read_text()
+    np.testing.assert_array_equal(read_text(str(tmp_path / 'values.txt')), values)
+
+@pytest.mark.parametrize('declaration', ['ap_fixed<10, 2>', 'ap_ufixed<13, 1>', 'ap_fixed<32, 8, AP_RND, AP_SAT>'])
+def test_hex_matches_savetxt(tmp_path, declaration):
+    data_type = parse_format(declaration)
+    values = np.random.default_rng(1).uniform(-300, 300, 1000)
+    write_hex(values, str(tmp_path / 'values.dat'), data_type)
+    codes = data_type.quantize(values) & ((1 << data_type.width) - 1)
+    np.savetxt(tmp_path / 'savetxt.dat', codes.reshape(-1, 1), fmt=f'%0{-(-data_type.width // 4)}x')
+    assert (tmp_path / 'values.dat').read_bytes() == (tmp_path / 'savetxt.dat').read_bytes()
+    np.testing.assert_array_equal(read_hex(str(tmp_path / 'values.dat'), data_type), data_type.fixed_values(values))
+
+def test_empty(tmp_path):
+    write_text([], str(tmp_path / 'empty.txt'))
+    write_hex([], str(tmp_path / 'empty.dat'), parse_format('ap_fixed<8, 2>'))
+    assert (tmp_path / 'empty.txt').read_text() == '' and (tmp_path / 'empty.dat').read_bytes() == b''
@@ -0,0 +1,121 @@
+"""Checks of the Vivado timing report parser on synthetic report_timing_summary / report_timing text."""
+
+import pytest
+from vivadoTiming import format_critical_path, merge_timing_closure, parse_timing_report
+
+SUMMARY = """\
+------------------------------------------------------------------------------------------------
+| Design Timing Summary
+| ---------------------
+------------------------------------------------------------------------------------------------
+
+    WNS(ns)      TNS(ns)  TNS Failing Endpoints  TNS Total Endpoints      WHS(ns)      THS(ns)  THS Failing Endpoints  THS Total Endpoints
+    -------      -------  ---------------------  -------------------      -------      -------  ---------------------  -------------------
+     -0.124       -1.532                     21                  521        0.108        0.000                      0                  521
+
+
+"""
+
+SETUP_PATH = """\
+Slack (VIOLATED) :        -0.124ns  (required time - arrival time)
+  Source:                 window_reg[3]/C
+                            (rising edge-triggered cell FDRE clocked by ap_clk  {rise@0.000ns fall@1.665ns period=3.330ns})
+  Destination:            locations_reg[0]/D
+  Path Group:             ap_clk
+  Path Type:              Setup (Max at Slow Process Corner)
+  Requirement:            3.330ns  (ap_clk rise@3.330ns - ap_clk rise@0.000ns)
+  Data Path Delay:        3.410ns  (logic 1.234ns (36.188%)  route 2.176ns (63.812%))
+  Logic Levels:           5  (CARRY4=3 LUT3=1 LUT6=1)
+
+"""
+
+MET_SETUP_PATH = """\
+Slack (MET) :             0.512ns  (required time - arrival time)
+  Source:                 xcorr_reg[0]/C
+  Destination:            window_reg[0]/D
+  Path Group:             ap_clk
+  Path Type:              Setup (Max at Slow Process Corner)
+  Requirement:            3.330ns  (ap_clk rise@3.330ns - ap_clk rise@0.000ns)
+  Data Path Delay:        2.700ns  (logic 0.700ns (25.926%)  route 2.000ns (74.074%))
+  Logic Levels:           2  (LUT2=1 LUT6=1)
+
+"""
+
+HOLD_PATH = """\
+Slack (MET) :             0.108ns  (arrival time - required time)
+  Source:                 window_reg[0]/C
+  Destination:            window_reg[1]/D
+  Path Group:             ap_clk
+  Path Type:              Hold (Min at Fast Process Corner)
+  Requirement:            0.000ns  (ap_clk rise@0.000ns - ap_clk rise@0.000ns)
+  Data Path Delay:        0.300ns  (logic 0.141ns (47.000%)  route 0.159ns (53.000%))
+  Logic Levels:           0
+
+"""
+
+UNCONSTRAINED_PATH = """\
+Slack:                    inf
+  Source:                 xcorr_TDATA[0]
+                            (input port)
+  Destination:            xcorr_reg[0]/D
+  Path Group:             (none)
+  Path Type:              Max at Slow Process Corner
+  Data Path Delay:        5.000ns  (logic 1.000ns (20.000%)  route 4.000ns (80.000%))
+  Logic Levels:           1  (IBUF=1)
+
+"""
+
+CRITICAL_PATH = {
+    'Critical Path Slack': -0.124,
+    'Startpoint': 'window_reg[3]/C',
+    'Endpoint': 'locations_reg[0]/D',
+    'Requirement': 3.33,
+    'Data Path Delay': 3.41,
+    'Logic Delay': 1.234,
+    'Route Delay': 2.176,
+    'Logic Levels': 5,
+    'Cell Mix': 'CARRY4=3 LUT3=1 LUT6=1',
+}
+
+def write_report(tmp_path, name, *sections):
+    report = tmp_path / name
+    report.write_text(''.join(sections))
+    return str(report)
+
+def test_timing_summary(tmp_path):
+    closure = parse_timing_report(write_report(tmp_path, 'peakPicker_timing_routed.rpt', SUMMARY, HOLD_PATH,
+                                               SETUP_PATH, MET_SETUP_PATH))
+    assert closure == {'WNS': -0.124, 'TNS': -1.532, 'Failing Endpoints': 21, 'Total Endpoints': 521,
+                       'WHS': 0.108, **CRITICAL_PATH}
+
+def test_hold_paths_ignored(tmp_path):
+    assert parse_timing_report(write_report(tmp_path, 'hold.rpt', HOLD_PATH)) is None
+
+def test_merge_summary_and_paths(tmp_path):
+    summary = parse_timing_report(write_report(tmp_path, 'peakPicker_timing_routed.rpt', SUMMARY))
+    paths = parse_timing_report(write_report(tmp_path, 'peakPicker_timing_paths_routed.rpt', MET_SETUP_PATH,
+                                             SETUP_PATH))
+    assert summary['WNS'] == -0.124 and 'Data Path Delay' not in summary
+    assert paths == CRITICAL_PATH
+    assert merge_timing_closure([None, summary, paths]) == {**summary, **CRITICAL_PATH}
+    # A lone report_timing gives its worst slack as the WNS
+    assert merge_timing_closure([paths])['WNS'] == -0.124
+    assert merge_timing_closure([None]) is None
+
+def test_format_critical_path():
+    assert format_critical_path(CRITICAL_PATH) == (
+        'window_reg[3]/C -> locations_reg[0]/D: 5 levels (CARRY4=3 LUT3=1 LUT6=1), 3.410 ns '
+        '= 1.234 logic + 2.176 route (64% route)')
+
+@pytest.mark.parametrize('slack', ['0.512', '-0.124'])
+def test_slack_without_verdict(tmp_path, slack):
+    report = write_report(tmp_path, 'paths.rpt', MET_SETUP_PATH.replace('Slack (MET) :             0.512',
+                                                                        f'Slack:                    {slack}'))
+    assert parse_timing_report(report)['Critical Path Slack'] == float(slack)
+
+def test_unconstrained_paths(tmp_path):
+    # 'Slack: inf' starts a path of its own; its fields must not land on the worst setup path
+    report = write_report(tmp_path, 'peakPicker_timing_routed.rpt', SUMMARY, SETUP_PATH, UNCONSTRAINED_PATH,
+                          HOLD_PATH, UNCONSTRAINED_PATH.replace('Max at', 'Setup (Max at').replace('Corner', 'Corner)'))
+    assert parse_timing_report(report) == {'WNS': -0.124, 'TNS': -1.532, 'Failing Endpoints': 21,
+                                           'Total Endpoints': 521, 'WHS': 0.108, **CRITICAL_PATH}
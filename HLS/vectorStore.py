@@ -0,0 +1,258 @@
+"""
+Test-vector formats and a content-addressed binary vector store.
+
+The peak picker's stimulus exists in three encodings:
+
+    *.txt    one float per line (MATLAB writematrix): pssCorrMagSq_3_in.txt, threshold_in.txt
+    *.dat    one hex code per line, read by HDL Coder's testbench with $fscanf("%h"):
+             xcorr.dat / threshold.dat are ufix14_En21 (ap_ufixed<14, -7>)
+    *.npy    NumPy binary; *.f64 raw little-endian float64
+
+load() and save() convert between them by extension (.dat needs the
+fixed-point format of its codes, an apFixed.FixedFormat). Text and hex are
+parsed with one read and one vectorized conversion rather than line by line,
+and written with one formatting pass and one write; .npy and .f64 are
+memory-mapped, so a multi-GB capture opens in milliseconds and pages in only
+what is touched.
+
+VectorStore keeps every vector it has seen as objects/<sha1[:2]>/<sha1>.npy,
+the SHA-1 taken over dtype, shape and data, so identical vectors are stored
+once whatever file they came from. An index (index.json) maps each source
+file's path, size and mtime to its object, as in reportCache: after the
+first import a text vector loads as a zero-copy memmap.
+
+Usage:
+    xcorr = load('pssCorrMagSq_3_in.txt')
+    save(xcorr, 'xcorr.dat', parse_format('ap_ufixed<14, -7>'))
+    with VectorStore() as store:
+        xcorr = store.load('HLS/origin/pssCorrMagSq_3_in.txt')    # memmap from the second run on
+    python vectorStore.py convert pssCorrMagSq_3_in.txt xcorr.dat --data-type 'ap_ufixed<14, -7>'
+    python vectorStore.py import HLS/*/pssCorrMagSq_3_in.txt [--store .vector_store]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import numpy as np
+from apFixed import parse_format
+
+DEFAULT_STORE_DIR = '.vector_store'
+TEXT_SUFFIXES = ('.txt', '.csv')
+HEX_SUFFIXES = ('.dat',)
+NPY_SUFFIXES = ('.npy',)
+RAW_SUFFIXES = ('.f64',)
+
+def _suffix(path):
+    return os.path.splitext(path)[1].lower()
+
+def read_text(path):
+    """One value per line (or whitespace separated) -> float64."""
+    with open(path, 'r') as f:
+        return np.array(f.read().replace(',', ' ').split(), dtype=np.float64)
+
+def _hex_nibbles():
+    """Byte -> hex digit value lookup, -1 for whitespace and -2 for anything else."""
+    table = np.full(256, -2, dtype=np.int8)
+    for digits, base in ((b'0123456789', 0), (b'abcdef', 10), (b'ABCDEF', 10)):
+        table[np.frombuffer(digits, dtype=np.uint8)] = base + np.arange(len(digits))
+    table[np.frombuffer(b' \t\r\n\v\f', dtype=np.uint8)] = -1
+    return table
+
+HEX_NIBBLES = _hex_nibbles()
+# Nibble value -> lowercase hex digit byte
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+# Longest token whose code fits an int64
+MAX_HEX_DIGITS = 15
+
+def parse_hex_codes(data):
+    """Whitespace-separated hex tokens (bytes) -> int64 codes, via a per-byte nibble lookup."""
+    nibbles = HEX_NIBBLES[np.frombuffer(data, dtype=np.uint8)]
+    if np.any(nibbles == -2):
+        position = int(np.argmax(nibbles == -2))
+        raise ValueError(f"Not a hex digit at byte {position}: {data[position:position + 1]!r}")
+    digit = nibbles >= 0
+    starts = np.flatnonzero(digit & ~np.concatenate(([False], digit[:-1])))
+    ends = np.flatnonzero(digit & ~np.concatenate((digit[1:], [False]))) + 1
+    if not len(starts):
+        return np.empty(0, dtype=np.int64)
+    lengths = ends - starts
+    if lengths.max() > MAX_HEX_DIGITS:
+        raise ValueError(f"Hex token longer than {MAX_HEX_DIGITS} digits does not fit an int64 code")
+    values = nibbles[digit].astype(np.int64)
+    if np.all(lengths == lengths[0]):
+        # Fixed-width codes (HDL Coder's *.dat): one Horner step per digit column
+        columns = values.reshape(len(starts), lengths[0])
+        codes = columns[:, 0].copy()
+        for column in range(1, lengths[0]):
+            codes = (codes << 4) | columns[:, column]
+        return codes
+    # Each digit weighted by its power of 16 within its token, summed per token as a
+    # difference of running sums (uint64, so wraparound cancels exactly)
+    shifts = 4 * (np.repeat(ends, lengths) - np.flatnonzero(digit) - 1)
+    totals = np.concatenate((np.zeros(1, dtype=np.uint64), np.cumsum((values << shifts).astype(np.uint64))))
+    last = np.cumsum(lengths)
+    return (totals[last] - totals[last - lengths]).astype(np.int64)
+
+def read_hex(path, data_type):
+    """Hex codes of data_type (two's complement when signed) -> float64 values."""
+    with open(path, 'rb') as f:
+        codes = parse_hex_codes(f.read())
+    codes &= (1 << data_type.width) - 1
+    if data_type.signed:
+        codes -= (codes >> (data_type.width - 1)) << data_type.width
+    return data_type.to_float(codes)
+
+def write_text(values, path):
+    """Write one value per line with enough digits to round-trip float64."""
+    values = np.asarray(values, dtype=np.float64).reshape(-1).tolist()
+    # One % over the whole vector instead of np.savetxt's format and write per row
+    with open(path, 'w') as f:
+        f.write(('%.17g\n' * len(values)) % tuple(values))
+
+def write_hex(values, path, data_type):
+    """Quantize to data_type and write its codes as fixed-width hex, like HDL Coder's *.dat."""
+    codes = data_type.quantize(values).reshape(-1) & ((1 << data_type.width) - 1)
+    digits = -(-data_type.width // 4)
+    # Each row is the code's digits, most significant first, then a newline
+    lines = np.empty((len(codes), digits + 1), dtype=np.uint8)
+    for column in range(digits):
+        lines[:, column] = HEX_DIGITS[(codes >> (4 * (digits - 1 - column))) & 0xF]
+    lines[:, digits] = ord('\n')
+    with open(path, 'wb') as f:
+        f.write(lines.tobytes())
+
+def load(path, data_type=None, mmap=True):
+    """Load a vector by extension; .npy/.f64 are memory-mapped (read-only) unless mmap=False."""
+    suffix = _suffix(path)
+    if suffix in TEXT_SUFFIXES:
+        return read_text(path)
+    if suffix in HEX_SUFFIXES:
+        if data_type is None:
+            raise ValueError(f"{path}: hex vectors need the fixed-point format of their codes")
+        return read_hex(path, data_type)
+    if suffix in NPY_SUFFIXES:
+        return np.load(path, mmap_mode='r' if mmap else None)
+    if suffix in RAW_SUFFIXES:
+        return np.memmap(path, dtype='<f8', mode='r') if mmap else np.fromfile(path, dtype='<f8')
+    raise ValueError(f"{path}: unknown vector format {suffix!r}")
+
+def save(values, path, data_type=None):
+    """Write a vector in the format given by the extension (see load)."""
+    suffix = _suffix(path)
+    if suffix in TEXT_SUFFIXES:
+        write_text(values, path)
+    elif suffix in HEX_SUFFIXES:
+        if data_type is None:
+            raise ValueError(f"{path}: hex vectors need a fixed-point format")
+        write_hex(values, path, data_type)
+    elif suffix in NPY_SUFFIXES:
+        np.save(path, np.asarray(values))
+    elif suffix in RAW_SUFFIXES:
+        np.asarray(values, dtype='<f8').tofile(path)
+    else:
+        raise ValueError(f"{path}: unknown vector format {suffix!r}")
+
+def content_digest(values):
+    """SHA-1 of a vector's dtype, shape and bytes."""
+    values = np.ascontiguousarray(values)
+    sha1 = hashlib.sha1(f"{values.dtype.str}{values.shape}".encode())
+    sha1.update(memoryview(values.reshape(-1)).cast('B'))
+    return sha1.hexdigest()
+
+class VectorStore:
+    """Content-addressed .npy objects plus a source-file index."""
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        self.index_file = os.path.join(root, 'index.json')
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self.index = {}
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                self.index = json.load(f)
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Write the index if it changed."""
+        if self._dirty:
+            temp_file = self.index_file + '.tmp'
+            with open(temp_file, 'w') as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+            os.replace(temp_file, self.index_file)
+            self._dirty = False
+
+    def object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.npy")
+
+    def put(self, values):
+        """Store a vector (once per content); returns its digest."""
+        values = np.ascontiguousarray(values)
+        digest = content_digest(values)
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_file = f"{path}.{os.getpid()}.tmp.npy"
+            np.save(temp_file, values)
+            os.replace(temp_file, path)
+        return digest
+
+    def get(self, digest):
+        """Read-only memmap of a stored vector."""
+        return np.load(self.object_path(digest), mmap_mode='r')
+
+    def load(self, path, data_type=None):
+        """Load a vector file through the store: parsed once, memory-mapped afterwards."""
+        st = os.stat(path)
+        key = os.path.abspath(path)
+        entry = self.index.get(key)
+        data_key = str(data_type) if data_type is not None else ''
+        if (entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and entry['data_type'] == data_key and os.path.exists(self.object_path(entry['digest']))):
+            self.hits += 1
+            return self.get(entry['digest'])
+        self.misses += 1
+        digest = self.put(load(path, data_type, mmap=False))
+        self.index[key] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'data_type': data_key, 'digest': digest}
+        self._dirty = True
+        return self.get(digest)
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert test vectors and manage the binary vector store')
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help='Convert a vector between .txt, .dat, .npy and .f64')
+    convert.add_argument('source')
+    convert.add_argument('destination')
+    convert.add_argument('--data-type', type=parse_format, default=None,
+                         help="Fixed-point format of .dat codes, e.g. 'ap_ufixed<14, -7>'")
+    store_import = commands.add_parser('import', help='Add vector files to the store and print their digests')
+    store_import.add_argument('files', nargs='+')
+    store_import.add_argument('--data-type', type=parse_format, default=None)
+    store_import.add_argument('--store', default=DEFAULT_STORE_DIR, help='Store directory')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        values = load(args.source, args.data_type, mmap=True)
+        save(values, args.destination, args.data_type)
+        print(f"{args.source} -> {args.destination} ({len(values)} samples)")
+        return 0
+
+    with VectorStore(args.store) as store:
+        for path in args.files:
+            values = store.load(path, args.data_type)
+            print(f"{store.index[os.path.abspath(path)]['digest']}  {len(values):>10}  {path}")
+        print(f"{len(set(entry['digest'] for entry in store.index.values()))} distinct vector(s) in {args.store} "
+              f"({store.hits} cached, {store.misses} parsed)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Vivado timing-closure detail for the report analyzers.
+
+Vitis HLS export (-flow impl) leaves the Vivado timing reports of each
+solution in impl/verilog/report: <top>_timing_routed.rpt is a
+report_timing_summary, <top>_timing_paths_routed.rpt a report_timing of the
+worst paths. Both are read with the same streaming parser:
+
+    Design Timing Summary          WNS, TNS, failing / total setup endpoints, WHS
+    Slack (MET|VIOLATED) : ...     one timing path; the worst setup path gives the
+      Requirement:                 critical-path requirement, data path delay and its
+      Data Path Delay:             logic / route split, logic levels and the cell mix
+      Logic Levels:                (e.g. CARRY4=3 LUT3=1 LUT6=1)
+
+A post-route period above target is explained by this split: many logic
+levels mean the datapath needs re-pipelining, a high route share points at
+placement/fanout instead. Values are in ns, keyed by the CLOSURE_COLUMNS
+labels; Startpoint, Endpoint and Cell Mix are kept as text.
+
+Usage:
+    closure = merge_timing_closure([parse_timing_report(path), ...])
+"""
+
+import re
+
+# column -> (dtype, label); stored in the results store next to the timing columns
+CLOSURE_COLUMNS = {
+    'wns_ns': ('f8', 'WNS'),
+    'tns_ns': ('f8', 'TNS'),
+    'failing_endpoints': ('f8', 'Failing Endpoints'),
+    'total_endpoints': ('f8', 'Total Endpoints'),
+    'logic_levels': ('f8', 'Logic Levels'),
+    'path_delay_ns': ('f8', 'Data Path Delay'),
+    'logic_delay_ns': ('f8', 'Logic Delay'),
+    'route_delay_ns': ('f8', 'Route Delay'),
+}
+
+# Timing reports below <solution>/impl/verilog/report (routed only)
+TIMING_REPORT_RE = re.compile(r'.*_timing(_paths)?_routed\.rpt$')
+
+# Design Timing Summary header -> label
+SUMMARY_FIELDS = {
+    'WNS(ns)': 'WNS',
+    'TNS(ns)': 'TNS',
+    'TNS Failing Endpoints': 'Failing Endpoints',
+    'TNS Total Endpoints': 'Total Endpoints',
+    'WHS(ns)': 'WHS',
+}
+
+SLACK_RE = re.compile(r'^Slack(?: \((?:MET|VIOLATED)\))?\s*:\s*(?:(-?[\d.]+)ns|inf)')
+PATH_FIELD_RE = re.compile(r'^\s+(Source|Destination|Path Type|Requirement|Data Path Delay|Logic Levels):\s+(.*)$')
+DELAY_RE = re.compile(r'([\d.]+)ns\s+\(logic ([\d.]+)ns .*?route ([\d.]+)ns')
+LEVELS_RE = re.compile(r'(\d+)\s*(?:\((.*)\))?')
+
+def _finish_path(path, worst):
+    """Keep the worse of two setup paths (lower slack)."""
+    if path is None or 'Data Path Delay' not in path or not path.get('setup', True):
+        return worst
+    if worst is None or path['Critical Path Slack'] < worst['Critical Path Slack']:
+        return path
+    return worst
+
+def _summary_values(header, values):
+    """Zip a Design Timing Summary header line (2+ space separated) with its value line."""
+    names = re.split(r'\s{2,}', header.strip())
+    numbers = values.split()
+    summary = {}
+    for name, number in zip(names, numbers):
+        if name in SUMMARY_FIELDS:
+            summary[SUMMARY_FIELDS[name]] = int(number) if 'Endpoints' in name else float(number)
+    return summary
+
+def parse_timing_report(report_file):
+    """Parse a Vivado report_timing_summary / report_timing file, streamed line by line.
+
+    Returns a dict with the Design Timing Summary fields and the worst setup
+    path found (see the module docstring), or None if neither is present.
+    """
+    closure = {}
+    worst = None
+    path = None
+    header = None
+    pending_values = False
+
+    with open(report_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            # Design Timing Summary: header, dashes, values
+            if 'WNS(ns)' in line and 'TNS(ns)' in line:
+                header, pending_values = line, False
+                continue
+            if header is not None:
+                if line.strip().startswith('---'):
+                    pending_values = True
+                elif pending_values and line.strip():
+                    if 'WNS' not in closure:
+                        closure.update(_summary_values(header, line))
+                    header, pending_values = None, False
+                continue
+
+            match = SLACK_RE.match(line)
+            if match:
+                worst = _finish_path(path, worst)
+                # Unconstrained paths report 'Slack: inf' (no unit); group 1 is None
+                slack = match.group(1)
+                path = {'Critical Path Slack': float('inf') if slack is None else float(slack)}
+                continue
+            if path is None:
+                continue
+            match = PATH_FIELD_RE.match(line)
+            if not match:
+                continue
+            field, value = match.group(1), match.group(2).strip()
+            if field == 'Source':
+                path['Startpoint'] = value
+            elif field == 'Destination':
+                path['Endpoint'] = value
+            elif field == 'Path Type':
+                path['setup'] = value.startswith('Setup')
+            elif field == 'Requirement':
+                path['Requirement'] = float(value.split('ns')[0])
+            elif field == 'Data Path Delay':
+                delays = DELAY_RE.match(value)
+                if delays:
+                    path['Data Path Delay'], path['Logic Delay'], path['Route Delay'] = map(float, delays.groups())
+            elif field == 'Logic Levels':
+                levels = LEVELS_RE.match(value)
+                if levels:
+                    path['Logic Levels'] = int(levels.group(1))
+                    path['Cell Mix'] = levels.group(2) or ''
+    worst = _finish_path(path, worst)
+
+    if worst is not None:
+        worst.pop('setup', None)
+        closure.update(worst)
+    return closure or None
+
+def merge_timing_closure(records):
+    """Join the parsed timing reports of one implementation.
+
+    The first Design Timing Summary found is kept and the worst setup path of
+    all reports wins. A lone report_timing (no summary) still gives the WNS as
+    its worst slack. Returns None when no record has anything.
+    """
+    closure = {}
+    worst = None
+    for record in records:
+        if not record:
+            continue
+        for label in SUMMARY_FIELDS.values():
+            if label in record:
+                closure.setdefault(label, record[label])
+        if 'Data Path Delay' in record and (
+                worst is None or record['Critical Path Slack'] < worst['Critical Path Slack']):
+            worst = record
+    if worst is not None:
+        closure.update({label: value for label, value in worst.items() if label not in SUMMARY_FIELDS.values()})
+        closure.setdefault('WNS', worst['Critical Path Slack'])
+    return closure or None
+
+def format_critical_path(closure):
+    """One-line description of the worst setup path, e.g. for the TXT summary."""
+    route_share = closure['Route Delay'] / closure['Data Path Delay'] if closure['Data Path Delay'] else 0
+    mix = f" ({closure['Cell Mix']})" if closure.get('Cell Mix') else ''
+    return (f"{closure.get('Startpoint', '?')} -> {closure.get('Endpoint', '?')}: "
+            f"{closure['Logic Levels']} levels{mix}, {closure['Data Path Delay']:.3f} ns "
+            f"= {closure['Logic Delay']:.3f} logic + {closure['Route Delay']:.3f} route ({route_share:.0%} route)")
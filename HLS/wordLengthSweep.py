@@ -0,0 +1,194 @@
+"""
+Word-length sweep for the peak picker's fixed-point DataType.
+
+perf_opt3 stores xcorr and threshold as `typedef ap_fixed<20, 1> DataType`
+(HDL Coder's fixpt conversion chose ufix14_En21, i.e. ap_ufixed<14, -7>).
+Every bit of DataType is paid for WINDOW_LENGTH times in each of the two
+shift registers and once in each of the WINDOW_LENGTH comparators. This tool
+finds the narrowest type that still gives the reference locations.
+
+Every candidate ap_[u]fixed<W, I, Q> of the sweep becomes one column of a
+(samples x candidates) array (apFixed.fixed_columns), and all columns are
+peak-picked together by peakpicker.batch_peak_picker, in column batches of
+BATCH_COLUMNS to bound memory. A candidate passes when, for every test
+vector directory, it reproduces that directory's reference locations and
+every reference peak clears its threshold by at least --min-margin LSBs, so
+that no decision sits on a rounding edge. The single 6001-sample vector with
+one peak constrains little on its own; pass more vector sets with --dir for a
+choice that holds across channels and noise levels.
+
+The quantization mode only matters for the conversion in the testbench
+(DataType(double)), not in the kernel, so it is swept but costs nothing.
+Resources are estimated for the kernel's storage and comparators:
+
+    FF  = 2 * WINDOW_LENGTH * W                 xcorrBuffer + thresholdBuffer
+    LUT = WINDOW_LENGTH * ceil(W / 2)           10 window compares + 1 threshold compare,
+                                                ~2 bits per LUT6 into the carry chain
+
+and reported against the baseline type (the DataType typedef in the first
+directory's peakPicker.hpp, else ap_fixed<20, 1>).
+
+Usage:
+    python wordLengthSweep.py [--dir perf_opt3 ...] [--widths 4:24] [--integer-bits -10:2]
+                              [--modes AP_TRN AP_RND AP_RND_CONV] [--min-margin 1] [--output word_length_sweep.txt]
+"""
+
+import argparse
+import math
+import os
+import re
+import sys
+import time
+import numpy as np
+from apFixed import FixedFormat, QUANTIZATION_MODES, fixed_columns, parse_format
+from lazyImports import lazy_module
+from peakpicker import (DEFAULT_WINDOW_LENGTH, REFERENCE_FILE, THRESHOLD_FILE, XCORR_FILE,
+                        batch_peak_picker, load_vector)
+
+pd = lazy_module('pandas')
+
+DEFAULT_BASELINE = 'ap_fixed<20, 1>'
+DEFAULT_MODES = ('AP_TRN', 'AP_RND', 'AP_RND_CONV')
+# Candidates peak-picked per batch: samples x BATCH_COLUMNS float64 per array
+BATCH_COLUMNS = 256
+DATATYPE_RE = re.compile(r'typedef\s+(ap_u?fixed\s*<[^>]*>)\s+DataType\s*;')
+
+def parse_range(text):
+    """'lo:hi' (inclusive) or a single integer -> list of ints."""
+    low, _, high = text.partition(':')
+    return list(range(int(low), int(high or low) + 1))
+
+def baseline_format(directory):
+    """The DataType typedef of a variant's peakPicker.hpp, or DEFAULT_BASELINE."""
+    header = os.path.join(directory, 'peakPicker.hpp')
+    if os.path.exists(header):
+        with open(header, 'r') as f:
+            match = DATATYPE_RE.search(f.read())
+        if match:
+            return parse_format(match.group(1))
+    return parse_format(DEFAULT_BASELINE)
+
+def candidate_formats(widths, integer_bits, modes, overflow='AP_WRAP', signedness=(True, False)):
+    """Every (signedness, W, I, quantization) combination of the sweep."""
+    return [FixedFormat(width, integer, mode, overflow, signed)
+            for signed in signedness for width in widths for integer in integer_bits for mode in modes]
+
+def estimate_resources(width, window_length=DEFAULT_WINDOW_LENGTH):
+    """(LUT, FF) of the kernel's DataType storage and comparators (see the module docstring)."""
+    return window_length * math.ceil(width / 2), 2 * window_length * width
+
+def evaluate_candidates(vectors, formats, window_length=DEFAULT_WINDOW_LENGTH, strict=True):
+    """Peak-pick every candidate on every (xcorr, threshold, reference) vector set.
+
+    Returns {'passed', 'margin_lsb', 'flips'} arrays over formats: passed
+    is True when every vector set reproduces its reference, margin_lsb is
+    the smallest (xcorr - threshold) / LSB over all reference peaks and
+    flips counts threshold decisions that differ from float64.
+    """
+    passed = np.ones(len(formats), dtype=bool)
+    margin = np.full(len(formats), np.inf)
+    flips = np.zeros(len(formats), dtype=np.int64)
+    lsb = np.array([fmt.lsb for fmt in formats])
+    for xcorr, threshold, reference in vectors:
+        decisions = xcorr > threshold if strict else xcorr >= threshold
+        peaks = reference - 1
+        for start in range(0, len(formats), BATCH_COLUMNS):
+            batch = slice(start, start + BATCH_COLUMNS)
+            xcorr_q = fixed_columns(xcorr, formats[batch])
+            threshold_q = fixed_columns(threshold, formats[batch])
+            locations = batch_peak_picker(xcorr_q, threshold_q, window_length, strict)
+            for column in range(xcorr_q.shape[1]):
+                if not np.array_equal(locations.column(column), reference):
+                    passed[start + column] = False
+            decisions_q = xcorr_q > threshold_q if strict else xcorr_q >= threshold_q
+            flips[batch] += np.count_nonzero(decisions_q != decisions[:, None], axis=0)
+            if len(peaks):
+                gap = (xcorr_q[peaks] - threshold_q[peaks]).min(axis=0) / lsb[batch]
+                margin[batch] = np.minimum(margin[batch], gap)
+    return {'passed': passed, 'margin_lsb': margin, 'flips': flips}
+
+def sweep_table(formats, evaluation, baseline, window_length=DEFAULT_WINDOW_LENGTH):
+    """DataFrame of the candidates, narrowest passing first."""
+    base_lut, base_ff = estimate_resources(baseline.width, window_length)
+    rows = []
+    for index, fmt in enumerate(formats):
+        lut, ff = estimate_resources(fmt.width, window_length)
+        rows.append({
+            'Type': f"ap_{'' if fmt.signed else 'u'}fixed<{fmt.width}, {fmt.integer}, {fmt.quantization}>",
+            'W': fmt.width,
+            'Passed': bool(evaluation['passed'][index]),
+            'Margin (LSB)': evaluation['margin_lsb'][index],
+            'Flips': int(evaluation['flips'][index]),
+            'LUT': lut,
+            'FF': ff,
+            'LUT Saved': base_lut - lut,
+            'FF Saved': base_ff - ff,
+        })
+    table = pd.DataFrame(rows)
+    return table.sort_values(['Passed', 'W', 'Margin (LSB)', 'Flips'],
+                             ascending=[False, True, False, True], kind='stable').reset_index(drop=True)
+
+def load_vectors(directories):
+    """(xcorr, threshold, reference) per directory; the reference must exist."""
+    vectors = []
+    for directory in directories:
+        reference = load_vector(os.path.join(directory, REFERENCE_FILE)).astype(np.int64)
+        vectors.append((load_vector(os.path.join(directory, XCORR_FILE)),
+                        load_vector(os.path.join(directory, THRESHOLD_FILE)), reference))
+    return vectors
+
+def parse_arguments():
+    """Parse command line arguments."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Find the narrowest peak picker DataType that reproduces the reference')
+    parser.add_argument('--dir', action='append', default=None,
+                        help=f'Test vector directory (repeatable; default: {os.path.join(here, "perf_opt3")})')
+    parser.add_argument('--widths', type=parse_range, default=parse_range('4:24'), help='W range, lo:hi')
+    parser.add_argument('--integer-bits', type=parse_range, default=parse_range('-10:2'), help='I range, lo:hi')
+    parser.add_argument('--modes', nargs='+', choices=QUANTIZATION_MODES, default=list(DEFAULT_MODES),
+                        help='Quantization modes to sweep')
+    parser.add_argument('--signed-only', action='store_true', help='Skip ap_ufixed candidates')
+    parser.add_argument('--window-length', type=int, default=DEFAULT_WINDOW_LENGTH)
+    parser.add_argument('--inclusive', action='store_true',
+                        help='Use xcorr >= threshold (MATLAB/origin) instead of the HLS kernels\' >')
+    parser.add_argument('--min-margin', type=float, default=1.0,
+                        help='LSBs every reference peak must clear its threshold by')
+    parser.add_argument('--top', type=int, default=15, help='Passing candidates to print')
+    parser.add_argument('--output', default='word_length_sweep.txt', help='Full sweep table (TXT)')
+    args = parser.parse_args()
+    args.dir = args.dir or [os.path.join(here, 'perf_opt3')]
+    return args
+
+def main():
+    args = parse_arguments()
+    vectors = load_vectors(args.dir)
+    baseline = baseline_format(args.dir[0])
+    formats = candidate_formats(args.widths, args.integer_bits, args.modes,
+                                signedness=(True,) if args.signed_only else (True, False))
+
+    start = time.perf_counter()
+    evaluation = evaluate_candidates(vectors, formats, args.window_length, not args.inclusive)
+    elapsed = time.perf_counter() - start
+    evaluation['passed'] &= evaluation['margin_lsb'] >= args.min_margin
+    table = sweep_table(formats, evaluation, baseline, args.window_length)
+
+    with open(args.output, 'w') as f:
+        f.write(f"WORD-LENGTH SWEEP ({len(formats)} candidates, {len(vectors)} vector set(s), "
+                f"min margin {args.min_margin:g} LSB, baseline {baseline}):\n")
+        f.write(table.to_string(index=False))
+        f.write('\n')
+
+    passing = table[table['Passed']]
+    print(f"{len(formats)} candidates x {sum(len(v[0]) for v in vectors)} samples in {elapsed:.2f} s; "
+          f"{len(passing)} pass; full table written to {args.output}")
+    if passing.empty:
+        print("No candidate reproduces the reference locations.")
+        return 1
+    print(passing.head(args.top).to_string(index=False))
+    best = passing.iloc[0]
+    print(f"\nNarrowest: {best['Type']} - saves ~{best['LUT Saved']} LUT and {best['FF Saved']} FF "
+          f"against {baseline} (margin {best['Margin (LSB)']:.0f} LSB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())